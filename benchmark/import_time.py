@@ -0,0 +1,46 @@
+"""
+Measures the time for importing parts of this package, each in a fresh interpreter.
+
+Usage: python benchmark/import_time.py [number of runs]
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+root = Path(__file__).parent.parent
+
+statements = {'import super_scad_hole':  'import super_scad_hole',
+              'HoleAlignment':           'from super_scad_hole.HoleAlignment import HoleAlignment',
+              'HoleSimple':              'from super_scad_hole.HoleSimple import HoleSimple',
+              'HoleCountersunkSlotted':  'from super_scad_hole.HoleCountersunkSlotted import HoleCountersunkSlotted',
+              'all modules':             'from super_scad_hole import *',
+              'super_scad (baseline)':   'import super_scad.scad.ScadWidget'}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def measure(statement: str, runs: int) -> float:
+    """
+    Returns the median time in milliseconds of executing an import statement in a fresh interpreter.
+
+    :param statement: The import statement.
+    :param runs: The number of runs.
+    """
+    code = 'import time\n' \
+           'start = time.perf_counter()\n' \
+           f'{statement}\n' \
+           'print(time.perf_counter() - start)'
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+        times.append(1000.0 * float(output.stdout))
+
+    return statistics.median(times)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 11
+for name, statement in statements.items():
+    print(f'{name:<26} {measure(statement, runs):8.1f} ms')
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,90 @@
+"""
+Measures the memory footprint of holes with tracemalloc.
+
+Usage: python benchmark/memory.py [number of holes]
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleCounterboredSlotted import HoleCounterboredSlotted
+from super_scad_hole.HoleCounterdrilled import HoleCounterdrilled
+from super_scad_hole.HoleCounterdrilledSlotted import HoleCounterdrilledSlotted
+from super_scad_hole.HoleCountersunk import HoleCountersunk
+from super_scad_hole.HoleCountersunkSlotted import HoleCountersunkSlotted
+from super_scad_hole.HoleSimple import HoleSimple
+from super_scad_hole.HoleSimpleSlotted import HoleSimpleSlotted
+
+factories = {'HoleSimple':                lambda: HoleSimple(height=10.0,
+                                                             diameter=2.0,
+                                                             alignment=HoleAlignment.TOP),
+             'HoleCounterbored':          lambda: HoleCounterbored(height=10.0,
+                                                                   diameter=2.0,
+                                                                   counterbore_diameter=4.0,
+                                                                   counterbore_height=2.0,
+                                                                   alignment=HoleAlignment.TOP),
+             'HoleCountersunk':           lambda: HoleCountersunk(height=10.0,
+                                                                  diameter=2.0,
+                                                                  countersink_diameter=4.0,
+                                                                  alignment=HoleAlignment.TOP),
+             'HoleCounterdrilled':        lambda: HoleCounterdrilled(height=10.0,
+                                                                     diameter=2.0,
+                                                                     counterdrill_diameter=4.0,
+                                                                     counterdrill_height=1.0,
+                                                                     alignment=HoleAlignment.TOP),
+             'HoleSimpleSlotted':         lambda: HoleSimpleSlotted(height=10.0,
+                                                                    diameter=2.0,
+                                                                    center_to_center=3.0,
+                                                                    alignment=HoleAlignment.TOP),
+             'HoleCounterboredSlotted':   lambda: HoleCounterboredSlotted(height=10.0,
+                                                                          diameter=2.0,
+                                                                          counterbore_diameter=4.0,
+                                                                          counterbore_height=2.0,
+                                                                          center_to_center=3.0,
+                                                                          alignment=HoleAlignment.TOP),
+             'HoleCountersunkSlotted':    lambda: HoleCountersunkSlotted(height=10.0,
+                                                                         diameter=2.0,
+                                                                         countersink_diameter=4.0,
+                                                                         center_to_center=3.0,
+                                                                         alignment=HoleAlignment.TOP),
+             'HoleCounterdrilledSlotted': lambda: HoleCounterdrilledSlotted(height=10.0,
+                                                                            diameter=2.0,
+                                                                            counterdrill_diameter=4.0,
+                                                                            counterdrill_height=1.0,
+                                                                            center_to_center=3.0,
+                                                                            alignment=HoleAlignment.TOP)}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def measure(factory, count: int) -> float:
+    """
+    Returns the number of bytes per hole for a number of holes with their profiles resolved.
+
+    :param factory: The factory for creating a hole.
+    :param count: The number of holes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    holes = []
+    for _ in range(count):
+        hole = factory()
+        _ = hole.profile_top, hole.profile_bottom
+        holes.append(hole)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / count
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+for name, factory in factories.items():
+    print(f'{name:<26} {measure(factory, count):8.1f} bytes/hole')
+
+# ----------------------------------------------------------------------------------------------------------------------
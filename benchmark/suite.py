@@ -0,0 +1,204 @@
+"""
+Times the hot paths of all holes, i.e., the constructor, build(), and serialization by SuperSCAD, with rough profiles
+and with fillet and chamfer profiles, at several scales. Records the size of the generated OpenSCAD code and the number
+of emitted polygon points. The results are compared against a stored baseline.
+
+Usage: python benchmark/suite.py [--scales 1,1000,100000] [--timings] [--tolerance 0.25] [--save]
+
+Serialization is measured with at most 1000 holes, since the generated code grows linearly with the number of holes.
+The timings in the baseline are specific to the machine that stored the baseline; the sizes and point counts are not.
+Hence, by default only changes of the sizes and point counts are regressions. With --timings, timings slower than the
+baseline by more than the tolerance are regressions too, which is meaningful only on the machine that stored the
+baseline.
+"""
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from super_scad.boolean.Compound import Compound
+from super_scad.scad.Context import Context
+from super_scad.scad.Scad import Scad
+from super_scad.transformation.Translate3D import Translate3D
+from super_scad_smooth_profile.Rough import Rough
+from super_scad_smooth_profiles.Chamfer import Chamfer
+from super_scad_smooth_profiles.Fillet import Fillet
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleCounterboredSlotted import HoleCounterboredSlotted
+from super_scad_hole.HoleCounterdrilled import HoleCounterdrilled
+from super_scad_hole.HoleCounterdrilledSlotted import HoleCounterdrilledSlotted
+from super_scad_hole.HoleCountersunk import HoleCountersunk
+from super_scad_hole.HoleCountersunkSlotted import HoleCountersunkSlotted
+from super_scad_hole.HoleSimple import HoleSimple
+from super_scad_hole.HoleSimpleSlotted import HoleSimpleSlotted
+
+baseline_path = Path(__file__).parent / 'baseline.json'
+
+max_serialize = 1000
+
+holes = {'HoleSimple':                (HoleSimple, {}),
+         'HoleCounterbored':          (HoleCounterbored, {'counterbore_diameter': 4.0, 'counterbore_height': 2.0}),
+         'HoleCountersunk':           (HoleCountersunk, {'countersink_diameter': 4.0}),
+         'HoleCounterdrilled':        (HoleCounterdrilled, {'counterdrill_diameter': 4.0, 'counterdrill_height': 1.0}),
+         'HoleSimpleSlotted':         (HoleSimpleSlotted, {'center_to_center': 3.0}),
+         'HoleCounterboredSlotted':   (HoleCounterboredSlotted, {'counterbore_diameter': 4.0,
+                                                                 'counterbore_height': 2.0,
+                                                                 'center_to_center': 3.0}),
+         'HoleCountersunkSlotted':    (HoleCountersunkSlotted, {'countersink_diameter': 4.0,
+                                                                'center_to_center': 3.0}),
+         'HoleCounterdrilledSlotted': (HoleCounterdrilledSlotted, {'counterdrill_diameter': 4.0,
+                                                                   'counterdrill_height': 1.0,
+                                                                   'center_to_center': 3.0})}
+
+profiles = {'rough':   lambda: {'profile_top': Rough(), 'profile_bottom': Rough()},
+            'profile': lambda: {'profile_top': Fillet(radius=0.5, side=2),
+                                'profile_bottom': Chamfer(skew_length=0.2, side=1)}}
+
+point_pattern = re.compile(r'\[-?\d+(?:\.\d+)?, -?\d+(?:\.\d+)?(?:, -?\d+(?:\.\d+)?)?\]')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def timed(function: Callable[[], Any]) -> tuple[float, Any]:
+    """
+    Returns the time in seconds of calling a function and its result.
+
+    :param function: The function.
+    """
+    start = time.perf_counter()
+    result = function()
+
+    return time.perf_counter() - start, result
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def count_points(code: str) -> int:
+    """
+    Returns the number of points of all polygons and polyhedrons in OpenSCAD code.
+
+    :param code: The OpenSCAD code.
+    """
+    count = 0
+    for line in code.splitlines():
+        if 'polygon(' in line or 'polyhedron(' in line:
+            count += len(point_pattern.findall(line))
+
+    return count
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def measure(hole_class: type, arguments: Dict[str, Any], profile: Callable[[], Dict], scale: int) -> Dict[str, Any]:
+    """
+    Returns the timings, the size of the generated code, and the number of polygon points for a number of holes.
+
+    :param hole_class: The class of the holes.
+    :param arguments: The arguments specific to the class of the holes.
+    :param profile: The factory for the profiles of the holes.
+    :param scale: The number of holes.
+    """
+    context = Context(fn=60, eps=0.1)
+
+    construct, instances = timed(lambda: [hole_class(height=10.0,
+                                                     diameter=2.0,
+                                                     alignment=HoleAlignment.TOP,
+                                                     **arguments,
+                                                     **profile()) for _ in range(scale)])
+
+    # All instances are identical, hence, the build cache is disabled to time building each hole.
+    with HoleBuildCache.scope(max_size=0):
+        build, _ = timed(lambda: [hole.build(context) for hole in instances])
+
+    count = min(scale, max_serialize)
+    root = Compound(children=[Translate3D(x=5.0 * index, child=hole) for index, hole in enumerate(instances[:count])])
+    with HoleBuildCache.scope(max_size=0), tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'benchmark.scad'
+        serialize, _ = timed(lambda: Scad(context=context).run_super_scad(root, path))
+        code = path.read_text()
+
+    return {'construct': round(construct, 6),
+            'build': round(build, 6),
+            'serialize': round(serialize, 6),
+            'serialized': count,
+            'bytes': len(code.encode()),
+            'points': count_points(code)}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def compare(results: Dict[str, Dict[str, Any]],
+            baseline: Dict[str, Dict[str, Any]],
+            timings: bool,
+            tolerance: float) -> int:
+    """
+    Prints the results compared against the baseline and returns the number of regressions.
+
+    :param results: The results.
+    :param baseline: The baseline.
+    :param timings: Whether to compare the timings too.
+    :param tolerance: The relative tolerance of timings.
+    """
+    regressions = 0
+    for key, result in results.items():
+        expected = baseline.get(key)
+        remarks = []
+        if expected is None:
+            remarks.append('no baseline')
+        else:
+            for metric in ('construct', 'build', 'serialize') if timings else ():
+                if result[metric] > expected[metric] * (1.0 + tolerance) and result[metric] - expected[metric] > 1e-3:
+                    remarks.append(f'{metric} {result[metric] / expected[metric]:.2f}x slower')
+            for metric in ('bytes', 'points'):
+                if result[metric] != expected[metric]:
+                    remarks.append(f'{metric} {expected[metric]} -> {result[metric]}')
+            regressions += len(remarks)
+
+        print(f'{key:<44} {result["construct"]:9.4f} s {result["build"]:9.4f} s {result["serialize"]:9.4f} s '
+              f'{result["bytes"]:9d} B {result["points"]:7d} pts  {", ".join(remarks)}')
+
+    return regressions
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    """
+    Runs the benchmarks and returns the exit status.
+    """
+    parser = argparse.ArgumentParser(description='Benchmarks the hot paths of holes.')
+    parser.add_argument('--scales', default='1,1000,100000', help='comma separated numbers of holes')
+    parser.add_argument('--timings',
+                        action='store_true',
+                        help='compare the timings too, only meaningful on the machine that stored the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='relative tolerance of timings')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    results = {}
+    for scale in (int(scale) for scale in args.scales.split(',')):
+        for hole_name, (hole_class, arguments) in holes.items():
+            for profile_name, profile in profiles.items():
+                results[f'{hole_name}/{profile_name}/{scale}'] = measure(hole_class, arguments, profile, scale)
+
+    print(f'{"benchmark":<44} {"construct":>11} {"build":>11} {"serialize":>11} {"size":>11} {"points":>11}')
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    regressions = compare(results, baseline, args.timings, args.tolerance)
+
+    if args.save:
+        baseline.update(results)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+        return 0
+
+    return 1 if regressions else 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    sys.exit(main())
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -1,12 +1,25 @@
+import abc
+import copy
+import math
 from abc import ABC
 from typing import Any, Dict
 
+from super_scad.boolean.Union import Union
 from super_scad.scad.ArgumentValidator import ArgumentValidator
+from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
 from super_scad_smooth_profile.Rough import Rough
 from super_scad_smooth_profile.SmoothProfile3D import SmoothProfile3D
 
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
+from super_scad_hole.HoleCost import HoleCost
+from super_scad_hole.HoleDetailPolicy import HoleDetailPolicy
+from super_scad_hole.HoleFacetBudget import HoleFacetBudget
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
+from super_scad_hole.HoleSpec import HoleSpec
+from super_scad_hole.private.PrivateIf import PrivateIf
 
 
 class Hole(ScadWidget, ABC):
@@ -14,6 +27,11 @@ class Hole(ScadWidget, ABC):
     Abstract parent widget for holes.
     """
 
+    __rough: Rough = Rough()
+    """
+    The rough profile shared by all holes without a top or a bottom profile.
+    """
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self,
                  *,
@@ -26,7 +44,12 @@ class Hole(ScadWidget, ABC):
                  fa: float | None,
                  fs: float | None,
                  fn: int | None,
-                 fn4n: bool | None):
+                 fn4n: bool | None,
+                 max_deviation: float | None,
+                 polyhedron: bool,
+                 segmented: bool,
+                 convexity: int | None,
+                 detail: HoleDetail | None):
         """
         Object constructor.
 
@@ -40,6 +63,15 @@ class Hole(ScadWidget, ABC):
         :param fs: The minimum circumferential length of each fragment.
         :param fn: The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
         :param fn4n: Whether to create a hole with a multiple of 4 vertices.
+        :param max_deviation: The maximum deviation between the true circle and its facets. Overrides fa, fs, and
+                              fn. With fn4n, the number of fragments is rounded up to a multiple of 4.
+        :param polyhedron: Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        :param segmented: Whether to create each section of a hole without profiles with its own number of
+                          fragments, scaled to the radius of the section.
+        :param convexity: The convexity of the extrusions of the hole. None for the minimal convexity computed from
+                          the cross-section of the hole.
+        :param detail: The level of detail of the hole. None for the level of detail of the policy, see
+                       HoleDetailPolicy.
         """
         ScadWidget.__init__(self)
 
@@ -93,7 +125,43 @@ class Hole(ScadWidget, ABC):
         Whether to create a hole with a multiple of 4 vertices.
         """
 
-        self.__validate_arguments(locals())
+        self._max_deviation: float | None = max_deviation
+        """
+        The maximum deviation between the true circle and its facets.
+        """
+
+        self._polyhedron: bool = polyhedron
+        """
+        Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        """
+
+        self._segmented: bool = segmented
+        """
+        Whether to create each section of a hole without profiles with its own number of fragments.
+        """
+
+        self._convexity: int | None = convexity
+        """
+        The convexity of the extrusions of the hole.
+        """
+
+        self._detail: HoleDetail | None = detail
+        """
+        The level of detail of the hole.
+        """
+
+        self._spec: HoleSpec | None = None
+        """
+        The immutable and hashable specification of the hole.
+        """
+
+        self._origin: Hole | None = None
+        """
+        The hole from which this hole is derived, e.g., with the number of fragments planned by a facet budget or in
+        coarse detail, or None if this hole is not derived.
+        """
+
+        HoleInstrumentation.call(self, 'validate', self.__validate_arguments, locals())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -105,6 +173,15 @@ class Hole(ScadWidget, ABC):
         """
         validator = ArgumentValidator(args)
         validator.validate_exclusive({'fn4n'}, {'fa', 'fs', 'fn'})
+        validator.validate_exclusive({'max_deviation'}, {'fa', 'fs', 'fn'})
+
+        max_deviation = args.get('max_deviation')
+        if max_deviation is not None and not max_deviation > 0.0:
+            raise ValueError(f'Maximum deviation must be positive, got {max_deviation}.')
+
+        convexity = args.get('convexity')
+        if convexity is not None and not convexity >= 1:
+            raise ValueError(f'Convexity must be at least 1, got {convexity}.')
 
     # ------------------------------------------------------------------------------------------------------------------
     @property
@@ -114,6 +191,58 @@ class Hole(ScadWidget, ABC):
         """
         return self._alignment
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    @abc.abstractmethod
+    def outer_radius(self) -> float:
+        """
+        Returns the nominal outer radius of the hole, i.e., the largest radius of the hole as given by its dimensions,
+        measured from the center of the hole. The overhangs of the profiles and the extensions by eps are not included,
+        see bounding_box() for the true extent of the hole.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def spec(self) -> HoleSpec:
+        """
+        Returns the immutable and hashable specification of this hole. The specification is created on first access
+        only.
+        """
+        if self._spec is None:
+            self._spec = self._create_spec()
+
+        return self._spec
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _create_spec(self) -> HoleSpec:
+        """
+        Returns the immutable and hashable specification of this hole.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _spec_args(self) -> Dict[str, Any]:
+        """
+        Returns the arguments for the specification of this hole common to all holes.
+        """
+        return {'alignment': self.alignment,
+                'profile_top': self.profile_top,
+                'profile_bottom': self.profile_bottom,
+                'extend_by_eps_top': self.extend_by_eps_top,
+                'extend_by_eps_bottom': self.extend_by_eps_bottom,
+                'extend_by_eps_boundary': self.extend_by_eps_boundary,
+                'fa': self.fa,
+                'fs': self.fs,
+                'fn': self.fn,
+                'fn4n': self.fn4n,
+                'max_deviation': self.max_deviation,
+                'polyhedron': self.polyhedron,
+                'segmented': self.segmented,
+                'convexity': self.convexity,
+                'detail': self.detail}
+
     # ------------------------------------------------------------------------------------------------------------------
     @property
     def profile_top(self) -> SmoothProfile3D:
@@ -121,7 +250,8 @@ class Hole(ScadWidget, ABC):
         Returns the profile of the top of the extruded object.
         """
         if self._profile_top is None:
-            self._profile_top = Rough()
+            HoleInstrumentation.count(self._instrumented, 'profile_top')
+            self._profile_top = Hole.__rough
 
         return self._profile_top
 
@@ -132,7 +262,8 @@ class Hole(ScadWidget, ABC):
         Returns the profile of the bottom of the extruded object.
         """
         if self._profile_bottom is None:
-            self._profile_bottom = Rough()
+            HoleInstrumentation.count(self._instrumented, 'profile_bottom')
+            self._profile_bottom = Hole.__rough
 
         return self._profile_bottom
 
@@ -192,4 +323,247 @@ class Hole(ScadWidget, ABC):
         """
         return self._fn4n
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def max_deviation(self) -> float | None:
+        """
+        Returns the maximum deviation between the true circle and its facets.
+        """
+        return self._max_deviation
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def polyhedron(self) -> bool:
+        """
+        Returns whether to create the hole as an explicit polyhedron instead of by extrusions.
+        """
+        return self._polyhedron
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def segmented(self) -> bool:
+        """
+        Returns whether to create each section of a hole without profiles with its own number of fragments.
+        """
+        return self._segmented
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def convexity(self) -> int | None:
+        """
+        Returns the convexity of the extrusions of the hole. None for the minimal convexity computed from the
+        cross-section of the hole.
+        """
+        return self._convexity
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def detail(self) -> HoleDetail | None:
+        """
+        Returns the level of detail of the hole. None for the level of detail of the policy, see HoleDetailPolicy.
+        """
+        return self._detail
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole, i.e., the number of fragments, the number of vertices of the
+        profile, the number of triangles, and the number of OpenSCAD nodes, computed without building this hole. The
+        estimate is for this hole as built, i.e., at the level of detail of this hole and with the planned number of
+        fragments of a facet budget. In preview detail, the estimate covers both the coarse and the full hole.
+
+        :param context: The build context.
+        """
+        fn = self.__planned_fn()
+        if fn is not None:
+            return self._copy_with_fn(fn).estimate_cost(context)
+
+        detail = self.__real_detail()
+        if detail == HoleDetail.FULL:
+            return self._estimate_cost(context)
+
+        coarse = self.__coarse_copy(context)._estimate_cost(context)
+        if detail == HoleDetail.COARSE:
+            return coarse
+
+        # A union of two if statements with the coarse and the full hole.
+        full = self._estimate_cost(context)
+
+        return HoleCost(fragments=max(coarse.fragments, full.fragments),
+                        vertices=coarse.vertices + full.vertices,
+                        facets=coarse.facets + full.facets,
+                        nodes=coarse.nodes + full.nodes + 3)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole in full detail, computed without building this hole.
+
+        :param context: The build context.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _build(self, context: Context) -> ScadWidget:
+        """
+        Builds a SuperSCAD widget.
+
+        :param context: The build context.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _max_deviation_fn(self, radius: float) -> int:
+        """
+        Returns the smallest number of fragments in 360 degrees such that the maximum deviation between a circle and
+        its facets (i.e., the sagitta of a fragment) is not greater than the maximum deviation of this hole. With fn4n,
+        the number of fragments is rounded up to a multiple of 4.
+
+        :param radius: The radius of the circle.
+        """
+        if self.max_deviation >= radius:
+            fn = 3
+        else:
+            fn = max(3, int(math.ceil(math.pi / math.acos(1.0 - self.max_deviation / radius) - 1e-9)))
+
+        if self.fn4n:
+            fn = int(math.floor((fn + 3) / 4) * 4)
+
+        return fn
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def _instrumented(self) -> 'Hole':
+        """
+        Returns the hole to which the instrumentation attributes the stages and lazy derived properties of this hole,
+        i.e., the hole from which this hole is derived, if any, see HoleInstrumentation.
+        """
+        return self if self._origin is None else self._origin
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _copy_with_fn(self, fn: int) -> 'Hole':
+        """
+        Returns a copy of this hole with a fixed number of fragments in 360 degrees.
+
+        :param fn: The fixed number of fragments in 360 degrees.
+        """
+        hole = copy.copy(self)
+        hole._spec = None
+        hole._fa = None
+        hole._fs = None
+        hole._fn = fn
+        hole._fn4n = None
+        hole._max_deviation = None
+        hole._origin = self._instrumented
+
+        return hole
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __planned_fn(self) -> int | None:
+        """
+        Returns the number of fragments in 360 degrees planned for this hole by a facet budget, see HoleFacetBudget.
+        Returns None if this hole is not planned or already has the planned number of fragments.
+        """
+        fn = HoleFacetBudget.fn(self)
+        if fn is not None and (fn != self.fn or self.fn4n or self.max_deviation is not None):
+            return fn
+
+        return None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __real_detail(self) -> HoleDetail:
+        """
+        Returns the level of detail of this hole, or of the policy if this hole has no level of detail of its own.
+        """
+        return HoleDetailPolicy.detail if self.detail is None else self.detail
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _rendered_copy(self, context: Context) -> 'Hole':
+        """
+        Returns this hole as rendered by OpenSCAD, i.e., with the number of fragments planned by a facet budget and,
+        in coarse detail, in coarse detail. In preview detail, OpenSCAD renders the hole in full detail. Returns this
+        hole itself if this hole is rendered as is.
+
+        :param context: The build context.
+        """
+        fn = self.__planned_fn()
+        if fn is not None:
+            return self._copy_with_fn(fn)._rendered_copy(context)
+
+        if self.__real_detail() == HoleDetail.COARSE:
+            return self.__coarse_copy(context)
+
+        return self
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __coarse_copy(self, context: Context) -> 'Hole':
+        """
+        Returns a copy of this hole in coarse detail, see HoleDetailPolicy.
+
+        :param context: The build context.
+        """
+        # The number of fragments the hole really gets in full detail, also when the number of fragments follows from
+        # $fa and $fs, such that coarse detail is never finer than full detail. As in full detail, the number of
+        # fragments follows from the largest radius of the profile, i.e., without the slot of a slotted hole.
+        radius = max(node.x for node in self._create_profile_nodes(context))
+        fn = self._real_fragments(context, radius)
+
+        hole = self._copy_with_fn(min(fn, HoleDetailPolicy.coarse_fn))
+        # The copy is the coarse hole itself, i.e., the copy is built and rendered as is.
+        hole._detail = HoleDetail.FULL
+        if not HoleDetailPolicy.coarse_profiles:
+            hole._profile_top = None
+            hole._profile_bottom = None
+
+        return hole
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build_coarse(self, context: Context) -> ScadWidget:
+        """
+        Builds a SuperSCAD widget of this hole in coarse detail, see HoleDetailPolicy.
+
+        :param context: The build context.
+        """
+        return self.__coarse_copy(context)._build(context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self, context: Context) -> ScadWidget:
+        """
+        Builds a SuperSCAD widget. Identical holes are built only once, see HoleBuildCache. Holes planned by a facet
+        budget are built with their planned number of fragments, see HoleFacetBudget. The build is instrumented, see
+        HoleInstrumentation.
+
+        :param context: The build context.
+        """
+        fn = self.__planned_fn()
+        if fn is not None:
+            return self._copy_with_fn(fn).build(context)
+
+        return HoleInstrumentation.call(self._instrumented, 'build', self.__build_cached, context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __build_cached(self, context: Context) -> ScadWidget:
+        """
+        Builds a SuperSCAD widget at the level of detail of this hole or returns the cached widget of an identical
+        hole.
+
+        :param context: The build context.
+        """
+        key = HoleBuildCache.key(self, context)
+        widget = HoleBuildCache.get(key)
+        if widget is None:
+            detail = self.__real_detail()
+            if detail == HoleDetail.FULL:
+                widget = self._build(context)
+            elif detail == HoleDetail.COARSE:
+                widget = self._build_coarse(context)
+            else:
+                widget = Union(children=[PrivateIf(condition='$preview', child=self._build_coarse(context)),
+                                         PrivateIf(condition='!$preview', child=self._build(context))])
+            HoleBuildCache.put(key, widget)
+
+        return widget
+
 # ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,121 @@
+from typing import Any, Dict, List
+
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+from super_scad.type import Vector2, Vector3
+
+from super_scad_hole.Hole import Hole
+from super_scad_hole.private.PrivateExpressionCommand import PrivateExpressionCommand
+from super_scad_hole.private.PrivateFor import PrivateFor
+
+
+class HoleArray(ScadWidget):
+    """
+    Widget for creating the same hole at multiple positions. The hole is emitted only once in a for-loop over the
+    positions.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 *,
+                 hole: Hole,
+                 positions: List[Vector2 | Vector3],
+                 angles: List[float | Vector3] | None = None):
+        """
+        Object constructor.
+
+        :param hole: The hole.
+        :param positions: The positions of the holes.
+        :param angles: The angles of rotation of the holes. An angle given as a float is a rotation around the z-axis.
+        """
+        ScadWidget.__init__(self)
+
+        self._hole: Hole = hole
+        """
+        The hole.
+        """
+
+        self._positions: List[Vector2 | Vector3] = positions
+        """
+        The positions of the holes.
+        """
+
+        self._angles: List[float | Vector3] | None = angles
+        """
+        The angles of rotation of the holes.
+        """
+
+        self.__validate_arguments(locals())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __validate_arguments(args: Dict[str, Any]) -> None:
+        """
+        Validates the arguments supplied to the constructor of this SuperSCAD widget.
+
+        :param args: The arguments supplied to the constructor.
+        """
+        if args['angles'] is not None and len(args['angles']) != len(args['positions']):
+            raise ValueError('The number of angles must be equal to the number of positions.')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def hole(self) -> Hole:
+        """
+        Returns the hole.
+        """
+        return self._hole
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def positions(self) -> List[Vector3]:
+        """
+        Returns the positions of the holes.
+        """
+        return [Vector3(position.x, position.y, 0.0) if isinstance(position, Vector2) else position
+                for position in self._positions]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def angles(self) -> List[Vector3] | None:
+        """
+        Returns the angles of rotation of the holes.
+        """
+        if self._angles is None:
+            return None
+
+        return [angle if isinstance(angle, Vector3) else Vector3(0.0, 0.0, angle) for angle in self._angles]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def volume(self, context: Context, faceted: bool = False) -> float:
+        """
+        Returns the total volume of all holes in this array.
+
+        :param context: The build context.
+        :param faceted: Whether to return the faceted volume instead of the exact volume.
+        """
+        return len(self.positions) * self.hole.volume(context, faceted)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self, context: Context) -> ScadWidget:
+        """
+        Builds a SuperSCAD widget.
+
+        :param context: The build context.
+        """
+        angles = self.angles
+        if angles is None:
+            holes = PrivateExpressionCommand(command='translate', expressions={'v': 'v'}, child=self.hole)
+            holes = PrivateFor(variable='v', values=self.positions, is_length=True, child=holes)
+        else:
+            holes = PrivateExpressionCommand(command='rotate', expressions={'a': 'p[1]'}, child=self.hole)
+            holes = PrivateExpressionCommand(command='translate', expressions={'v': 'p[0]'}, child=holes)
+            holes = PrivateFor(variable='p',
+                               values=list(zip(self.positions, angles)),
+                               is_angle=(False, True),
+                               is_length=(True, False),
+                               child=holes)
+
+        return holes
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,319 @@
+from typing import Any, Dict, List
+
+import numpy as np
+from super_scad.boolean.Compound import Compound
+from super_scad.boolean.Empty import Empty
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+from super_scad.type import Vector2, Vector3
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleArray import HoleArray
+
+
+class HoleBatch(ScadWidget):
+    """
+    Widget for creating many holes of one class given their arguments as columns. Each argument is either a scalar
+    that applies to all holes or a column (a list, tuple, or NumPy array) with one value per hole. All rows are
+    validated at once. Each distinct hole is created only once and emitted in a hole array over its positions.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, *, hole_class: type, positions: Any, arguments: Dict[str, Any]):
+        """
+        Object constructor.
+
+        :param hole_class: The class of the holes.
+        :param positions: The positions of the holes, either a list of vectors or an array with one row per hole.
+        :param arguments: The arguments for the constructor of the class of the holes, given as scalars or columns.
+        """
+        ScadWidget.__init__(self)
+
+        self._hole_class: type = hole_class
+        """
+        The class of the holes.
+        """
+
+        self._positions: np.ndarray = HoleBatch.__positions_to_array(positions)
+        """
+        The positions of the holes with one row per hole.
+        """
+
+        self._columns: Dict[str, Any] = {}
+        """
+        The arguments given as columns.
+        """
+
+        self._scalars: Dict[str, Any] = {}
+        """
+        The arguments given as scalars.
+        """
+
+        for name, value in arguments.items():
+            if isinstance(value, (list, tuple, np.ndarray)):
+                self._columns[name] = value
+            else:
+                self._scalars[name] = value
+
+        self._holes: List[ScadWidget] | None = None
+        """
+        The distinct holes.
+        """
+
+        self._groups: np.ndarray | None = None
+        """
+        The index of the distinct hole of each row.
+        """
+
+        self.__validate_arguments()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __positions_to_array(positions: Any) -> np.ndarray:
+        """
+        Returns the positions of the holes as an array with three columns.
+
+        :param positions: The positions of the holes.
+        """
+        if len(positions) > 0 and isinstance(positions[0], (Vector2, Vector3)):
+            positions = [(position.x, position.y, getattr(position, 'z', 0.0)) for position in positions]
+
+        if len(positions) == 0:
+            return np.empty((0, 3))
+
+        positions = np.asarray(positions, dtype=float).reshape(len(positions), -1)
+        if positions.shape[1] == 2:
+            positions = np.column_stack((positions, np.zeros(len(positions))))
+
+        return positions
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __is_dimension(name: str) -> bool:
+        """
+        Returns whether an argument is a dimension of a hole, i.e., a length or an angle.
+
+        :param name: The name of the argument.
+        """
+        return name in ('height', 'radius', 'diameter', 'center_to_center', 'overall_length', 'max_deviation') or \
+            name.endswith(('_radius', '_diameter', '_height', '_angle'))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __given(self, name: str) -> np.ndarray:
+        """
+        Returns whether an argument is given (i.e., not None) for each hole.
+
+        :param name: The name of the argument.
+        """
+        size = len(self._positions)
+        if name in self._columns:
+            return np.array([value is not None for value in self._columns[name]], dtype=bool)
+
+        return np.full(size, self._scalars.get(name) is not None)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __dimension_values(self) -> Dict[str, np.ndarray]:
+        """
+        Returns all dimensions as arrays with one value per hole. Dimensions that are not given are NaN.
+        """
+        size = len(self._positions)
+        values = {}
+        for name, value in self._columns.items():
+            if HoleBatch.__is_dimension(name):
+                values[name] = np.array([np.nan if element is None else element for element in value], dtype=float)
+        for name, value in self._scalars.items():
+            if HoleBatch.__is_dimension(name) and value is not None:
+                values[name] = np.full(size, float(value))
+
+        return values
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __validate_arguments(self) -> None:
+        """
+        Validates the rows of this batch in one pass and reports all invalid rows at once.
+        """
+        size = len(self._positions)
+        for name, column in self._columns.items():
+            if len(column) != size:
+                raise ValueError(f'Column {name} has {len(column)} rows, expected {size}.')
+
+        values = self.__dimension_values()
+        checks = []
+        for name, value in values.items():
+            given = ~np.isnan(value)
+            if 'angle' in name:
+                checks.append((given & ~((value > 0.0) & (value < 180.0)), f'{name} must be between 0 and 180'))
+            else:
+                checks.append((given & ~((value > 0.0) & np.isfinite(value)), f'{name} must be positive'))
+
+        # The same exclusive arguments as validated by the constructors of the holes.
+        names = set(self._columns) | set(self._scalars)
+        for group1, group2 in (({'radius'}, {'diameter'}),
+                               ({'counterbore_radius'}, {'counterbore_diameter'}),
+                               ({'countersink_radius'}, {'countersink_diameter'}),
+                               ({'counterdrill_radius'}, {'counterdrill_diameter'}),
+                               ({'center_to_center'}, {'overall_length'}),
+                               ({'fn4n'}, {'fa', 'fs', 'fn'}),
+                               ({'max_deviation'}, {'fa', 'fs', 'fn'})):
+            if names & group1 and names & group2:
+                given1 = np.any([self.__given(name) for name in sorted(names & group1)], axis=0)
+                given2 = np.any([self.__given(name) for name in sorted(names & group2)], axis=0)
+                checks.append((given1 & given2,
+                               f'{" or ".join(sorted(names & group1))} and {" or ".join(sorted(names & group2))} '
+                               'are exclusive'))
+
+        nan = np.full(size, np.nan)
+        inner_radius = np.fmax(values.get('radius', nan), 0.5 * values.get('diameter', nan))
+        for prefix in ('counterbore', 'countersink', 'counterdrill'):
+            outer_radius = np.fmax(values.get(f'{prefix}_radius', nan), 0.5 * values.get(f'{prefix}_diameter', nan))
+            checks.append((outer_radius <= inner_radius, f'{prefix} radius must be greater than radius'))
+            if f'{prefix}_height' in values and 'height' in values:
+                checks.append((values[f'{prefix}_height'] >= values['height'],
+                               f'{prefix}_height must be less than height'))
+
+        invalid = np.zeros(size, dtype=bool)
+        for failed, _ in checks:
+            invalid |= failed
+
+        if invalid.any():
+            messages = []
+            for row in np.flatnonzero(invalid):
+                reasons = [message for failed, message in checks if failed[row]]
+                messages.append(f'Row {row}: {", ".join(reasons)}.')
+            raise ValueError('Invalid rows in batch of {}:\n{}'.format(self._hole_class.__name__, '\n'.join(messages)))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __column_codes(self, name: str) -> np.ndarray:
+        """
+        Returns for each hole a code of the value of a column, such that holes with equal values have equal codes.
+
+        :param name: The name of the column.
+        """
+        column = self._columns[name]
+        if HoleBatch.__is_dimension(name):
+            values = np.array([np.nan if element is None else element for element in column], dtype=float)
+            _, codes = np.unique(values, return_inverse=True)
+
+            return codes.reshape(-1)
+
+        codes: Dict[Any, int] = {}
+        keys = [HoleBatch.__column_key(value) for value in column]
+        for key in keys:
+            codes.setdefault(key, len(codes))
+
+        return np.array([codes[key] for key in keys], dtype=int)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __column_key(value: Any) -> Any:
+        """
+        Returns a hashable key of a value in a column. Unhashable values are distinguished by their identity.
+
+        :param value: The value.
+        """
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return id(value)
+
+        return key
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __create_holes(self) -> None:
+        """
+        Creates the distinct holes of this batch.
+        """
+        if self.size == 0:
+            self._holes = []
+            self._groups = np.empty(0, dtype=int)
+            return
+
+        names = list(self._columns)
+        keys = np.zeros((len(self._positions), len(names)), dtype=int)
+        for index, name in enumerate(names):
+            keys[:, index] = self.__column_codes(name)
+
+        _, first_rows, groups = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+        # Number the distinct holes in the order of their first occurrence.
+        order = np.argsort(first_rows)
+        ranks = np.empty_like(order)
+        ranks[order] = np.arange(len(order))
+        self._groups = ranks[groups.reshape(-1)]
+
+        self._holes = []
+        for row in first_rows[order]:
+            arguments = dict(self._scalars)
+            for name in names:
+                value = self._columns[name][row]
+                if isinstance(value, np.generic):
+                    value = value.item()
+                if HoleBatch.__is_dimension(name) and value is not None:
+                    value = float(value)
+                arguments[name] = value
+            self._holes.append(self._hole_class(**arguments))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of holes in this batch.
+        """
+        return len(self._positions)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def holes(self) -> List[ScadWidget]:
+        """
+        Returns the distinct holes of this batch.
+        """
+        if self._holes is None:
+            self.__create_holes()
+
+        return self._holes
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def volumes(self, context: Context, faceted: bool = False) -> np.ndarray:
+        """
+        Returns the volume of each hole in this batch, see HoleRotationMixin.volume(). The volume of each distinct hole
+        is computed only once.
+
+        :param context: The build context.
+        :param faceted: Whether to return the faceted volumes instead of the exact volumes.
+        """
+        volumes = np.array([hole.volume(context, faceted) for hole in self.holes], dtype=float)
+
+        return volumes[self._groups]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def volume(self, context: Context, faceted: bool = False) -> float:
+        """
+        Returns the total volume of all holes in this batch.
+
+        :param context: The build context.
+        :param faceted: Whether to return the faceted volume instead of the exact volume.
+        """
+        return float(self.volumes(context, faceted).sum())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self, context: Context) -> ScadWidget:
+        """
+        Builds a SuperSCAD widget.
+
+        :param context: The build context.
+        """
+        arrays = []
+        for index, hole in enumerate(self.holes):
+            positions = [Vector3(x, y, z) for x, y, z in self._positions[self._groups == index].tolist()]
+            arrays.append(HoleArray(hole=hole, positions=positions))
+
+        if not arrays:
+            return Empty()
+
+        if len(arrays) == 1:
+            return arrays[0]
+
+        return Compound(children=arrays)
+
+# ----------------------------------------------------------------------------------------------------------------------
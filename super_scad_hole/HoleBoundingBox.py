@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+
+from super_scad.type import Vector3
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HoleBoundingBox:
+    """
+    An axis aligned bounding box of a hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    minimum: Vector3
+    """
+    The corner of the bounding box with the minimal coordinates.
+    """
+
+    maximum: Vector3
+    """
+    The corner of the bounding box with the maximal coordinates.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def size(self) -> Vector3:
+        """
+        Returns the size of the bounding box along each axis.
+        """
+        return self.maximum - self.minimum
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def center(self) -> Vector3:
+        """
+        Returns the center of the bounding box.
+        """
+        return Vector3(0.5 * (self.minimum.x + self.maximum.x),
+                       0.5 * (self.minimum.y + self.maximum.y),
+                       0.5 * (self.minimum.z + self.maximum.z))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def translate(self, vector: Vector3) -> 'HoleBoundingBox':
+        """
+        Returns this bounding box translated by a vector.
+
+        :param vector: The vector.
+        """
+        return HoleBoundingBox(minimum=self.minimum + vector, maximum=self.maximum + vector)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def intersects(self, other: 'HoleBoundingBox') -> bool:
+        """
+        Returns whether this bounding box and another bounding box intersect. Bounding boxes that only touch do not
+        intersect.
+
+        :param other: The other bounding box.
+        """
+        return self.minimum.x < other.maximum.x and other.minimum.x < self.maximum.x and \
+            self.minimum.y < other.maximum.y and other.minimum.y < self.maximum.y and \
+            self.minimum.z < other.maximum.z and other.minimum.z < self.maximum.z
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterator, Tuple
+
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+
+from super_scad_hole.HoleDetailPolicy import HoleDetailPolicy
+
+
+class HoleBuildCache:
+    """
+    A bounded LRU cache of the widgets built by holes. Identical holes, i.e., holes of the same class with the same
+    parameters and profiles built under the same relevant context values, are built only once.
+    """
+
+    max_size: int = 256
+    """
+    The maximum number of widgets in the cache. A maximum of 0 disables the cache.
+    """
+
+    __widgets: OrderedDict[Hashable, ScadWidget] = OrderedDict()
+    """
+    The cached widgets, from least to most recently used.
+    """
+
+    __hits: int = 0
+    """
+    The number of cache hits.
+    """
+
+    __misses: int = 0
+    """
+    The number of cache misses.
+    """
+
+    __evictions: int = 0
+    """
+    The number of widgets evicted from the cache.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def key(hole: ScadWidget, context: Context) -> Tuple:
+        """
+        Returns the fingerprint of a hole under a build context. The fingerprint consists of the specification of the
+        hole (i.e., the class, dimensions, alignment, profiles, eps flags, and fa/fs/fn/fn4n of the hole), the context
+        values that affect building the hole, and the level of detail policy.
+
+        :param hole: The hole.
+        :param context: The build context.
+        """
+        return (hole.spec,
+                hole.unit,
+                Context.get_unit_length_current(),
+                context.eps,
+                context.delta,
+                context.fa,
+                context.fs,
+                context.fn,
+                context.angle_digits,
+                context.length_digits,
+                context.scale_digits,
+                HoleDetailPolicy.detail,
+                HoleDetailPolicy.coarse_fn,
+                HoleDetailPolicy.coarse_profiles)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def get(key: Hashable) -> ScadWidget | None:
+        """
+        Returns the cached widget given its key. Returns None if the widget is not in the cache.
+
+        :param key: The key of the widget.
+        """
+        widget = HoleBuildCache.__widgets.get(key)
+        if widget is None:
+            HoleBuildCache.__misses += 1
+        else:
+            HoleBuildCache.__hits += 1
+            HoleBuildCache.__widgets.move_to_end(key)
+
+        return widget
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def put(key: Hashable, widget: ScadWidget) -> None:
+        """
+        Adds a widget to the cache. If the cache is full, the least recently used widgets are evicted.
+
+        :param key: The key of the widget.
+        :param widget: The widget.
+        """
+        if HoleBuildCache.max_size <= 0:
+            return
+
+        HoleBuildCache.__widgets[key] = widget
+        HoleBuildCache.__widgets.move_to_end(key)
+        while len(HoleBuildCache.__widgets) > HoleBuildCache.max_size:
+            HoleBuildCache.__widgets.popitem(last=False)
+            HoleBuildCache.__evictions += 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all widgets from the cache and resets the statistics.
+        """
+        HoleBuildCache.__widgets.clear()
+        HoleBuildCache.__hits = 0
+        HoleBuildCache.__misses = 0
+        HoleBuildCache.__evictions = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        """
+        Returns the statistics of the cache.
+        """
+        return {'hits': HoleBuildCache.__hits,
+                'misses': HoleBuildCache.__misses,
+                'evictions': HoleBuildCache.__evictions,
+                'size': len(HoleBuildCache.__widgets),
+                'max_size': HoleBuildCache.max_size}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def scope(*, max_size: int | None = None) -> Iterator[None]:
+        """
+        Returns a context manager that scopes the cache, e.g., to a single run of SuperSCAD. The cache is cleared on
+        entering and on leaving the context, and the maximum number of widgets is restored on leaving the context.
+
+        :param max_size: The maximum number of widgets in the cache within the context. A maximum of 0 disables the
+                         cache.
+        """
+        saved = HoleBuildCache.max_size
+        if max_size is not None:
+            HoleBuildCache.max_size = max_size
+        HoleBuildCache.clear()
+        try:
+            yield
+        finally:
+            HoleBuildCache.clear()
+            HoleBuildCache.max_size = saved
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HoleCost:
+    """
+    The estimated cost of rendering a hole, computed without building or serializing the hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    fragments: int
+    """
+    The number of fragments in 360 degrees of the widest part of the hole.
+    """
+
+    vertices: int
+    """
+    The number of vertices of the right halve of the cross-section of the hole with the top and bottom profiles
+    applied.
+    """
+
+    facets: int
+    """
+    The estimated number of triangles of the hole before any boolean operations.
+    """
+
+    nodes: int
+    """
+    The number of OpenSCAD nodes (i.e., modules, transformations, and boolean operations) the hole emits.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
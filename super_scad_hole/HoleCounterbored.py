@@ -6,11 +6,16 @@ from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
 from super_scad.type import Vector2
 from super_scad.util.Radius2Sides4n import Radius2Sides4n
+from super_scad_smooth_profile.Rough import Rough
 from super_scad_smooth_profile.SmoothProfile3D import SmoothProfile3D
 from super_scad_smooth_profile.SmoothProfileParams import SmoothProfileParams
 
 from super_scad_hole.Hole import Hole
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleCost import HoleCost
+from super_scad_hole.HoleCounterboredSpec import HoleCounterboredSpec
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
 from super_scad_hole.HoleRotationMixin import HoleRotationMixin
 
 
@@ -37,7 +42,12 @@ class HoleCounterbored(HoleRotationMixin, Hole):
                  fa: float | None = None,
                  fs: float | None = None,
                  fn: int | None = None,
-                 fn4n: bool | None = None):
+                 fn4n: bool | None = None,
+                 max_deviation: float | None = None,
+                 polyhedron: bool = False,
+                 segmented: bool = False,
+                 convexity: int | None = None,
+                 detail: HoleDetail | None = None):
         """
         Object constructor.
 
@@ -57,6 +67,15 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         :param fs: The minimum circumferential length of each fragment.
         :param fn: The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
         :param fn4n: Whether to create a hole with a multiple of 4 vertices.
+        :param max_deviation: The maximum deviation between the true circle and its facets. Overrides fa, fs, and
+                              fn. With fn4n, the number of fragments is rounded up to a multiple of 4.
+        :param polyhedron: Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        :param segmented: Whether to create each section of a hole without profiles with its own number of
+                          fragments, scaled to the radius of the section.
+        :param convexity: The convexity of the extrusions of the hole. None for the minimal convexity computed from
+                          the cross-section of the hole.
+        :param detail: The level of detail of the hole. None for the level of detail of the policy, see
+                       HoleDetailPolicy.
         """
         Hole.__init__(self,
                       alignment=alignment,
@@ -68,7 +87,12 @@ class HoleCounterbored(HoleRotationMixin, Hole):
                       fa=fa,
                       fs=fs,
                       fn=fn,
-                      fn4n=fn4n)
+                      fn4n=fn4n,
+                      max_deviation=max_deviation,
+                      polyhedron=polyhedron,
+                      segmented=segmented,
+                      convexity=convexity,
+                      detail=detail)
 
         self._height: float | None = height
         """
@@ -100,7 +124,7 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         The height of the counterbore.
         """
 
-        self.__validate_arguments(locals())
+        HoleInstrumentation.call(self, 'validate', self.__validate_arguments, locals())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -133,6 +157,7 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         Returns the radius of the hole.
         """
         if self._radius is None:
+            HoleInstrumentation.count(self._instrumented, 'radius')
             self._radius = 0.5 * self._diameter
 
         return self._radius
@@ -144,6 +169,7 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         Returns the diameter of the hole.
         """
         if self._diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'diameter')
             self._diameter = 2.0 * self._radius
 
         return self._diameter
@@ -155,6 +181,7 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         Returns the radius at the top of the counterbore.
         """
         if self._counterbore_radius is None:
+            HoleInstrumentation.count(self._instrumented, 'counterbore_radius')
             self._counterbore_radius = 0.5 * self._counterbore_diameter
 
         return self._counterbore_radius
@@ -166,6 +193,7 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         Returns the diameter at the top of the counterbore.
         """
         if self._counterbore_diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'counterbore_diameter')
             self._counterbore_diameter = 2.0 * self._counterbore_radius
 
         return self._counterbore_diameter
@@ -178,11 +206,35 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         """
         return self._counterbore_height
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_spec(self) -> HoleCounterboredSpec:
+        """
+        Returns the immutable and hashable specification of this hole.
+        """
+        return HoleCounterboredSpec(height=self.height,
+                                    radius=self.radius,
+                                    diameter=self.diameter,
+                                    counterbore_radius=self.counterbore_radius,
+                                    counterbore_diameter=self.counterbore_diameter,
+                                    counterbore_height=self.counterbore_height,
+                                    **self._spec_args())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def outer_radius(self) -> float:
+        """
+        Returns the nominal outer radius of the hole, i.e., the radius of the counterbore.
+        """
+        return self.counterbore_radius
+
     # ------------------------------------------------------------------------------------------------------------------
     def real_fn(self, context: Context) -> int | None:
         """
         Returns the real fixed number of fragments in 360 degrees.
         """
+        if self.max_deviation is not None:
+            return self._max_deviation_fn(self.counterbore_radius)
+
         if self.fn4n:
             return Radius2Sides4n.r2sides4n(context, self.counterbore_radius)
 
@@ -236,12 +288,33 @@ class HoleCounterbored(HoleRotationMixin, Hole):
         return polygon, top_params, bottom_params
 
     # ------------------------------------------------------------------------------------------------------------------
-    def build(self, context: Context) -> ScadWidget:
+    def _estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole in full detail, computed without building this hole.
+
+        :param context: The build context.
+        """
+        if self.polyhedron:
+            return HoleRotationMixin._estimate_polyhedron_cost(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationMixin._estimate_rough_hole_cost(self, context)
+
+        return HoleRotationMixin._estimate_hole_cost(self, context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build(self, context: Context) -> ScadWidget:
         """
         Builds a SuperSCAD widget.
 
         :param context: The build context.
         """
+        if self.polyhedron:
+            return HoleRotationMixin._build_polyhedron(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationMixin._build_rough_hole(self, context)
+
         return HoleRotationMixin._build_hole(self, context)
 
 # ----------------------------------------------------------------------------------------------------------------------
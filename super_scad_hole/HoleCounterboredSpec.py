@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+
+from super_scad_hole.HoleSpec import HoleSpec
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class HoleCounterboredSpec(HoleSpec):
+    """
+    The specification of a counterbored hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    height: float
+    """
+    The height of the hole.
+    """
+
+    radius: float
+    """
+    The radius of the hole.
+    """
+
+    diameter: float
+    """
+    The diameter of the hole.
+    """
+
+    counterbore_radius: float
+    """
+    The radius of the counterbore.
+    """
+
+    counterbore_diameter: float
+    """
+    The diameter of the counterbore.
+    """
+
+    counterbore_height: float
+    """
+    The height of the counterbore.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -7,11 +7,16 @@ from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
 from super_scad.type import Vector2
 from super_scad.util.Radius2Sides4n import Radius2Sides4n
+from super_scad_smooth_profile.Rough import Rough
 from super_scad_smooth_profile.SmoothProfile3D import SmoothProfile3D
 from super_scad_smooth_profile.SmoothProfileParams import SmoothProfileParams
 
 from super_scad_hole.Hole import Hole
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleCost import HoleCost
+from super_scad_hole.HoleCounterdrilledSpec import HoleCounterdrilledSpec
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
 from super_scad_hole.HoleRotationMixin import HoleRotationMixin
 
 
@@ -40,7 +45,12 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
                  fa: float | None = None,
                  fs: float | None = None,
                  fn: int | None = None,
-                 fn4n: bool | None = None):
+                 fn4n: bool | None = None,
+                 max_deviation: float | None = None,
+                 polyhedron: bool = False,
+                 segmented: bool = False,
+                 convexity: int | None = None,
+                 detail: HoleDetail | None = None):
         """
         Object constructor.
 
@@ -62,6 +72,15 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         :param fs: The minimum circumferential length of each fragment.
         :param fn: The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
         :param fn4n: Whether to create a hole with a multiple of 4 vertices.
+        :param max_deviation: The maximum deviation between the true circle and its facets. Overrides fa, fs, and
+                              fn. With fn4n, the number of fragments is rounded up to a multiple of 4.
+        :param polyhedron: Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        :param segmented: Whether to create each section of a hole without profiles with its own number of
+                          fragments, scaled to the radius of the section.
+        :param convexity: The convexity of the extrusions of the hole. None for the minimal convexity computed from
+                          the cross-section of the hole.
+        :param detail: The level of detail of the hole. None for the level of detail of the policy, see
+                       HoleDetailPolicy.
         """
         Hole.__init__(self,
                       alignment=alignment,
@@ -73,7 +92,12 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
                       fa=fa,
                       fs=fs,
                       fn=fn,
-                      fn4n=fn4n)
+                      fn4n=fn4n,
+                      max_deviation=max_deviation,
+                      polyhedron=polyhedron,
+                      segmented=segmented,
+                      convexity=convexity,
+                      detail=detail)
 
         self._height: float | None = height
         """
@@ -115,7 +139,7 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         The height of the countersink.
         """
 
-        self.__validate_arguments(locals())
+        HoleInstrumentation.call(self, 'validate', self.__validate_arguments, locals())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -151,6 +175,7 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         Returns the radius of the hole.
         """
         if self._radius is None:
+            HoleInstrumentation.count(self._instrumented, 'radius')
             self._radius = 0.5 * self._diameter
 
         return self._radius
@@ -162,6 +187,7 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         Returns the diameter of the hole.
         """
         if self._diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'diameter')
             self._diameter = 2.0 * self._radius
 
         return self._diameter
@@ -173,6 +199,7 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         Returns the of the countersink.
         """
         if self._counterdrill_radius is None:
+            HoleInstrumentation.count(self._instrumented, 'counterdrill_radius')
             self._counterdrill_radius = 0.5 * self._counterdrill_diameter
 
         return self._counterdrill_radius
@@ -184,6 +211,7 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         Returns the of the countersink.
         """
         if self._counterdrill_diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'counterdrill_diameter')
             self._counterdrill_diameter = 2.0 * self._counterdrill_radius
 
         return self._counterdrill_diameter
@@ -203,6 +231,7 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         Returns the angle of the countersink.
         """
         if self._countersink_angle is None:
+            HoleInstrumentation.count(self._instrumented, 'countersink_angle')
             self._countersink_angle = 2.0 * math.degrees(math.atan2(self.counterdrill_radius - self.radius,
                                                                     self.countersink_height))
 
@@ -215,16 +244,43 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         Returns the height of the countersink.
         """
         if self._countersink_height is None:
+            HoleInstrumentation.count(self._instrumented, 'countersink_height')
             diff_radia = self.counterdrill_radius - self.radius
             self._countersink_height = diff_radia / math.tan(math.radians(0.5 * self.countersink_angle))
 
         return self._countersink_height
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_spec(self) -> HoleCounterdrilledSpec:
+        """
+        Returns the immutable and hashable specification of this hole.
+        """
+        return HoleCounterdrilledSpec(height=self.height,
+                                      radius=self.radius,
+                                      diameter=self.diameter,
+                                      counterdrill_radius=self.counterdrill_radius,
+                                      counterdrill_diameter=self.counterdrill_diameter,
+                                      counterdrill_height=self.counterdrill_height,
+                                      countersink_angle=self.countersink_angle,
+                                      countersink_height=self.countersink_height,
+                                      **self._spec_args())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def outer_radius(self) -> float:
+        """
+        Returns the nominal outer radius of the hole, i.e., the radius of the counterdrill.
+        """
+        return self.counterdrill_radius
+
     # ------------------------------------------------------------------------------------------------------------------
     def real_fn(self, context: Context) -> int | None:
         """
         Returns the real fixed number of fragments in 360 degrees.
         """
+        if self.max_deviation is not None:
+            return self._max_deviation_fn(self.counterdrill_radius)
+
         if self.fn4n:
             return Radius2Sides4n.r2sides4n(context, self.counterdrill_radius)
 
@@ -252,9 +308,8 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
                          vertical_offset + self.height - self.counterdrill_height - self.countersink_height),
                  Vector2(self.radius, vertical_offset)]
 
-        inner_angle = 90.0 - 0.5 * self.countersink_angle
-        top_params = SmoothProfileParams(inner_angle=inner_angle,
-                                         normal_angle=180.0 + 0.5 * inner_angle,
+        top_params = SmoothProfileParams(inner_angle=90.0,
+                                         normal_angle=225.0,
                                          position=nodes[2],
                                          edge1_is_extended_by_eps=self.extend_by_eps_top,
                                          edge2_is_extended_by_eps=self.extend_by_eps_boundary)
@@ -280,12 +335,33 @@ class HoleCounterdrilled(HoleRotationMixin, Hole):
         return polygon, top_params, bottom_params
 
     # ------------------------------------------------------------------------------------------------------------------
-    def build(self, context: Context) -> ScadWidget:
+    def _estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole in full detail, computed without building this hole.
+
+        :param context: The build context.
+        """
+        if self.polyhedron:
+            return HoleRotationMixin._estimate_polyhedron_cost(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationMixin._estimate_rough_hole_cost(self, context)
+
+        return HoleRotationMixin._estimate_hole_cost(self, context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build(self, context: Context) -> ScadWidget:
         """
         Builds a SuperSCAD widget.
 
         :param context: The build context.
         """
+        if self.polyhedron:
+            return HoleRotationMixin._build_polyhedron(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationMixin._build_rough_hole(self, context)
+
         return HoleRotationMixin._build_hole(self, context)
 
 # ----------------------------------------------------------------------------------------------------------------------
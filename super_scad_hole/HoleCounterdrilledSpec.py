@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from super_scad_hole.HoleSpec import HoleSpec
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class HoleCounterdrilledSpec(HoleSpec):
+    """
+    The specification of a counterdrilled hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    height: float
+    """
+    The height of the hole.
+    """
+
+    radius: float
+    """
+    The radius of the hole.
+    """
+
+    diameter: float
+    """
+    The diameter of the hole.
+    """
+
+    counterdrill_radius: float
+    """
+    The radius of the counterdrill.
+    """
+
+    counterdrill_diameter: float
+    """
+    The diameter of the counterdrill.
+    """
+
+    counterdrill_height: float
+    """
+    The height of the counterdrill.
+    """
+
+    countersink_angle: float
+    """
+    The angle of the countersink.
+    """
+
+    countersink_height: float
+    """
+    The height of the countersink.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -7,11 +7,16 @@ from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
 from super_scad.type import Vector2
 from super_scad.util.Radius2Sides4n import Radius2Sides4n
+from super_scad_smooth_profile.Rough import Rough
 from super_scad_smooth_profile.SmoothProfile3D import SmoothProfile3D
 from super_scad_smooth_profile.SmoothProfileParams import SmoothProfileParams
 
 from super_scad_hole.Hole import Hole
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleCost import HoleCost
+from super_scad_hole.HoleCountersunkSpec import HoleCountersunkSpec
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
 from super_scad_hole.HoleRotationMixin import HoleRotationMixin
 
 
@@ -39,7 +44,12 @@ class HoleCountersunk(HoleRotationMixin, Hole):
                  fa: float | None = None,
                  fs: float | None = None,
                  fn: int | None = None,
-                 fn4n: bool | None = None):
+                 fn4n: bool | None = None,
+                 max_deviation: float | None = None,
+                 polyhedron: bool = False,
+                 segmented: bool = False,
+                 convexity: int | None = None,
+                 detail: HoleDetail | None = None):
         """
         Object constructor.
 
@@ -60,6 +70,15 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         :param fs: The minimum circumferential length of each fragment.
         :param fn: The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
         :param fn4n: Whether to create a hole with a multiple of 4 vertices.
+        :param max_deviation: The maximum deviation between the true circle and its facets. Overrides fa, fs, and
+                              fn. With fn4n, the number of fragments is rounded up to a multiple of 4.
+        :param polyhedron: Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        :param segmented: Whether to create each section of a hole without profiles with its own number of
+                          fragments, scaled to the radius of the section.
+        :param convexity: The convexity of the extrusions of the hole. None for the minimal convexity computed from
+                          the cross-section of the hole.
+        :param detail: The level of detail of the hole. None for the level of detail of the policy, see
+                       HoleDetailPolicy.
         """
         Hole.__init__(self,
                       alignment=alignment,
@@ -71,7 +90,12 @@ class HoleCountersunk(HoleRotationMixin, Hole):
                       fa=fa,
                       fs=fs,
                       fn=fn,
-                      fn4n=fn4n)
+                      fn4n=fn4n,
+                      max_deviation=max_deviation,
+                      polyhedron=polyhedron,
+                      segmented=segmented,
+                      convexity=convexity,
+                      detail=detail)
 
         self._height: float | None = height
         """
@@ -108,7 +132,7 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         The height of the countersink.
         """
 
-        self.__validate_arguments(locals())
+        HoleInstrumentation.call(self, 'validate', self.__validate_arguments, locals())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -142,6 +166,7 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         Returns the radius of the hole.
         """
         if self._radius is None:
+            HoleInstrumentation.count(self._instrumented, 'radius')
             self._radius = 0.5 * self._diameter
 
         return self._radius
@@ -153,6 +178,7 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         Returns the diameter of the hole.
         """
         if self._diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'diameter')
             self._diameter = 2.0 * self._radius
 
         return self._diameter
@@ -164,6 +190,7 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         Returns the radius at the top of the countersink.
         """
         if self._countersink_radius is None:
+            HoleInstrumentation.count(self._instrumented, 'countersink_radius')
             self._countersink_radius = 0.5 * self._countersink_diameter
 
         return self._countersink_radius
@@ -175,6 +202,7 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         Returns the diameter at the top of the countersink.
         """
         if self._countersink_diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'countersink_diameter')
             self._countersink_diameter = 2.0 * self._countersink_radius
 
         return self._countersink_diameter
@@ -186,6 +214,7 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         Returns the angle of the countersink.
         """
         if self._countersink_angle is None:
+            HoleInstrumentation.count(self._instrumented, 'countersink_angle')
             self._countersink_angle = 2.0 * math.degrees(math.atan2(self.countersink_radius - self.radius,
                                                                     self.countersink_height))
 
@@ -198,16 +227,42 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         Returns the height of the countersink.
         """
         if self._countersink_height is None:
+            HoleInstrumentation.count(self._instrumented, 'countersink_height')
             diff_radia = self.countersink_radius - self.radius
             self._countersink_height = diff_radia / math.tan(math.radians(0.5 * self.countersink_angle))
 
         return self._countersink_height
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_spec(self) -> HoleCountersunkSpec:
+        """
+        Returns the immutable and hashable specification of this hole.
+        """
+        return HoleCountersunkSpec(height=self.height,
+                                   radius=self.radius,
+                                   diameter=self.diameter,
+                                   countersink_radius=self.countersink_radius,
+                                   countersink_diameter=self.countersink_diameter,
+                                   countersink_angle=self.countersink_angle,
+                                   countersink_height=self.countersink_height,
+                                   **self._spec_args())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def outer_radius(self) -> float:
+        """
+        Returns the nominal outer radius of the hole, i.e., the radius of the countersink.
+        """
+        return self.countersink_radius
+
     # ------------------------------------------------------------------------------------------------------------------
     def real_fn(self, context: Context) -> int | None:
         """
         Returns the real fixed number of fragments in 360 degrees.
         """
+        if self.max_deviation is not None:
+            return self._max_deviation_fn(self.countersink_radius)
+
         if self.fn4n:
             return Radius2Sides4n.r2sides4n(context, self.countersink_radius)
 
@@ -260,12 +315,33 @@ class HoleCountersunk(HoleRotationMixin, Hole):
         return polygon, top_params, bottom_params
 
     # ------------------------------------------------------------------------------------------------------------------
-    def build(self, context: Context) -> ScadWidget:
+    def _estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole in full detail, computed without building this hole.
+
+        :param context: The build context.
+        """
+        if self.polyhedron:
+            return HoleRotationMixin._estimate_polyhedron_cost(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationMixin._estimate_rough_hole_cost(self, context)
+
+        return HoleRotationMixin._estimate_hole_cost(self, context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build(self, context: Context) -> ScadWidget:
         """
         Builds a SuperSCAD widget.
 
         :param context: The build context.
         """
+        if self.polyhedron:
+            return HoleRotationMixin._build_polyhedron(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationMixin._build_rough_hole(self, context)
+
         return HoleRotationMixin._build_hole(self, context)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -3,10 +3,17 @@ from typing import Any, Dict
 from super_scad.scad.ArgumentValidator import ArgumentValidator
 from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
+from super_scad_smooth_profile.Rough import Rough
 from super_scad_smooth_profile.SmoothProfile3D import SmoothProfile3D
 
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBoundingBox import HoleBoundingBox
+from super_scad_hole.HoleCost import HoleCost
 from super_scad_hole.HoleCountersunk import HoleCountersunk
+from super_scad_hole.HoleCountersunkSlottedSpec import HoleCountersunkSlottedSpec
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
+from super_scad_hole.HoleRotationMixin import HoleRotationMixin
 from super_scad_hole.HoleRotationSlottedMixin import HoleRotationSlottedMixin
 
 
@@ -36,7 +43,12 @@ class HoleCountersunkSlotted(HoleCountersunk, HoleRotationSlottedMixin):
                  fa: float | None = None,
                  fs: float | None = None,
                  fn: int | None = None,
-                 fn4n: bool | None = None):
+                 fn4n: bool | None = None,
+                 max_deviation: float | None = None,
+                 polyhedron: bool = False,
+                 segmented: bool = False,
+                 convexity: int | None = None,
+                 detail: HoleDetail | None = None):
         """
         Object constructor.
 
@@ -59,6 +71,15 @@ class HoleCountersunkSlotted(HoleCountersunk, HoleRotationSlottedMixin):
         :param fs: The minimum circumferential length of each fragment.
         :param fn: The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
         :param fn4n: Whether to create a hole with a multiple of 4 vertices.
+        :param max_deviation: The maximum deviation between the true circle and its facets. Overrides fa, fs, and
+                              fn. With fn4n, the number of fragments is rounded up to a multiple of 4.
+        :param polyhedron: Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        :param segmented: Whether to create each section of a hole without profiles with its own number of
+                          fragments, scaled to the radius of the section.
+        :param convexity: The convexity of the extrusions of the hole. None for the minimal convexity computed from
+                          the cross-section of the hole.
+        :param detail: The level of detail of the hole. None for the level of detail of the policy, see
+                       HoleDetailPolicy.
         """
         HoleCountersunk.__init__(self,
                                  height=height,
@@ -77,7 +98,12 @@ class HoleCountersunkSlotted(HoleCountersunk, HoleRotationSlottedMixin):
                                  fa=fa,
                                  fs=fs,
                                  fn=fn,
-                                 fn4n=fn4n)
+                                 fn4n=fn4n,
+                                 max_deviation=max_deviation,
+                                 polyhedron=polyhedron,
+                                 segmented=segmented,
+                                 convexity=convexity,
+                                 detail=detail)
         self._overall_length: float | None = overall_length
         """
         The overall length of the hole. 
@@ -88,7 +114,7 @@ class HoleCountersunkSlotted(HoleCountersunk, HoleRotationSlottedMixin):
         The distance between two centers of the two circles of the hole.
         """
 
-        self.__validate_arguments(locals())
+        HoleInstrumentation.call(self, 'validate', self.__validate_arguments, locals())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -109,6 +135,7 @@ class HoleCountersunkSlotted(HoleCountersunk, HoleRotationSlottedMixin):
         Returns the overall length of the hole.
         """
         if self._overall_length is None:
+            HoleInstrumentation.count(self._instrumented, 'overall_length')
             self._overall_length = self.center_to_center + self.diameter
 
         return self._overall_length
@@ -120,17 +147,85 @@ class HoleCountersunkSlotted(HoleCountersunk, HoleRotationSlottedMixin):
         Returns the distance between two centers of the two circles of the hole.
         """
         if self._center_to_center is None:
+            HoleInstrumentation.count(self._instrumented, 'center_to_center')
             self._center_to_center = self._overall_length - self.countersink_diameter
 
         return self._center_to_center
 
     # ------------------------------------------------------------------------------------------------------------------
-    def build(self, context: Context) -> ScadWidget:
+    def _create_spec(self) -> HoleCountersunkSlottedSpec:
+        """
+        Returns the immutable and hashable specification of this hole.
+        """
+        return HoleCountersunkSlottedSpec(height=self.height,
+                                          radius=self.radius,
+                                          diameter=self.diameter,
+                                          countersink_radius=self.countersink_radius,
+                                          countersink_diameter=self.countersink_diameter,
+                                          countersink_angle=self.countersink_angle,
+                                          countersink_height=self.countersink_height,
+                                          overall_length=self.overall_length,
+                                          center_to_center=self.center_to_center,
+                                          **self._spec_args())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def outer_radius(self) -> float:
+        """
+        Returns the nominal outer radius of the hole, i.e., the radius of the countersink plus half the center-to-center
+        distance.
+        """
+        return self.countersink_radius + 0.5 * self.center_to_center
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def bounding_box(self, context: Context) -> HoleBoundingBox:
+        """
+        Returns the bounding box of this hole, including the extensions by eps, the overhangs of the profiles, and the
+        slot, computed without building this hole.
+
+        :param context: The build context.
+        """
+        return HoleRotationMixin._compute_bounding_box(self, context, self.center_to_center)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def volume(self, context: Context, faceted: bool = False) -> float:
+        """
+        Returns the volume of this hole, including the extensions by eps and the slot, computed without building this
+        hole.
+
+        :param context: The build context.
+        :param faceted: Whether to return the faceted volume instead of the exact volume.
+        """
+        return HoleRotationMixin._compute_volume(self, context, self.center_to_center, faceted)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole in full detail, computed without building this hole.
+
+        :param context: The build context.
+        """
+        if self.polyhedron:
+            return HoleRotationMixin._estimate_polyhedron_cost(self, context, self.center_to_center)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationSlottedMixin._estimate_slotted_rough_hole_cost(self, context)
+
+        return HoleRotationSlottedMixin._estimate_slotted_hole_cost(self, context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build(self, context: Context) -> ScadWidget:
         """
         Builds a SuperSCAD widget.
 
         :param context: The build context.
         """
+        if self.polyhedron:
+            return HoleRotationMixin._build_polyhedron(self, context, self.center_to_center)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return HoleRotationSlottedMixin._build_slotted_rough_hole(self, context)
+
         return HoleRotationSlottedMixin._build_slotted_hole(self, context)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from super_scad_hole.HoleSpec import HoleSpec
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class HoleCountersunkSpec(HoleSpec):
+    """
+    The specification of a countersunk hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    height: float
+    """
+    The height of the hole.
+    """
+
+    radius: float
+    """
+    The radius of the hole.
+    """
+
+    diameter: float
+    """
+    The diameter of the hole.
+    """
+
+    countersink_radius: float
+    """
+    The radius at the top of the countersink.
+    """
+
+    countersink_diameter: float
+    """
+    The diameter at the top of the countersink.
+    """
+
+    countersink_angle: float
+    """
+    The angle of the countersink.
+    """
+
+    countersink_height: float
+    """
+    The height of the countersink.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,25 @@
+from enum import auto, Enum, STRICT
+
+
+class HoleDetail(Enum, boundary=STRICT):
+    """
+    Enumeration for the level of detail of a hole.
+    """
+    # ------------------------------------------------------------------------------------------------------------------
+    FULL = auto()
+    """
+    The hole is created in full detail.
+    """
+
+    COARSE = auto()
+    """
+    The hole is created in coarse detail, see HoleDetailPolicy.
+    """
+
+    PREVIEW = auto()
+    """
+    The hole is created in coarse detail in an OpenSCAD preview and in full detail in an OpenSCAD render, using
+    OpenSCAD's $preview variable.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from super_scad_hole.HoleDetail import HoleDetail
+
+
+class HoleDetailPolicy:
+    """
+    The global level of detail policy of holes. The level of detail applies to all holes without a level of detail of
+    their own.
+    """
+
+    detail: HoleDetail = HoleDetail.FULL
+    """
+    The level of detail of holes without a level of detail of their own.
+    """
+
+    coarse_fn: int = 16
+    """
+    The maximum number of fragments in 360 degrees of holes in coarse detail.
+    """
+
+    coarse_profiles: bool = False
+    """
+    Whether holes in coarse detail have their top and bottom profiles. If not, holes in coarse detail are rough.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def scope(*,
+              detail: HoleDetail | None = None,
+              coarse_fn: int | None = None,
+              coarse_profiles: bool | None = None) -> Iterator[None]:
+        """
+        Returns a context manager that temporarily changes the policy, e.g., for a single run of SuperSCAD. The
+        policy is restored on leaving the context.
+
+        :param detail: The level of detail of holes without a level of detail of their own.
+        :param coarse_fn: The maximum number of fragments in 360 degrees of holes in coarse detail.
+        :param coarse_profiles: Whether holes in coarse detail have their top and bottom profiles.
+        """
+        if coarse_fn is not None and coarse_fn < 3:
+            raise ValueError(f'The number of fragments of holes in coarse detail must be at least 3, got {coarse_fn}.')
+
+        saved = HoleDetailPolicy.detail, HoleDetailPolicy.coarse_fn, HoleDetailPolicy.coarse_profiles
+        if detail is not None:
+            HoleDetailPolicy.detail = detail
+        if coarse_fn is not None:
+            HoleDetailPolicy.coarse_fn = coarse_fn
+        if coarse_profiles is not None:
+            HoleDetailPolicy.coarse_profiles = coarse_profiles
+        try:
+            yield
+        finally:
+            HoleDetailPolicy.detail, HoleDetailPolicy.coarse_fn, HoleDetailPolicy.coarse_profiles = saved
+
+# ----------------------------------------------------------------------------------------------------------------------
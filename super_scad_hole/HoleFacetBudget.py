@@ -0,0 +1,196 @@
+import math
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from super_scad.private.PrivateMultiChildOpenScadCommand import PrivateMultiChildOpenScadCommand
+from super_scad.private.PrivateOpenScadCommand import PrivateOpenScadCommand
+from super_scad.private.PrivateSingleChildOpenScadCommand import PrivateSingleChildOpenScadCommand
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+
+from super_scad_hole.HoleSpec import HoleSpec
+
+
+class HoleFacetBudget:
+    """
+    A planner that distributes a total budget of facets (i.e., triangles) over all holes in a tree of widgets. Each
+    hole gets a fixed number of fragments such that all holes have (nearly) the same length of their fragments, i.e.,
+    the same math as Radius2Sides4n with a common fs. The cost of a hole is the number of facets of its sides, i.e., the
+    number of sides of its profile times twice its number of fragments times the number of times it is used.
+
+    Holes with a fixed number of fragments or a maximum deviation of their own are not changed, but count against the
+    budget. Holes with fn4n always get a multiple of 4 fragments.
+    """
+
+    __plan: Dict[HoleSpec, int] = {}
+    """
+    The active plan, i.e., the number of fragments of each hole given its specification.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __collect(widget: ScadWidget, context: Context, count: int, holes: Dict[HoleSpec, List]) -> None:
+        """
+        Collects all holes in a tree of widgets by building the widgets the same way as SuperSCAD does.
+
+        :param widget: The root of the tree.
+        :param context: The build context.
+        :param count: The number of times the root of the tree is used.
+        :param holes: The collected holes and their number of uses given their specifications.
+        """
+        # Imported on demand to avoid a circular import.
+        from super_scad_hole.Hole import Hole
+        from super_scad_hole.HoleArray import HoleArray
+
+        while True:
+            if isinstance(widget, Hole):
+                entry = holes.setdefault(widget.spec, [widget, 0])
+                entry[1] += count
+                return
+
+            if isinstance(widget, HoleArray):
+                count *= len(widget.positions)
+                widget = widget.hole
+                continue
+
+            old_unit = Context.get_unit_length_current()
+            Context.set_unit_length_current(widget.unit)
+            built = widget.build(context)
+            Context.set_unit_length_current(old_unit)
+
+            if isinstance(built, PrivateSingleChildOpenScadCommand):
+                widget = built.child
+            elif isinstance(built, PrivateMultiChildOpenScadCommand):
+                for child in built.children:
+                    HoleFacetBudget.__collect(child, context, count, holes)
+                return
+            elif isinstance(built, PrivateOpenScadCommand):
+                return
+            else:
+                widget = built
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __fragments(radius: float, length: float, min_fn: int, max_fn: int, fn4n: bool) -> int:
+        """
+        Returns the number of fragments of a circle given the length of its fragments.
+
+        :param radius: The radius of the circle.
+        :param length: The length of the fragments.
+        :param min_fn: The minimum number of fragments.
+        :param max_fn: The maximum number of fragments.
+        :param fn4n: Whether to round up the number of fragments to a multiple of 4. The result is then at most the
+                     largest multiple of 4 not greater than the maximum number of fragments.
+        """
+        fn = max(int(math.ceil(radius * 2.0 * math.pi / length)), min_fn)
+        if fn4n:
+            fn = int(math.floor((fn + 3) / 4) * 4)
+
+            return min(fn, max(4, max_fn // 4 * 4))
+
+        return min(fn, max_fn)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def plan(*,
+             root: ScadWidget,
+             context: Context,
+             budget: int,
+             min_fn: int = 8,
+             max_fn: int = 360) -> Dict[HoleSpec, int]:
+        """
+        Returns the number of fragments of each hole in a tree of widgets given the specification of the hole. If the
+        budget is too small, all holes get the minimum number of fragments.
+
+        :param root: The root of the tree.
+        :param context: The build context.
+        :param budget: The total number of facets of all holes.
+        :param min_fn: The minimum number of fragments of a hole.
+        :param max_fn: The maximum number of fragments of a hole.
+        """
+        holes: Dict[HoleSpec, List] = {}
+        HoleFacetBudget.__collect(root, context, 1, holes)
+
+        fixed_cost = 0
+        plan: Dict[HoleSpec, int] = {}
+        planned: List[Tuple[HoleSpec, float, int, bool]] = []
+        for spec, (hole, count) in holes.items():
+            nodes = hole._create_profile_nodes(context)
+            on_axis = [node.x <= context.delta for node in nodes]
+            sides = sum(1 for index in range(len(nodes)) if not (on_axis[index] and on_axis[index - 1]))
+            weight = 2 * sides * count
+            if hole.max_deviation is not None or (hole.fn is not None and not hole.fn4n):
+                plan[spec] = hole.real_fn(context)
+                fixed_cost += weight * plan[spec]
+            else:
+                planned.append((spec, max(node.x for node in nodes), weight, bool(hole.fn4n)))
+
+        if not planned:
+            return plan
+
+        def cost(length: float) -> int:
+            return sum(weight * HoleFacetBudget.__fragments(radius, length, min_fn, max_fn, fn4n)
+                       for _, radius, weight, fn4n in planned)
+
+        # Bisect the common length of the fragments: from all holes at the maximum to all holes at the minimum number
+        # of fragments.
+        largest_radius = max(radius for _, radius, _, _ in planned)
+        low = 2.0 * math.pi * largest_radius / max_fn
+        high = 2.0 * math.pi * largest_radius / min_fn
+        if fixed_cost + cost(low) > budget:
+            for _ in range(64):
+                middle = 0.5 * (low + high)
+                if fixed_cost + cost(middle) > budget:
+                    low = middle
+                else:
+                    high = middle
+            low = high
+
+        for spec, radius, _, fn4n in planned:
+            plan[spec] = HoleFacetBudget.__fragments(radius, low, min_fn, max_fn, fn4n)
+
+        return plan
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def scope(*,
+              root: ScadWidget,
+              context: Context,
+              budget: int,
+              min_fn: int = 8,
+              max_fn: int = 360) -> Iterator[Dict[HoleSpec, int]]:
+        """
+        Returns a context manager that plans the number of fragments of all holes in a tree of widgets, see plan(), and
+        applies the plan to the holes built in the context, e.g., a single run of SuperSCAD on the tree.
+
+        :param root: The root of the tree.
+        :param context: The build context.
+        :param budget: The total number of facets of all holes.
+        :param min_fn: The minimum number of fragments of a hole.
+        :param max_fn: The maximum number of fragments of a hole.
+        """
+        HoleFacetBudget.__plan = HoleFacetBudget.plan(root=root,
+                                                      context=context,
+                                                      budget=budget,
+                                                      min_fn=min_fn,
+                                                      max_fn=max_fn)
+        try:
+            yield HoleFacetBudget.__plan
+        finally:
+            HoleFacetBudget.__plan = {}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def fn(hole: ScadWidget) -> int | None:
+        """
+        Returns the planned number of fragments of a hole. Returns None if the hole is not planned.
+
+        :param hole: The hole.
+        """
+        if not HoleFacetBudget.__plan:
+            return None
+
+        return HoleFacetBudget.__plan.get(hole.spec)
+
+# ----------------------------------------------------------------------------------------------------------------------
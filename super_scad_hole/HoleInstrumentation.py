@@ -0,0 +1,152 @@
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+class HoleInstrumentation:
+    """
+    Opt-in instrumentation of holes. When enabled, records per hole and aggregated per class of holes the number of
+    calls and the wall time of the stages of creating and building a hole, and counts how often the lazy derived
+    properties of holes (e.g., the radius given the diameter) are computed.
+
+    The stages are:
+    * validate: validation of the arguments of the constructor;
+    * create_polygon: creation of the polygon of the right side of the cross-section of the hole;
+    * create_profiles: creation of the nodes of the top and bottom profiles;
+    * extend_sides: extension of the sides of the cross-section by eps;
+    * build: building a hole, including all stages above, but excluding the construction of the hole.
+
+    The stages and properties of the copies of a hole derived while building the hole (e.g., with the number of
+    fragments planned by a facet budget or in coarse detail) are attributed to the hole itself.
+
+    While enabled, all instrumented holes are referenced by the instrumentation.
+    """
+
+    enabled: bool = False
+    """
+    Whether instrumentation is enabled.
+    """
+
+    __holes: Dict[int, Tuple[Any, Dict[str, List[float]], Dict[str, int]]] = {}
+    """
+    The instrumented holes, their timings per stage (i.e., the number of calls and the total wall time), and their
+    counts per lazy derived property, given the ID of the hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __entry(hole: Any) -> Tuple[Any, Dict[str, List[float]], Dict[str, int]]:
+        """
+        Returns the entry of a hole.
+
+        :param hole: The hole.
+        """
+        entry = HoleInstrumentation.__holes.get(id(hole))
+        if entry is None:
+            entry = (hole, {}, {})
+            HoleInstrumentation.__holes[id(hole)] = entry
+
+        return entry
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def call(hole: Any, stage: str, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls a function and returns its result. When enabled, the wall time of the call is recorded as a stage of a
+        hole.
+
+        :param hole: The hole.
+        :param stage: The name of the stage.
+        :param function: The function.
+        :param args: The positional arguments of the function.
+        :param kwargs: The keyword arguments of the function.
+        """
+        if not HoleInstrumentation.enabled:
+            return function(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timing = HoleInstrumentation.__entry(hole)[1].setdefault(stage, [0, 0.0])
+            timing[0] += 1
+            timing[1] += time.perf_counter() - start
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def count(hole: Any, name: str) -> None:
+        """
+        When enabled, counts the computation of a lazy derived property of a hole.
+
+        :param hole: The hole.
+        :param name: The name of the property.
+        """
+        if HoleInstrumentation.enabled:
+            counts = HoleInstrumentation.__entry(hole)[2]
+            counts[name] = counts.get(name, 0) + 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all recorded statistics.
+        """
+        HoleInstrumentation.__holes.clear()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """
+        Returns the recorded statistics per hole and aggregated per class of holes. Wall times are in seconds.
+        """
+        holes = []
+        classes: Dict[str, Dict[str, Any]] = {}
+        for hole, timings, counts in HoleInstrumentation.__holes.values():
+            name = type(hole).__name__
+            stages = {stage: {'calls': calls, 'time': total} for stage, (calls, total) in timings.items()}
+            holes.append({'class': name, 'id': id(hole), 'stages': stages, 'properties': dict(counts)})
+
+            aggregate = classes.setdefault(name, {'holes': 0, 'stages': {}, 'properties': {}})
+            aggregate['holes'] += 1
+            for stage, (calls, total) in timings.items():
+                timing = aggregate['stages'].setdefault(stage, {'calls': 0, 'time': 0.0})
+                timing['calls'] += calls
+                timing['time'] += total
+            for property_name, count in counts.items():
+                aggregate['properties'][property_name] = aggregate['properties'].get(property_name, 0) + count
+
+        return {'holes': holes, 'classes': classes}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def to_json(path: Path | str | None = None) -> str:
+        """
+        Returns the recorded statistics as JSON, see stats(). If a path is given, the JSON is written to the path too.
+
+        :param path: The path to the JSON file.
+        """
+        text = json.dumps(HoleInstrumentation.stats(), indent=2)
+        if path is not None:
+            Path(path).write_text(text)
+
+        return text
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def scope() -> Iterator[None]:
+        """
+        Returns a context manager that enables instrumentation, e.g., for a single run of SuperSCAD. The recorded
+        statistics are cleared on entering the context and kept on leaving the context.
+        """
+        enabled = HoleInstrumentation.enabled
+        HoleInstrumentation.clear()
+        HoleInstrumentation.enabled = True
+        try:
+            yield
+        finally:
+            HoleInstrumentation.enabled = enabled
+
+# ----------------------------------------------------------------------------------------------------------------------
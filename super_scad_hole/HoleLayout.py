@@ -0,0 +1,387 @@
+import math
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+from super_scad.scad.Context import Context
+from super_scad.type import Vector2, Vector3
+
+from super_scad_hole.Hole import Hole
+
+
+class HoleLayout:
+    """
+    A layout of positioned holes with a spatial index over their footprints for checking overlaps, wall thickness
+    (i.e., ligaments between holes), and edge distances before rendering.
+
+    The footprint of a hole is its projection onto the xy-plane, computed without building the hole, see
+    bounding_box(). The footprint of a round hole is a disk and the footprint of a slotted hole is a stadium, i.e., all
+    points within the radius of the hole from the segment between the two centers of the slot. The wall thickness
+    between two holes is the distance between their footprints, which is negative when the holes overlap.
+
+    The spatial index is a uniform grid: each hole is registered in all cells covered by the bounding box of its
+    footprint. Hence, queries examine only holes in nearby cells instead of all pairs of holes.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, *, context: Context, cell_size: float | None = None):
+        """
+        Object constructor.
+
+        :param context: The build context.
+        :param cell_size: The size of the cells of the grid. Defaults to twice the median reach of the footprints of the
+                          holes, i.e., the distance from the position of a hole to the farthest point of its footprint.
+        """
+        if cell_size is not None and cell_size <= 0.0:
+            raise ValueError(f'Cell size must be positive, got {cell_size}.')
+
+        self._context: Context = context
+        """
+        The build context.
+        """
+
+        self._cell_size: float | None = cell_size
+        """
+        The size of the cells of the grid.
+        """
+
+        self._holes: List[Hole] = []
+        """
+        The holes.
+        """
+
+        self._footprints: Dict[int, Tuple[float, float]] = {}
+        """
+        The radius and half the center-to-center distance of the footprints of the holes given the IDs of the holes,
+        such that the bounding box of a hole added at many positions is computed only once.
+        """
+
+        self._segments: List[Tuple[float, float, float, float]] = []
+        """
+        The segments of the footprints of the holes, i.e., the coordinates of the two centers of each hole.
+        """
+
+        self._radii: List[float] = []
+        """
+        The radii of the footprints of the holes.
+        """
+
+        self._grid: Dict[Tuple[int, int], List[int]] | None = None
+        """
+        The indexes of the holes given the cells of the grid. None when the grid must be (re)built.
+        """
+
+        self._size: float = 0.0
+        """
+        The actual size of the cells of the grid.
+        """
+
+        self._segment_array: np.ndarray = np.empty((0, 4))
+        """
+        The segments of the footprints of the holes as an array, built together with the grid.
+        """
+
+        self._radius_array: np.ndarray = np.empty(0)
+        """
+        The radii of the footprints of the holes as an array, built together with the grid.
+        """
+
+        self._extent: float = 0.0
+        """
+        The length of the diagonal of the bounding box of all footprints, computed together with the grid.
+        """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def add(self, hole: Hole, position: Vector2 | Vector3, angle: float = 0.0) -> int:
+        """
+        Adds a hole to this layout and returns the index of the hole.
+
+        :param hole: The hole.
+        :param position: The position of the hole. The z-coordinate is ignored.
+        :param angle: The angle of rotation of the hole around the z-axis.
+        """
+        footprint = self._footprints.get(id(hole))
+        if footprint is None:
+            box = hole.bounding_box(self._context)
+            footprint = (box.maximum.x, box.maximum.y - box.maximum.x)
+            self._footprints[id(hole)] = footprint
+        radius, half = footprint
+        dx = -half * math.sin(math.radians(angle))
+        dy = half * math.cos(math.radians(angle))
+
+        self._holes.append(hole)
+        self._segments.append((position.x - dx, position.y - dy, position.x + dx, position.y + dy))
+        self._radii.append(radius)
+        self._grid = None
+
+        return len(self._holes) - 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        """
+        Returns the number of holes in this layout.
+        """
+        return len(self._holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def holes(self) -> List[Hole]:
+        """
+        Returns the holes in this layout.
+        """
+        return list(self._holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def wall(self, index1: int, index2: int) -> float:
+        """
+        Returns the wall thickness between two holes, i.e., the distance between their footprints. Negative when the
+        holes overlap.
+
+        :param index1: The index of the first hole.
+        :param index2: The index of the second hole.
+        """
+        self.__build_grid()
+
+        return float(self.__walls(index1, [index2])[0])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def overlaps(self) -> List[Tuple[int, int]]:
+        """
+        Returns all pairs of indexes of holes that overlap. Holes that only touch do not overlap.
+        """
+        return [(index1, index2) for index1, index2, wall in self.thin_walls(0.0) if wall < 0.0]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def thin_walls(self, min_wall: float) -> List[Tuple[int, int, float]]:
+        """
+        Returns all pairs of indexes of holes with a wall thickness less than a minimum wall thickness, including
+        overlapping holes, together with their wall thickness.
+
+        :param min_wall: The minimum wall thickness.
+        """
+        if min_wall < 0.0:
+            raise ValueError(f'Minimum wall thickness must not be negative, got {min_wall}.')
+
+        indexes1 = []
+        indexes2 = []
+        for index1 in range(len(self._holes)):
+            for index2 in sorted(self.__candidates(index1, min_wall)):
+                if index2 > index1:
+                    indexes1.append(index1)
+                    indexes2.append(index2)
+        if not indexes1:
+            return []
+
+        walls = self.__walls(indexes1, indexes2)
+
+        return [(indexes1[k], indexes2[k], float(walls[k])) for k in np.flatnonzero(walls < min_wall)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def nearest(self, index: int) -> Tuple[int, float] | None:
+        """
+        Returns the index of the hole nearest to a hole, i.e., with the least wall thickness, and the wall thickness.
+        Returns None if this layout has no other hole.
+
+        :param index: The index of the hole.
+        """
+        if len(self._holes) < 2:
+            return None
+
+        self.__build_grid()
+        margin = self._size
+        while True:
+            others = sorted(self.__candidates(index, margin) - {index})
+            if others:
+                walls = self.__walls(index, others)
+                best = int(np.argmin(walls))
+
+                # Any hole with a wall thickness of at most the margin is among the candidates.
+                if walls[best] <= margin or margin >= self._extent:
+                    return others[best], float(walls[best])
+            margin *= 2.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def edge_violations(self, *, boundary: List[Vector2], edge_distance: float = 0.0) -> List[int]:
+        """
+        Returns the indexes of all holes with a footprint not inside a boundary polygon or at a distance less than the
+        edge distance from the sides of the boundary polygon, see HolePattern.cull().
+
+        :param boundary: The nodes of the boundary polygon.
+        :param edge_distance: The minimum distance between the footprint of a hole and a side of the boundary polygon.
+        """
+        if not self._holes:
+            return []
+
+        self.__build_grid()
+
+        segments = self._segment_array
+        points = segments[:, 0:2]
+        starts = np.array([(node.x, node.y) for node in boundary])
+        sides = np.roll(starts, -1, axis=0) - starts
+
+        # Even-odd rule: count the sides crossed by a ray from the first center of each hole in the positive
+        # x-direction.
+        relative = points[:, None, :] - starts[None, :, :]
+        y1 = starts[None, :, 1]
+        y2 = y1 + sides[None, :, 1]
+        straddles = (y1 > points[:, None, 1]) != (y2 > points[:, None, 1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crossing = relative[:, :, 0] < sides[None, :, 0] * relative[:, :, 1] / sides[None, :, 1]
+        inside = np.count_nonzero(straddles & crossing, axis=1) % 2 == 1
+
+        # The distance between the segment of each hole and the nearest side of the boundary polygon.
+        nearest = HoleLayout.__segments_distances(segments[:, None, 0:2],
+                                                  segments[:, None, 2:4],
+                                                  starts[None, :, :],
+                                                  starts[None, :, :] + sides[None, :, :]).min(axis=1)
+
+        keep = inside & (nearest - self._radius_array >= edge_distance)
+
+        return [int(index) for index in np.flatnonzero(~keep)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __build_grid(self) -> None:
+        """
+        Builds the grid if the grid is out of date.
+        """
+        if self._grid is not None:
+            return
+
+        if self._cell_size is not None:
+            self._size = self._cell_size
+        else:
+            reaches = sorted(self.__reach(index) for index in range(len(self._holes)))
+            self._size = max(2.0 * reaches[len(reaches) // 2], 1e-6) if reaches else 1.0
+
+        self._segment_array = np.array(self._segments, dtype=float).reshape(-1, 4)
+        self._radius_array = np.array(self._radii, dtype=float)
+        self._grid = {}
+        for index in range(len(self._holes)):
+            i_min, j_min, i_max, j_max = self.__cell_range(index, 0.0)
+            for i in range(i_min, i_max + 1):
+                for j in range(j_min, j_max + 1):
+                    self._grid.setdefault((i, j), []).append(index)
+
+        if self._holes:
+            boxes = [self.__box(index, 0.0) for index in range(len(self._holes))]
+            self._extent = math.hypot(max(box[2] for box in boxes) - min(box[0] for box in boxes),
+                                      max(box[3] for box in boxes) - min(box[1] for box in boxes))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __reach(self, index: int) -> float:
+        """
+        Returns the distance from the position of a hole to the farthest point of its footprint.
+
+        :param index: The index of the hole.
+        """
+        x1, y1, x2, y2 = self._segments[index]
+
+        return 0.5 * math.hypot(x2 - x1, y2 - y1) + self._radii[index]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __box(self, index: int, margin: float) -> Tuple[float, float, float, float]:
+        """
+        Returns the bounding box of the footprint of a hole expanded by a margin.
+
+        :param index: The index of the hole.
+        :param margin: The margin.
+        """
+        x1, y1, x2, y2 = self._segments[index]
+        reach = self._radii[index] + margin
+
+        return min(x1, x2) - reach, min(y1, y2) - reach, max(x1, x2) + reach, max(y1, y2) + reach
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __cell_range(self, index: int, margin: float) -> Tuple[int, int, int, int]:
+        """
+        Returns the first and last column and row of the cells of the grid covered by the bounding box of the footprint
+        of a hole expanded by a margin.
+
+        :param index: The index of the hole.
+        :param margin: The margin.
+        """
+        x_min, y_min, x_max, y_max = self.__box(index, margin)
+
+        return (math.floor(x_min / self._size),
+                math.floor(y_min / self._size),
+                math.floor(x_max / self._size),
+                math.floor(y_max / self._size))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __candidates(self, index: int, margin: float) -> Set[int]:
+        """
+        Returns the indexes of all holes, including the hole itself, registered in the cells covered by the bounding
+        box of the footprint of a hole expanded by a margin. The cells are clipped to the cells in use by the grid.
+
+        :param index: The index of the hole.
+        :param margin: The margin.
+        """
+        self.__build_grid()
+
+        i_min, j_min, i_max, j_max = self.__cell_range(index, margin)
+
+        candidates = set()
+        if (i_max - i_min + 1) * (j_max - j_min + 1) <= len(self._grid):
+            for i in range(i_min, i_max + 1):
+                for j in range(j_min, j_max + 1):
+                    candidates.update(self._grid.get((i, j), ()))
+        else:
+            for (i, j), indexes in self._grid.items():
+                if i_min <= i <= i_max and j_min <= j <= j_max:
+                    candidates.update(indexes)
+
+        return candidates
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __walls(self, indexes1: List[int] | int, indexes2: List[int]) -> np.ndarray:
+        """
+        Returns the wall thicknesses between pairs of holes.
+
+        :param indexes1: The indexes of the first holes of the pairs.
+        :param indexes2: The indexes of the second holes of the pairs.
+        """
+        segments = self._segment_array
+        distances = HoleLayout.__segments_distances(segments[indexes1, 0:2],
+                                                    segments[indexes1, 2:4],
+                                                    segments[indexes2, 0:2],
+                                                    segments[indexes2, 2:4])
+
+        return distances - self._radius_array[indexes1] - self._radius_array[indexes2]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __segments_distances(starts1: np.ndarray,
+                             ends1: np.ndarray,
+                             starts2: np.ndarray,
+                             ends2: np.ndarray) -> np.ndarray:
+        """
+        Returns the distances between segments, element-wise after broadcasting the first segments against the second
+        segments. Segments may be degenerate, i.e., points.
+
+        :param starts1: The starts of the first segments.
+        :param ends1: The ends of the first segments.
+        :param starts2: The starts of the second segments.
+        :param ends2: The ends of the second segments.
+        """
+
+        def point_segment(points: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+            sides = ends - starts
+            lengths = np.maximum(np.einsum('...k,...k->...', sides, sides), np.finfo(float).tiny)
+            ratios = np.clip(np.einsum('...k,...k->...', points - starts, sides) / lengths, 0.0, 1.0)
+
+            return np.linalg.norm(points - starts - ratios[..., None] * sides, axis=-1)
+
+        p1, q1, p2, q2 = starts1, ends1, starts2, ends2
+        distances = np.minimum(np.minimum(point_segment(p1, p2, q2), point_segment(q1, p2, q2)),
+                               np.minimum(point_segment(p2, p1, q1), point_segment(q2, p1, q1)))
+
+        # Segments that properly cross each other have distance zero.
+        def orientation(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+            return np.sign((b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1]) -
+                           (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0]))
+
+        crossing = (orientation(p1, q1, p2) * orientation(p1, q1, q2) < 0) & \
+                   (orientation(p2, q2, p1) * orientation(p2, q2, q1) < 0)
+
+        return np.where(crossing, 0.0, distances)
+
+# ----------------------------------------------------------------------------------------------------------------------
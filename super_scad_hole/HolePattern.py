@@ -0,0 +1,144 @@
+import math
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+import numpy as np
+from super_scad.type import Vector2
+
+from super_scad_hole.Hole import Hole
+
+
+class HolePattern:
+    """
+    Generators for the positions of holes in common patterns.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def bolt_circle(*,
+                    radius: float,
+                    count: int,
+                    start_angle: float = 0.0,
+                    center: Vector2 = Vector2.origin) -> Iterator[Vector2]:
+        """
+        Yields the positions of holes equally spaced on a circle.
+
+        :param radius: The radius of the circle.
+        :param count: The number of holes.
+        :param start_angle: The angle of the position of the first hole.
+        :param center: The center of the circle.
+        """
+        for index in range(count):
+            yield center + Vector2.from_polar(radius, start_angle + index * 360.0 / count)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def linear_row(*,
+                   count: int,
+                   pitch: float,
+                   angle: float = 0.0,
+                   start: Vector2 = Vector2.origin) -> Iterator[Vector2]:
+        """
+        Yields the positions of holes equally spaced on a line.
+
+        :param count: The number of holes.
+        :param pitch: The distance between two adjacent holes.
+        :param angle: The angle of the line.
+        :param start: The position of the first hole.
+        """
+        step = Vector2.from_polar(pitch, angle)
+        for index in range(count):
+            yield start + step * index
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def rectangular_grid(*,
+                         columns: int,
+                         rows: int,
+                         pitch_x: float,
+                         pitch_y: float,
+                         start: Vector2 = Vector2.origin) -> Iterator[Vector2]:
+        """
+        Yields the positions of holes on a rectangular grid, row by row.
+
+        :param columns: The number of holes in a row.
+        :param rows: The number of rows.
+        :param pitch_x: The distance between two adjacent holes in a row.
+        :param pitch_y: The distance between two adjacent rows.
+        :param start: The position of the first hole.
+        """
+        for row in range(rows):
+            for column in range(columns):
+                yield Vector2(start.x + column * pitch_x, start.y + row * pitch_y)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def hex_grid(*,
+                 columns: int,
+                 rows: int,
+                 pitch: float,
+                 start: Vector2 = Vector2.origin) -> Iterator[Vector2]:
+        """
+        Yields the positions of holes on a hexagonal (staggered) grid, row by row. Each hole is at the same distance
+        from its (up to six) neighbours. The odd rows are shifted by half the pitch.
+
+        :param columns: The number of holes in a row.
+        :param rows: The number of rows.
+        :param pitch: The distance between two adjacent holes.
+        :param start: The position of the first hole.
+        """
+        pitch_y = 0.5 * math.sqrt(3.0) * pitch
+        for row in range(rows):
+            offset = 0.5 * pitch if row % 2 == 1 else 0.0
+            for column in range(columns):
+                yield Vector2(start.x + offset + column * pitch, start.y + row * pitch_y)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def cull(positions: Iterable[Vector2],
+             *,
+             boundary: List[Vector2],
+             hole: Hole | None = None,
+             edge_distance: float = 0.0,
+             chunk_size: int = 4096) -> Iterator[Vector2]:
+        """
+        Yields the positions inside a boundary polygon at a minimum distance from the sides of the boundary polygon. The
+        minimum distance is the nominal outer radius of the hole (if given) plus the edge distance, see
+        Hole.outer_radius. Hence, the overhangs of the profiles and the extensions by eps of the hole must be included
+        in the edge distance where they matter. The positions are tested in chunks, so the positions can be generated
+        lazily.
+
+        :param positions: The positions of the holes.
+        :param boundary: The nodes of the boundary polygon.
+        :param hole: The hole at the positions.
+        :param edge_distance: The minimum distance between the outer boundary of a hole and a side of the boundary
+                              polygon.
+        :param chunk_size: The number of positions tested at once.
+        """
+        distance = edge_distance + (0.0 if hole is None else hole.outer_radius)
+        starts = np.array([(node.x, node.y) for node in boundary])
+        sides = np.roll(starts, -1, axis=0) - starts
+        lengths = np.maximum(np.einsum('ij,ij->i', sides, sides), np.finfo(float).tiny)
+
+        positions = iter(positions)
+        while chunk := list(islice(positions, chunk_size)):
+            points = np.array([(position.x, position.y) for position in chunk])
+            relative = points[:, None, :] - starts[None, :, :]
+
+            # Even-odd rule: count the sides crossed by a ray from each point in the positive x-direction.
+            y1 = starts[None, :, 1]
+            y2 = y1 + sides[None, :, 1]
+            straddles = (y1 > points[:, None, 1]) != (y2 > points[:, None, 1])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                crossing = relative[:, :, 0] < sides[None, :, 0] * relative[:, :, 1] / sides[None, :, 1]
+            inside = np.count_nonzero(straddles & crossing, axis=1) % 2 == 1
+
+            # The distance to the nearest side of the boundary polygon.
+            ratios = np.clip(np.einsum('ijk,jk->ij', relative, sides) / lengths, 0.0, 1.0)
+            nearest = np.linalg.norm(relative - ratios[:, :, None] * sides[None, :, :], axis=2).min(axis=1)
+
+            for position, keep in zip(chunk, inside & (nearest >= distance)):
+                if keep:
+                    yield position
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,73 @@
+import math
+
+from super_scad.d2.helper.PolygonSideExtender import PolygonSideExtender
+from super_scad.scad.Context import Context
+from super_scad.type import Vector2
+
+
+class HoleProfileSideExtender(PolygonSideExtender):
+    """
+    A polygon side extender for the profile of a hole. Unlike the default polygon side extender, inner corners where
+    only one side is extended (i.e., the nodes where a smooth profile joins a side of the hole) are handled for any
+    inner angle and not only for right angles.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _outward_angle(self, side_start: Vector2, side_end: Vector2) -> float:
+        """
+        Returns the angle of the outward normal of a side of the polygon.
+
+        :param side_start: The start node of the side.
+        :param side_end: The end node of the side.
+        """
+        if self._is_clockwise:
+            return (side_end - side_start).angle + 90.0
+
+        return (side_end - side_start).angle - 90.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _extend_inner_corner_side1(self, context: Context) -> None:
+        """
+        Handles the case were at an inner corner the first side is extended only.
+
+        :param context: The build context.
+        """
+        n = len(self._nodes)
+        previous_node = self._nodes[(self._index - 1) % n]
+        next_node = self._nodes[(self._index + 1) % n]
+
+        sine = math.sin(math.radians(self._current_inner_angle - 180.0))
+        if context.eps < sine * Vector2.distance(self._current_node, next_node):
+            # The first side offset by eps intersects the second side.
+            self._new_nodes.append(self._current_node + (next_node - self._current_node).unit * (context.eps / sine))
+        else:
+            # The corner is (nearly) flat.
+            self._new_nodes.append(self._current_node +
+                                   Vector2.from_polar(context.eps,
+                                                      self._outward_angle(previous_node, self._current_node)))
+            self._new_nodes.append(self._current_node)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _extend_inner_corner_side2(self, context: Context) -> None:
+        """
+        Handles the case were at an inner corner the second side is extended only.
+
+        :param context: The build context.
+        """
+        n = len(self._nodes)
+        previous_node = self._nodes[(self._index - 1) % n]
+        next_node = self._nodes[(self._index + 1) % n]
+
+        sine = math.sin(math.radians(self._current_inner_angle - 180.0))
+        if context.eps < sine * Vector2.distance(self._current_node, previous_node):
+            # The second side offset by eps intersects the first side.
+            self._new_nodes.append(self._current_node +
+                                   (previous_node - self._current_node).unit * (context.eps / sine))
+        else:
+            # The corner is (nearly) flat.
+            self._new_nodes.append(self._current_node)
+            self._new_nodes.append(self._current_node +
+                                   Vector2.from_polar(context.eps,
+                                                      self._outward_angle(self._current_node, next_node)))
+
+# ----------------------------------------------------------------------------------------------------------------------
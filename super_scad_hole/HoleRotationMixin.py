@@ -1,16 +1,30 @@
 import abc
+import math
 from abc import ABC
-from typing import Tuple
+from types import ModuleType
+from typing import Any, List, Tuple, TYPE_CHECKING
 
+from super_scad.boolean.Union import Union
 from super_scad.d2.Polygon import Polygon
-from super_scad.d2.Rectangle import Rectangle
+from super_scad.d3.Cone import Cone
+from super_scad.d3.Cylinder import Cylinder
+from super_scad.d3.Polyhedron import Polyhedron
 from super_scad.d3.RotateExtrude import RotateExtrude
 from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
-from super_scad.transformation.Translate2D import Translate2D
-from super_scad.util.YinYang import YinYang
+from super_scad.transformation.Translate3D import Translate3D
+from super_scad.type import Vector2, Vector3
+from super_scad_smooth_profile.Rough import Rough
 from super_scad_smooth_profile.SmoothProfileParams import SmoothProfileParams
 
+from super_scad_hole.HoleBoundingBox import HoleBoundingBox
+from super_scad_hole.HoleCost import HoleCost
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
+from super_scad_hole.HoleProfileSideExtender import HoleProfileSideExtender
+
+if TYPE_CHECKING:
+    from super_scad_hole.HoleBatch import HoleBatch
+
 
 # class HoleRotationMixin(Hole, ABC):
 class HoleRotationMixin(ABC):
@@ -44,28 +58,249 @@ class HoleRotationMixin(ABC):
         raise NotImplementedError()
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _create_profile(self, context: Context) -> Tuple[ScadWidget, int]:
+    @classmethod
+    def batch(cls, *, positions: Any, **arguments: Any) -> 'HoleBatch':
+        """
+        Returns a batch of holes of this class. Each argument of the constructor of this class is either a scalar that
+        applies to all holes or a column (a list, tuple, or NumPy array) with one value per hole. All rows are
+        validated at once.
+
+        :param positions: The positions of the holes, either a list of vectors or an array with one row per hole.
+        :param arguments: The arguments for the constructor of this class, given as scalars or columns.
+        """
+        # Imported on demand, such that importing a hole does not import NumPy.
+        from super_scad_hole.HoleBatch import HoleBatch
+
+        return HoleBatch(hole_class=cls, positions=positions, arguments=arguments)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _numpy() -> ModuleType:
+        """
+        Returns NumPy. NumPy is imported on demand, such that importing a hole does not import NumPy.
+        """
+        import numpy
+
+        return numpy
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _clip_left_halve(nodes: List[Vector2]) -> List[Vector2]:
+        """
+        Returns the nodes of a polygon clipped to the right halve plane, i.e., the part of the polygon with x >= 0.
+
+        :param nodes: The nodes of the polygon.
+        """
+        if all(node.x >= 0.0 for node in nodes):
+            return nodes
+
+        clipped = []
+        n = len(nodes)
+        for index in range(n):
+            current = nodes[index]
+            following = nodes[(index + 1) % n]
+            if current.x >= 0.0:
+                clipped.append(current)
+            if (current.x >= 0.0) != (following.x >= 0.0):
+                ratio = current.x / (current.x - following.x)
+                clipped.append(Vector2(0.0, current.y + ratio * (following.y - current.y)))
+
+        return clipped
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_profile_nodes(self, context: Context) -> List[Vector2]:
         """
-        Returns the profile of the hole.
+        Returns the nodes of the right halve of the cross-section of the hole with the top and bottom profiles applied
+        and the sides extended by eps.
 
         :param context: The build context.
         """
-        profile, top_params, bottom_params = self._create_polygon()
+        polygon, top_params, bottom_params = HoleInstrumentation.call(self._instrumented,
+                                                                      'create_polygon',
+                                                                      self._create_polygon)
 
-        left_halve = Rectangle(width=2.0 + context.eps,
-                               depth=self.height + 2 * context.eps,
-                               extend_by_eps_sides=[True, True, False, True])
-        left_halve = Translate2D(x=-left_halve.width, y=-context.eps, child=left_halve)
+        nodes = []
+        extend_by_eps_sides = set()
+        for index, node in enumerate(polygon.primary):
+            if node == top_params.position:
+                profile_nodes = HoleInstrumentation.call(self._instrumented,
+                                                         'create_profiles',
+                                                         self.profile_top.create_polygon,
+                                                         context=context,
+                                                         params=top_params)
+            elif node == bottom_params.position:
+                profile_nodes = HoleInstrumentation.call(self._instrumented,
+                                                         'create_profiles',
+                                                         self.profile_bottom.create_polygon,
+                                                         context=context,
+                                                         params=bottom_params)
+            else:
+                profile_nodes = [node]
+            for profile_node in profile_nodes:
+                if not nodes or Vector2.distance(nodes[-1], profile_node) > context.delta:
+                    nodes.append(profile_node)
+            if index in polygon.extend_by_eps_sides:
+                extend_by_eps_sides.add(len(nodes) - 1)
 
-        yin_yang = YinYang()
-        yin_yang += (left_halve, None)
-        yin_yang += self.profile_top.create_smooth_profiles(params=top_params)
-        yin_yang += self.profile_bottom.create_smooth_profiles(params=bottom_params)
+        if extend_by_eps_sides:
+            profile = Polygon(points=nodes, extend_by_eps_sides=extend_by_eps_sides)
+            nodes = HoleInstrumentation.call(self._instrumented,
+                                             'extend_sides',
+                                             HoleProfileSideExtender().extend_sides,
+                                             context=context,
+                                             nodes=nodes,
+                                             inner_angles=profile.inner_angles(context),
+                                             normal_angles=profile.normal_angles(context),
+                                             is_clockwise=profile.is_clockwise(context),
+                                             extend_by_eps_sides=extend_by_eps_sides)
 
-        profile = yin_yang.apply_positives_negatives(profile)
-        convexity = max(2, self.profile_top.convexity or 0, self.profile_bottom.convexity or 0)
+        return self._clip_left_halve(nodes)
 
-        return profile, convexity
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_sections(self, context: Context) -> List[Tuple[float, float, float, float]]:
+        """
+        Returns the sections of a hole with rough profiles, i.e., the cylinders and truncated cones the hole is made of,
+        ordered from top to bottom. Each section is a tuple of the z-coordinate of its bottom, its height, its bottom
+        radius, and its top radius.
+
+        :param context: The build context.
+        """
+        boundary = [node for node in self._create_profile_nodes(context) if node.x > context.delta]
+
+        sections = []
+        for top, bottom in zip(boundary, boundary[1:]):
+            if abs(top.y - bottom.y) <= context.delta:
+                # A step in the profile.
+                continue
+
+            if sections and \
+                    abs(top.x - bottom.x) <= context.delta and \
+                    abs(sections[-1][2] - sections[-1][3]) <= context.delta and \
+                    abs(sections[-1][2] - top.x) <= context.delta:
+                # A cylinder on top of a cylinder with the same radius.
+                sections[-1] = (bottom.y, sections[-1][0] + sections[-1][1] - bottom.y, bottom.x, sections[-1][3])
+            else:
+                sections.append((bottom.y, top.y - bottom.y, bottom.x, top.x))
+
+        return sections
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_section_fragments(self,
+                                  context: Context,
+                                  sections: List[Tuple[float, float, float, float]]) -> List[int | None]:
+        """
+        Returns the number of fragments of each section of a hole with rough profiles. Unless the hole is segmented,
+        all sections have the number of fragments of the widest section, i.e., the number of fragments of the rotational
+        extrusion of the profile of the hole, such that the vertices of adjacent sections are aligned at the steps of
+        the hole, also when the number of fragments follows from $fa and $fs. Otherwise, each section has its own
+        number of fragments, scaled to its radius (or meeting the maximum deviation of the hole). The number of
+        fragments of each section divides the number of fragments of the widest section.
+
+        :param context: The build context.
+        :param sections: The sections of the hole.
+        """
+        radii = [max(bottom_radius, top_radius) for _, _, bottom_radius, top_radius in sections]
+        largest_radius = max(radii)
+
+        if not self.segmented:
+            fn = self.real_fn(context)
+            if fn is None and context.fn <= 0:
+                fn = self._real_fragments(context, largest_radius)
+
+            return [fn] * len(sections)
+
+        fn = self._real_fragments(context, largest_radius)
+
+        fragments = []
+        for radius in radii:
+            if self.max_deviation is not None:
+                target = self._max_deviation_fn(radius)
+            else:
+                target = int(math.ceil(fn * radius / largest_radius - 1e-9))
+            count = fn
+            for divisor in range(2, fn // 3 + 1):
+                if fn % divisor == 0 and fn // divisor >= max(target, 3) and (not self.fn4n or fn // divisor % 4 == 0):
+                    count = fn // divisor
+            fragments.append(count)
+
+        return fragments
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _real_convexity(self, context: Context, nodes: List[Vector2]) -> int:
+        """
+        Returns the convexity of the hole. Unless the hole has a convexity of its own, the convexity is half the maximum
+        number of times a line crosses the boundary of the cross-section of the hole (i.e., the profile and its mirror
+        image at the z-axis). A line through no vertex can be shifted until it touches a first vertex without crossing
+        any other side. Hence, the maximum is the exact maximum over all lines through a vertex, shifted infinitesimally
+        to their left. Around a vertex, a side not incident to the vertex is crossed by the lines in a range of
+        directions, and a side incident to the vertex is crossed by the lines with its other end on their left. By the
+        symmetry of the cross-section, the vertices right of the z-axis suffice. The convexity of the cross-section is
+        also the convexity of the slot of a slotted hole.
+
+        :param context: The build context.
+        :param nodes: The nodes of the right halve of the cross-section of the hole.
+        """
+        if self.convexity is not None:
+            return self.convexity
+
+        np = HoleRotationMixin._numpy()
+
+        points = np.array([(node.x, node.y) for node in nodes])
+        points[points[:, 0] <= context.delta, 0] = 0.0
+        starts = points
+        ends = np.roll(points, -1, axis=0)
+
+        # The sides on the z-axis are inside the cross-section.
+        boundary = ~((starts[:, 0] == 0.0) & (ends[:, 0] == 0.0))
+        starts = starts[boundary]
+        ends = ends[boundary]
+        mirror = np.array([-1.0, 1.0])
+        starts = np.concatenate((starts, starts * mirror))
+        ends = np.concatenate((ends, ends * mirror))
+
+        # The vertices right of the z-axis (rows) and the ends of all sides relative to these vertices (columns).
+        pivots = np.unique(points, axis=0)[:, np.newaxis, :]
+        to_starts = starts[np.newaxis, :, :] - pivots
+        to_ends = ends[np.newaxis, :, :] - pivots
+        at_start = (to_starts == 0.0).all(axis=-1)
+        at_end = (to_ends == 0.0).all(axis=-1)
+        incident = at_start | at_end
+
+        # The directions of the lines crossing a side, as ranges of angles between 0 and 360 degrees.
+        tau = 2.0 * np.pi
+        angle_starts = np.arctan2(to_starts[..., 1], to_starts[..., 0])
+        angle_ends = np.arctan2(to_ends[..., 1], to_ends[..., 0])
+        spans = np.arctan2(to_starts[..., 0] * to_ends[..., 1] - to_starts[..., 1] * to_ends[..., 0],
+                           (to_starts * to_ends).sum(axis=-1))
+        lows = np.where(spans > 0.0, angle_starts, angle_ends)
+        spans = np.abs(spans)
+        others = np.where(at_start, angle_ends, angle_starts)
+        lows = np.where(incident, others - np.pi, lows)
+        spans = np.where(incident, np.pi, spans)
+        lows = np.concatenate((lows, np.where(incident, lows, lows + np.pi)), axis=1) % tau
+        spans = np.concatenate((spans, np.where(incident, 0.0, spans)), axis=1)
+
+        # Ranges passing 360 degrees are split. At equal angles, the ranges ending there are counted off first.
+        highs = lows + spans
+        lows = np.concatenate((lows, np.zeros_like(lows)), axis=1)
+        highs = np.concatenate((np.minimum(highs, tau), np.maximum(highs - tau, 0.0)), axis=1)
+        angles = np.concatenate((lows, highs), axis=1)
+        steps = np.concatenate((np.ones_like(lows, dtype=int), -np.ones_like(highs, dtype=int)), axis=1)
+        order = np.lexsort((steps, angles), axis=-1)
+        crossings = int(np.cumsum(np.take_along_axis(steps, order, axis=-1), axis=-1).max(initial=0))
+
+        return max(1, crossings // 2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_profile(self, context: Context) -> Tuple[ScadWidget, int]:
+        """
+        Returns the profile of the hole and its convexity.
+
+        :param context: The build context.
+        """
+        nodes = self._create_profile_nodes(context)
+
+        return Polygon(points=nodes), self._real_convexity(context, nodes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _build_hole(self, context: Context) -> ScadWidget:
@@ -84,4 +319,322 @@ class HoleRotationMixin(ABC):
 
         return hole
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build_rough_hole(self, context: Context) -> ScadWidget:
+        """
+        Builds a hole without a top and a bottom profile from cylinders and truncated cones.
+
+        :param context: The build context.
+        """
+        sections = self._create_sections(context)
+        fragments = self._create_section_fragments(context, sections)
+
+        widgets = []
+        for (z, height, bottom_radius, top_radius), fn in zip(sections, fragments):
+            if abs(bottom_radius - top_radius) <= context.delta:
+                section = Cylinder(height=height, radius=top_radius, fa=self.fa, fs=self.fs, fn=fn)
+            else:
+                section = Cone(height=height,
+                               bottom_radius=bottom_radius,
+                               top_radius=top_radius,
+                               fa=self.fa,
+                               fs=self.fs,
+                               fn=fn)
+            if z != 0.0:
+                section = Translate3D(z=z, child=section)
+            widgets.append(section)
+
+        if len(widgets) == 1:
+            return widgets[0]
+
+        return Union(children=widgets)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _real_fragments(self, context: Context, radius: float) -> int:
+        """
+        Replicates the OpenSCAD logic to calculate the number of fragments of a rotational extrusion.
+
+        :param context: The build context.
+        :param radius: The largest radius of the profile.
+        """
+        fn = self.real_fn(context)
+        if fn is None:
+            fn = context.fn
+        if fn > 0:
+            return max(fn, 3)
+
+        fa = context.fa if self.fa is None else self.fa
+        fs = context.fs if self.fs is None else self.fs
+
+        return int(math.ceil(max(min(360.0 / fa, radius * 2.0 * math.pi / fs), 5.0)))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _sweep_angles(fragments: int, center_to_center: float) -> Tuple[Any, Any]:
+        """
+        Returns the angles (in degrees) at which the profile of a hole is swept around the z-axis and the offsets of
+        the swept profiles along the y-axis. As the rotational extrusion by OpenSCAD, the sweep of a round hole starts at
+        180 degrees, i.e., with an odd number of fragments, the angles are offset by half a fragment. For a slotted
+        hole, the angles of 0, 180, and 360 degrees are included in both the halve of the sweep at positive y and the
+        halve at negative y.
+
+        :param fragments: The number of fragments in 360 degrees.
+        :param center_to_center: The distance between two centers of the slotted hole.
+        """
+        np = HoleRotationMixin._numpy()
+
+        angles = np.arange(fragments) * (360.0 / fragments)
+        if center_to_center == 0.0:
+            if fragments % 2 == 1:
+                angles += 180.0 / fragments
+
+            return angles, np.zeros(fragments)
+
+        upper = np.union1d(angles[angles <= 180.0], [180.0])
+        lower = np.union1d(angles[angles >= 180.0], [180.0, 360.0])
+
+        return (np.concatenate((upper, lower)),
+                np.concatenate((np.full(len(upper), 0.5 * center_to_center),
+                                np.full(len(lower), -0.5 * center_to_center))))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _count_sweep_facets(context: Context, nodes: List[Vector2], angles: int, transitions: int) -> int:
+        """
+        Returns the number of triangles of the sides of a hole swept around the z-axis. Each side of the profile yields
+        a quadrilateral, i.e., two triangles, per pair of consecutive angles. At the z-axis, a quadrilateral is reduced
+        to a triangle, unless the offsets of the pair of angles differ.
+
+        :param context: The build context.
+        :param nodes: The nodes of the right halve of the cross-section of the hole.
+        :param angles: The number of angles of the sweep.
+        :param transitions: The number of pairs of consecutive angles with different offsets.
+        """
+        on_axis = [node.x <= context.delta for node in nodes]
+
+        facets = 0
+        for index in range(len(nodes)):
+            if on_axis[index] and on_axis[index - 1]:
+                continue
+            if on_axis[index] or on_axis[index - 1]:
+                facets += angles + transitions
+            else:
+                facets += 2 * angles
+
+        return facets
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_hole_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering the hole as a rotational extrusion of its profile.
+
+        :param context: The build context.
+        """
+        nodes = self._create_profile_nodes(context)
+        fragments = self._real_fragments(context, max(node.x for node in nodes))
+
+        return HoleCost(fragments=fragments,
+                        vertices=len(nodes),
+                        facets=self._count_sweep_facets(context, nodes, fragments, 0),
+                        nodes=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_polyhedron_cost(self, context: Context, center_to_center: float = 0.0) -> HoleCost:
+        """
+        Returns the estimated cost of rendering the hole as a polyhedron, see _build_polyhedron().
+
+        :param context: The build context.
+        :param center_to_center: The distance between two centers of the slotted hole.
+        """
+        nodes = self._create_profile_nodes(context)
+        fragments = self._real_fragments(context, max(node.x for node in nodes))
+        angles, _ = self._sweep_angles(fragments, center_to_center)
+        transitions = 0 if center_to_center == 0.0 else 2
+
+        return HoleCost(fragments=fragments,
+                        vertices=len(nodes),
+                        facets=self._count_sweep_facets(context, nodes, len(angles), transitions),
+                        nodes=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_rough_hole_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering a hole without a top and a bottom profile from cylinders and truncated
+        cones, see _build_rough_hole(). Each section has two triangles per fragment on its side and a cap at each end.
+
+        :param context: The build context.
+        """
+        sections = self._create_sections(context)
+        fragments = self._create_section_fragments(context, sections)
+
+        facets = 0
+        nodes = 0 if len(sections) == 1 else 1
+        largest_fn = 0
+        for (z, _, bottom_radius, top_radius), fn in zip(sections, fragments):
+            if fn is None:
+                fn = self._real_fragments(context, max(bottom_radius, top_radius))
+            largest_fn = max(largest_fn, fn)
+            facets += 4 * fn - 4
+            nodes += 1 if z == 0.0 else 2
+
+        return HoleCost(fragments=largest_fn,
+                        vertices=len(self._create_profile_nodes(context)),
+                        facets=facets,
+                        nodes=nodes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def bounding_box(self, context: Context) -> HoleBoundingBox:
+        """
+        Returns the bounding box of the hole, including the extensions by eps and the overhangs of the profiles,
+        computed without building the hole. The bounding box encloses the true solid of revolution, and hence, the
+        faceted hole too.
+
+        :param context: The build context.
+        """
+        return self._compute_bounding_box(context, 0.0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _compute_bounding_box(self, context: Context, center_to_center: float) -> HoleBoundingBox:
+        """
+        Returns the bounding box of the hole. A slotted hole extends by half the center-to-center distance in both
+        directions along the y-axis.
+
+        :param context: The build context.
+        :param center_to_center: The distance between two centers of the slotted hole.
+        """
+        nodes = self._create_profile_nodes(context)
+        radius = max(node.x for node in nodes)
+        length = radius + 0.5 * center_to_center
+
+        return HoleBoundingBox(minimum=Vector3(-radius, -length, min(node.y for node in nodes)),
+                               maximum=Vector3(radius, length, max(node.y for node in nodes)))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def volume(self, context: Context, faceted: bool = False) -> float:
+        """
+        Returns the volume of the hole, including the extensions by eps, computed without building the hole. The exact
+        volume is the volume of the true solid of revolution. The faceted volume is the volume of the hole as rendered
+        by OpenSCAD given the number of fragments, the level of detail, and the facet budget of the hole.
+
+        :param context: The build context.
+        :param faceted: Whether to return the faceted volume instead of the exact volume.
+        """
+        return self._compute_volume(context, 0.0, faceted)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _compute_volume(self, context: Context, center_to_center: float, faceted: bool) -> float:
+        """
+        Returns the volume of the hole. By Pappus's theorem, the volume of the solid of revolution is 2π times the first
+        moment of area of the profile about the z-axis. A slotted hole adds a prism with the cross-section of the hole
+        (i.e., twice the area of the profile) and a length of the center-to-center distance. Rotating a profile with n
+        fragments scales the area of each horizontal slice by n sin(2π/n) / 2π. The faceted volume is the volume of the
+        hole as rendered, see _rendered_copy().
+
+        For an odd number of fragments, the faceted slices of a slotted hole differ: a polyhedron sweeps both halves of
+        the hole through 0 and 180 degrees, and the circles of a slotted hole without profiles have a vertex at 0
+        degrees but not at 180 degrees, i.e., the slot of such a hole is narrower than twice the radius.
+
+        :param context: The build context.
+        :param center_to_center: The distance between two centers of the slotted hole.
+        :param faceted: Whether to return the faceted volume instead of the exact volume.
+        """
+        if faceted:
+            hole = self._rendered_copy(context)
+            if hole is not self:
+                return HoleRotationMixin._compute_volume(hole, context, center_to_center, faceted)
+
+        if faceted and not self.polyhedron and \
+                isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            # Each section of a rough hole is a cylinder or truncated cone with a number of fragments of its own.
+            sections = self._create_sections(context)
+            fragments = self._create_section_fragments(context, sections)
+            volume = 0.0
+            for (_, height, bottom_radius, top_radius), fn in zip(sections, fragments):
+                if fn is None:
+                    fn = self._real_fragments(context, max(bottom_radius, top_radius))
+                scale = 0.5 * fn * math.sin(2.0 * math.pi / fn)
+                width = 1.0 if fn % 2 == 0 else 0.5 * (1.0 + math.cos(math.pi / fn))
+                volume += scale * height * (bottom_radius ** 2 + bottom_radius * top_radius + top_radius ** 2) / 3.0
+                volume += width * center_to_center * height * (bottom_radius + top_radius)
+
+            return volume
+
+        nodes = self._create_profile_nodes(context)
+        area = 0.0
+        moment = 0.0
+        for index in range(len(nodes)):
+            start = nodes[index - 1]
+            end = nodes[index]
+            cross = start.x * end.y - end.x * start.y
+            area += cross
+            moment += (start.x + end.x) * cross
+        area = 0.5 * abs(area)
+        volume = math.pi * abs(moment) / 3.0
+
+        if faceted:
+            fn = self._real_fragments(context, max(node.x for node in nodes))
+            if self.polyhedron and center_to_center != 0.0 and fn % 2 == 1:
+                scale = 0.5 * (fn - 1) * math.sin(2.0 * math.pi / fn) + math.sin(math.pi / fn)
+            else:
+                scale = 0.5 * fn * math.sin(2.0 * math.pi / fn)
+            volume *= scale / math.pi
+
+        return volume + 2.0 * area * center_to_center
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build_polyhedron(self, context: Context, center_to_center: float = 0.0) -> ScadWidget:
+        """
+        Builds the hole as a polyhedron by sweeping the profile of the hole around the z-axis. For a round hole, the
+        vertices are at the same positions as the vertices of the rotational extrusion of the profile. For a slotted
+        hole, the halve of the sweep at positive y is translated by half the center-to-center distance along the y-axis
+        and the other halve by minus half the center-to-center distance. With an even number of fragments, the vertices
+        are at the same positions as the vertices of the rotational extrusions and the slot. With an odd number of
+        fragments, the rotational extrusions have no vertices at 0 and 180 degrees, hence, the vertices of the
+        polyhedron differ slightly from the vertices of the rotational extrusions and the slot.
+
+        :param context: The build context.
+        :param center_to_center: The distance between two centers of the slotted hole.
+        """
+        np = HoleRotationMixin._numpy()
+
+        profile_nodes = self._create_profile_nodes(context)
+        nodes = np.array([(node.x, node.y) for node in profile_nodes])
+        nodes[nodes[:, 0] <= context.delta, 0] = 0.0
+        on_axis = nodes[:, 0] == 0.0
+
+        fragments = self._real_fragments(context, float(nodes[:, 0].max()))
+        angles, offsets = self._sweep_angles(fragments, center_to_center)
+        radians = np.radians(angles)
+        groups, group = np.unique(offsets, return_inverse=True)
+
+        # The vertices at the boundary of the hole, one ring per angle, followed by the vertices on the z-axis, one per
+        # distinct offset.
+        boundary = nodes[~on_axis]
+        axis = nodes[on_axis]
+        boundary_points = np.stack((boundary[:, 0, None] * np.cos(radians),
+                                    boundary[:, 0, None] * np.sin(radians) + offsets,
+                                    np.broadcast_to(boundary[:, 1, None], (len(boundary), len(angles)))), axis=-1)
+        axis_points = np.stack((np.zeros((len(axis), len(groups))),
+                                np.broadcast_to(groups, (len(axis), len(groups))),
+                                np.broadcast_to(axis[:, 1, None], (len(axis), len(groups)))), axis=-1)
+        points = np.concatenate((boundary_points.reshape(-1, 3), axis_points.reshape(-1, 3)))
+        points = [Vector3(x, y, z) for x, y, z in points.tolist()]
+
+        indexes = np.empty((len(nodes), len(angles)), dtype=int)
+        indexes[~on_axis] = np.arange(len(boundary) * len(angles)).reshape(len(boundary), len(angles))
+        indexes[on_axis] = len(boundary) * len(angles) + np.arange(len(axis))[:, None] * len(groups) + group
+
+        # One quadrilateral per side of the profile and pair of consecutive angles, reduced to a triangle at the z-axis.
+        sides = np.flatnonzero(~(on_axis & np.roll(on_axis, -1)))
+        quads = np.stack((indexes[sides],
+                          np.roll(indexes[sides], -1, axis=1),
+                          np.roll(indexes[(sides + 1) % len(nodes)], -1, axis=1),
+                          indexes[(sides + 1) % len(nodes)]), axis=-1).reshape(-1, 4)
+
+        faces = []
+        for quad in quads.tolist():
+            faces.append([points[index] for i, index in enumerate(quad) if index != quad[i - 1]])
+
+        return Polyhedron(faces=faces, convexity=self._real_convexity(context, profile_nodes))
+
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,19 +1,25 @@
 import abc
 from abc import ABC
-from typing import Tuple
+from typing import List, Tuple
 
 from super_scad.boolean.Union import Union
+from super_scad.d2.Circle import Circle
 from super_scad.d2.Polygon import Polygon
+from super_scad.d3.Cone import Cone
 from super_scad.d3.LinearExtrude import LinearExtrude
 from super_scad.d3.RotateExtrude import RotateExtrude
 from super_scad.scad.Context import Context
 from super_scad.scad.ScadWidget import ScadWidget
-from super_scad.transformation.Flip2D import Flip2D
+from super_scad.transformation.Hull import Hull
 from super_scad.transformation.Rotate3D import Rotate3D
 from super_scad.transformation.Translate3D import Translate3D
+from super_scad.type import Vector2, Vector3
 from super_scad_smooth_profile.SmoothProfileParams import SmoothProfileParams
 
+from super_scad_hole.HoleCost import HoleCost
 from super_scad_hole.HoleRotationMixin import HoleRotationMixin
+from super_scad_hole.private.PrivateExpressionCommand import PrivateExpressionCommand
+from super_scad_hole.private.PrivateFor import PrivateFor
 
 
 # class HoleRotationSlottedMixin(HoleRotationMixin, ABC):
@@ -48,6 +54,154 @@ class HoleRotationSlottedMixin(ABC):
         """
         raise NotImplementedError()
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _create_sections(self, context: Context) -> List[Tuple[float, float, float, float]]:
+        """
+        Returns the sections of a hole with rough profiles.
+
+        :param context: The build context.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _create_section_fragments(self,
+                                  context: Context,
+                                  sections: List[Tuple[float, float, float, float]]) -> List[int | None]:
+        """
+        Returns the number of fragments of each section of a hole with rough profiles.
+
+        :param context: The build context.
+        :param sections: The sections of the hole.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _create_profile_nodes(self, context: Context) -> List[Vector2]:
+        """
+        Returns the nodes of the right halve of the cross-section of the hole.
+
+        :param context: The build context.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _real_fragments(self, context: Context, radius: float) -> int:
+        """
+        Returns the number of fragments of a rotational extrusion.
+
+        :param context: The build context.
+        :param radius: The largest radius of the profile.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _estimate_hole_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering the hole as a rotational extrusion of its profile.
+
+        :param context: The build context.
+        """
+        raise NotImplementedError()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_slotted_rough_hole_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering a slotted hole without a top and a bottom profile, see
+        _build_slotted_rough_hole(). The outline of each section is the hull of two circles with two vertices more than
+        a single circle.
+
+        :param context: The build context.
+        """
+        sections = self._create_sections(context)
+        fragments = self._create_section_fragments(context, sections)
+
+        facets = 0
+        nodes = 0 if len(sections) == 1 else 1
+        largest_fn = 0
+        for (z, _, bottom_radius, top_radius), fn in zip(sections, fragments):
+            if fn is None:
+                fn = self._real_fragments(context, max(bottom_radius, top_radius))
+            largest_fn = max(largest_fn, fn)
+            facets += 4 * fn + 4
+            nodes += 5 if abs(bottom_radius - top_radius) <= context.delta else 4
+            if z != 0.0:
+                nodes += 1
+
+        return HoleCost(fragments=largest_fn,
+                        vertices=len(self._create_profile_nodes(context)),
+                        facets=facets,
+                        nodes=nodes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_slotted_hole_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering a slotted hole with a top or a bottom profile, see
+        _build_slotted_hole(), i.e., two rotational extrusions and a linear extrusion of the cross-section of the hole.
+
+        :param context: The build context.
+        """
+        rotation = self._estimate_hole_cost(context)
+        nodes = self._create_profile_nodes(context)
+        on_axis = [node.x <= context.delta for node in nodes]
+        edges = sum(1 for index in range(len(nodes)) if not (on_axis[index] and on_axis[index - 1]))
+
+        # The cross-section has two edges per edge of the profile off the z-axis. Each edge yields two triangles on the
+        # side of the slot, and each end of the slot is a cap of two triangles less than edges.
+        return HoleCost(fragments=rotation.fragments,
+                        vertices=rotation.vertices,
+                        facets=2 * rotation.facets + 4 * edges + 2 * (2 * edges - 2),
+                        nodes=10)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build_slotted_rough_hole(self, context: Context) -> ScadWidget:
+        """
+        Builds a slotted hole without a top and a bottom profile. Each cylindrical section of the hole is a linear
+        extrusion of a stadium, each conical section is the hull of the two truncated cones at the ends of the slot.
+
+        :param context The build context.
+        """
+        sections = self._create_sections(context)
+        fragments = self._create_section_fragments(context, sections)
+
+        widgets = []
+        for (z, height, bottom_radius, top_radius), fn in zip(sections, fragments):
+            if abs(bottom_radius - top_radius) <= context.delta:
+                section = Circle(radius=top_radius, fa=self.fa, fs=self.fs, fn=fn)
+                section = PrivateExpressionCommand(command='translate', expressions={'v': 'v'}, child=section)
+                section = PrivateFor(variable='v',
+                                     values=[Vector2(0.0, 0.5 * self.center_to_center),
+                                             Vector2(0.0, -0.5 * self.center_to_center)],
+                                     is_length=True,
+                                     child=section)
+                section = LinearExtrude(height=height, child=Hull(children=[section]))
+            else:
+                section = Cone(height=height,
+                               bottom_radius=bottom_radius,
+                               top_radius=top_radius,
+                               fa=self.fa,
+                               fs=self.fs,
+                               fn=fn)
+                section = PrivateExpressionCommand(command='translate', expressions={'v': 'v'}, child=section)
+                section = PrivateFor(variable='v',
+                                     values=[Vector3(0.0, 0.5 * self.center_to_center, 0.0),
+                                             Vector3(0.0, -0.5 * self.center_to_center, 0.0)],
+                                     is_length=True,
+                                     child=section)
+                section = Hull(children=[section])
+            if z != 0.0:
+                section = Translate3D(z=z, child=section)
+            widgets.append(section)
+
+        if len(widgets) == 1:
+            return widgets[0]
+
+        return Union(children=widgets)
+
     # ------------------------------------------------------------------------------------------------------------------
     def _build_slotted_hole(self, context: Context) -> ScadWidget:
         """
@@ -62,14 +216,22 @@ class HoleRotationSlottedMixin(ABC):
                              fs=self.fs,
                              fn=self.real_fn(context),
                              child=profile)
-        hole1 = Translate3D(y=0.5 * self.center_to_center, child=hole)
-        hole2 = Translate3D(y=-0.5 * self.center_to_center, child=hole)
+        hole = PrivateExpressionCommand(command='translate', expressions={'v': 'v'}, child=hole)
+        hole = PrivateFor(variable='v',
+                          values=[Vector3(0.0, 0.5 * self.center_to_center, 0.0),
+                                  Vector3(0.0, -0.5 * self.center_to_center, 0.0)],
+                          is_length=True,
+                          child=hole)
 
-        profile = Union(children=[profile, Flip2D(horizontal=True, child=profile)])
+        profile = PrivateExpressionCommand(command='rotate', expressions={'a': 'a'}, child=profile)
+        profile = PrivateFor(variable='a',
+                             values=[Vector2(0.0, 0.0), Vector2(0.0, 180.0)],
+                             is_angle=True,
+                             child=profile)
         slot = LinearExtrude(height=self.center_to_center, center=True, convexity=convexity, child=profile)
         slot = Rotate3D(angle_x=90.0, child=slot)
 
-        hole = Union(children=[hole1, slot, hole2])
+        hole = Union(children=[hole, slot])
 
         return hole
 
@@ -14,7 +14,11 @@ from super_scad_smooth_profile.SmoothProfileParams import SmoothProfileParams
 
 from super_scad_hole.Hole import Hole
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleCost import HoleCost
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
 from super_scad_hole.HoleRotationMixin import HoleRotationMixin
+from super_scad_hole.HoleSimpleSpec import HoleSimpleSpec
 
 
 class HoleSimple(Hole, HoleRotationMixin):
@@ -37,7 +41,12 @@ class HoleSimple(Hole, HoleRotationMixin):
                  fa: float | None = None,
                  fs: float | None = None,
                  fn: int | None = None,
-                 fn4n: bool | None = None):
+                 fn4n: bool | None = None,
+                 max_deviation: float | None = None,
+                 polyhedron: bool = False,
+                 segmented: bool = False,
+                 convexity: int | None = None,
+                 detail: HoleDetail | None = None):
         """
         Object constructor.
 
@@ -52,6 +61,15 @@ class HoleSimple(Hole, HoleRotationMixin):
         :param fs: The minimum circumferential length of each fragment.
         :param fn: The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
         :param fn4n: Whether to create a hole with a multiple of 4 vertices.
+        :param max_deviation: The maximum deviation between the true circle and its facets. Overrides fa, fs, and
+                              fn. With fn4n, the number of fragments is rounded up to a multiple of 4.
+        :param polyhedron: Whether to create the hole as an explicit polyhedron instead of by extrusions.
+        :param segmented: Whether to create each section of a hole without profiles with its own number of
+                          fragments, scaled to the radius of the section.
+        :param convexity: The convexity of the extrusions of the hole. None for the minimal convexity computed from
+                          the cross-section of the hole.
+        :param detail: The level of detail of the hole. None for the level of detail of the policy, see
+                       HoleDetailPolicy.
         """
         Hole.__init__(self,
                       alignment=alignment,
@@ -63,7 +81,12 @@ class HoleSimple(Hole, HoleRotationMixin):
                       fa=fa,
                       fs=fs,
                       fn=fn,
-                      fn4n=fn4n)
+                      fn4n=fn4n,
+                      max_deviation=max_deviation,
+                      polyhedron=polyhedron,
+                      segmented=segmented,
+                      convexity=convexity,
+                      detail=detail)
 
         self._height: float | None = height
         """
@@ -80,7 +103,7 @@ class HoleSimple(Hole, HoleRotationMixin):
         The diameter of the hole.
         """
 
-        self.__validate_arguments(locals())
+        HoleInstrumentation.call(self, 'validate', self.__validate_arguments, locals())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -110,6 +133,7 @@ class HoleSimple(Hole, HoleRotationMixin):
         Returns the radius of the hole.
         """
         if self._radius is None:
+            HoleInstrumentation.count(self._instrumented, 'radius')
             self._radius = 0.5 * self._diameter
 
         return self._radius
@@ -121,24 +145,48 @@ class HoleSimple(Hole, HoleRotationMixin):
         Returns the diameter of the hole.
         """
         if self._diameter is None:
+            HoleInstrumentation.count(self._instrumented, 'diameter')
             self._diameter = 2.0 * self._radius
 
         return self._diameter
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_spec(self) -> HoleSimpleSpec:
+        """
+        Returns the immutable and hashable specification of this hole.
+        """
+        return HoleSimpleSpec(height=self.height,
+                              radius=self.radius,
+                              diameter=self.diameter,
+                              **self._spec_args())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def outer_radius(self) -> float:
+        """
+        Returns the nominal outer radius of the hole, i.e., the radius of the hole.
+        """
+        return self.radius
+
     # ------------------------------------------------------------------------------------------------------------------
     def real_fn(self, context: Context) -> int | None:
         """
         Returns the real fixed number of fragments in 360 degrees.
         """
+        if self.max_deviation is not None:
+            return self._max_deviation_fn(self.radius)
+
         if self.fn4n:
             return Radius2Sides4n.r2sides4n(context, self.radius)
 
         return self.fn
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _build_cylinder(self) -> ScadWidget:
+    def _build_cylinder(self, context: Context) -> ScadWidget:
         """
         Build a simple hole without a top and a bottom profile.
+
+        :param context: The build context.
         """
         hole = Cylinder(height=self.height,
                         diameter=self.diameter,
@@ -148,14 +196,42 @@ class HoleSimple(Hole, HoleRotationMixin):
                         extend_by_eps_radius=self.extend_by_eps_boundary,
                         fa=self.fa,
                         fs=self.fs,
-                        fn=self.fn,
-                        fn4n=self.fn4n)
+                        fn=self.real_fn(context) if self.max_deviation is not None else self.fn,
+                        fn4n=None if self.max_deviation is not None else self.fn4n)
 
         if self.alignment == HoleAlignment.TOP:
             hole = Translate3D(z=-self.height, child=hole)
 
         return hole
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _estimate_cylinder_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering a simple hole without a top and a bottom profile, see
+        _build_cylinder().
+
+        :param context: The build context.
+        """
+        radius = self.radius + context.eps if self.extend_by_eps_boundary else self.radius
+        if self.max_deviation is not None or self.fn4n:
+            fragments = self.real_fn(context)
+        else:
+            fragments = self._real_fragments(context, radius)
+
+        # The cylinder is translated by the cylinder itself unless centered, and by this hole when aligned at the top.
+        center = self.alignment == HoleAlignment.CENTER
+        nodes = 1
+        if not (center and self.extend_by_eps_top == self.extend_by_eps_bottom) and \
+                (center or self.extend_by_eps_bottom):
+            nodes += 1
+        if self.alignment == HoleAlignment.TOP:
+            nodes += 1
+
+        return HoleCost(fragments=fragments,
+                        vertices=len(self._create_profile_nodes(context)),
+                        facets=4 * fragments - 4,
+                        nodes=nodes)
+
     # ------------------------------------------------------------------------------------------------------------------
     def _create_polygon(self) -> Tuple[Polygon, SmoothProfileParams, SmoothProfileParams]:
         """
@@ -198,14 +274,32 @@ class HoleSimple(Hole, HoleRotationMixin):
         return Polygon(points=nodes, extend_by_eps_sides=extend_by_eps_sides), top_params, bottom_params
 
     # ------------------------------------------------------------------------------------------------------------------
-    def build(self, context: Context) -> ScadWidget:
+    def _estimate_cost(self, context: Context) -> HoleCost:
+        """
+        Returns the estimated cost of rendering this hole in full detail, computed without building this hole.
+
+        :param context: The build context.
+        """
+        if self.polyhedron:
+            return HoleRotationMixin._estimate_polyhedron_cost(self, context)
+
+        if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
+            return self._estimate_cylinder_cost(context)
+
+        return HoleRotationMixin._estimate_hole_cost(self, context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build(self, context: Context) -> ScadWidget:
         """
         Builds a SuperSCAD widget.
 
         :param context: The build context.
         """
+        if self.polyhedron:
+            return HoleRotationMixin._build_polyhedron(self, context)
+
         if isinstance(self.profile_top, Rough) and isinstance(self.profile_bottom, Rough):
-            return self._build_cylinder()
+            return self._build_cylinder(context)
 
         return HoleRotationMixin._build_hole(self, context)
 
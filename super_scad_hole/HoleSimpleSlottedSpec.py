@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from super_scad_hole.HoleSimpleSpec import HoleSimpleSpec
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class HoleSimpleSlottedSpec(HoleSimpleSpec):
+    """
+    The specification of a slotted simple hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    overall_length: float
+    """
+    The overall length of the slotted hole.
+    """
+
+    center_to_center: float
+    """
+    The distance between two centers of the slotted hole.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
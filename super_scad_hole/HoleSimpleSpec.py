@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from super_scad_hole.HoleSpec import HoleSpec
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class HoleSimpleSpec(HoleSpec):
+    """
+    The specification of a simple hole.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    height: float
+    """
+    The height of the hole.
+    """
+
+    radius: float
+    """
+    The radius of the hole.
+    """
+
+    diameter: float
+    """
+    The diameter of the hole.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Any, Hashable, Tuple
+
+from super_scad_smooth_profile.SmoothProfile3D import SmoothProfile3D
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleDetail import HoleDetail
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class HoleSpec:
+    """
+    The immutable and hashable specification of a hole with all derived dimensions resolved. Two specifications are
+    equal if and only if they are of the same class and all their fields, including the fields of the profiles, are
+    equal.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    alignment: HoleAlignment
+    """
+    The alignment of the whole relative to the xy-plane.
+    """
+
+    profile_top: SmoothProfile3D
+    """
+    The profile of the top of the hole.
+    """
+
+    profile_bottom: SmoothProfile3D
+    """
+    The profile of the bottom of the hole.
+    """
+
+    extend_by_eps_top: bool
+    """
+    Whether to extend the top of the hole by eps for a clear overlap.
+    """
+
+    extend_by_eps_bottom: bool
+    """
+    Whether to extend the bottom of the hole by eps for a clear overlap.
+    """
+
+    extend_by_eps_boundary: bool
+    """
+    Whether to extend the boundary of the hole by eps for a clear overlap.
+    """
+
+    fa: float | None
+    """
+    The minimum angle (in degrees) of each fragment.
+    """
+
+    fs: float | None
+    """
+    The minimum circumferential length of each fragment.
+    """
+
+    fn: int | None
+    """
+    The fixed number of fragments in 360 degrees. Values of 3 or more override fa and fs.
+    """
+
+    fn4n: bool | None
+    """
+    Whether to create a hole with a multiple of 4 vertices.
+    """
+
+    max_deviation: float | None
+    """
+    The maximum deviation between the true circle and its facets.
+    """
+
+    polyhedron: bool
+    """
+    Whether to create the hole as an explicit polyhedron instead of by extrusions.
+    """
+
+    segmented: bool
+    """
+    Whether to create each section of a hole without profiles with its own number of fragments.
+    """
+
+    convexity: int | None
+    """
+    The convexity of the extrusions of the hole.
+    """
+
+    detail: HoleDetail | None
+    """
+    The level of detail of the hole.
+    """
+
+    _key: Tuple | None = field(default=None, init=False, repr=False)
+    """
+    The canonical and hashable representation of this specification, computed on first use only.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __freeze(value: Any) -> Hashable:
+        """
+        Returns a canonical and hashable representation of a value.
+
+        :param value: The value.
+        """
+        if value is None or isinstance(value, (bool, int, float, str, Enum)):
+            return value
+
+        if isinstance(value, (list, tuple)):
+            return tuple(HoleSpec.__freeze(element) for element in value)
+
+        if isinstance(value, dict):
+            return dict, tuple(sorted((repr(key), HoleSpec.__freeze(element)) for key, element in value.items()))
+
+        # The state of an object is its attributes, both in its __dict__ and in its slots.
+        state = dict(vars(value)) if hasattr(value, '__dict__') else {}
+        has_slots = False
+        for cls in type(value).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__'):
+                    has_slots = True
+                    if hasattr(value, name):
+                        state[name] = getattr(value, name)
+        if hasattr(value, '__dict__') or has_slots:
+            return type(value), tuple(sorted((name, HoleSpec.__freeze(element)) for name, element in state.items()))
+
+        # Values without attributes, e.g., NumPy scalars, are used as is if hashable.
+        try:
+            hash(value)
+        except TypeError:
+            return type(value), repr(value)
+
+        return value
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __key(self) -> Tuple:
+        """
+        Returns the canonical and hashable representation of this specification.
+        """
+        if self._key is None:
+            key = type(self), tuple(HoleSpec.__freeze(getattr(self, spec_field.name))
+                                    for spec_field in fields(self) if spec_field.init)
+            object.__setattr__(self, '_key', key)
+
+        return self._key
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, HoleSpec):
+            return NotImplemented
+
+        return self.__key() == other.__key()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __hash__(self) -> int:
+        return hash(self.__key())
+
+# ----------------------------------------------------------------------------------------------------------------------
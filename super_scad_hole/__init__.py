@@ -0,0 +1,63 @@
+import importlib
+from types import ModuleType
+from typing import List
+
+__all__ = ['Hole',
+           'HoleAlignment',
+           'HoleArray',
+           'HoleBatch',
+           'HoleBoundingBox',
+           'HoleBuildCache',
+           'HoleCost',
+           'HoleCounterbored',
+           'HoleCounterboredSlotted',
+           'HoleCounterboredSlottedSpec',
+           'HoleCounterboredSpec',
+           'HoleCounterdrilled',
+           'HoleCounterdrilledSlotted',
+           'HoleCounterdrilledSlottedSpec',
+           'HoleCounterdrilledSpec',
+           'HoleCountersunk',
+           'HoleCountersunkSlotted',
+           'HoleCountersunkSlottedSpec',
+           'HoleCountersunkSpec',
+           'HoleDetail',
+           'HoleDetailPolicy',
+           'HoleFacetBudget',
+           'HoleInstrumentation',
+           'HoleLayout',
+           'HolePattern',
+           'HoleProfileSideExtender',
+           'HoleRotationMixin',
+           'HoleRotationSlottedMixin',
+           'HoleSimple',
+           'HoleSimpleSlotted',
+           'HoleSimpleSlottedSpec',
+           'HoleSimpleSpec',
+           'HoleSpec']
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def __getattr__(name: str) -> ModuleType:
+    """
+    Returns a public module of this package, importing the module on first access only, such that importing this
+    package does not import the modules of all holes. Each public module is named after the class it defines, e.g.,
+    super_scad_hole.HoleSimple.HoleSimple. After its first import, a module is an ordinary attribute of this package,
+    set by the import system. Hence, the attributes of this package are the modules and not the classes.
+
+    :param name: The name of the module.
+    """
+    if name not in __all__:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return importlib.import_module(f'{__name__}.{name}')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def __dir__() -> List[str]:
+    """
+    Returns the names of the attributes of this package, including the public modules not yet imported.
+    """
+    return sorted(set(globals()) | set(__all__))
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,32 @@
+from typing import Dict
+
+from super_scad.private.PrivateSingleChildOpenScadCommand import PrivateSingleChildOpenScadCommand
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+
+
+class PrivateExpressionCommand(PrivateSingleChildOpenScadCommand):
+    """
+    Widget for OpenSCAD commands with a single child and with arguments given as OpenSCAD expressions, e.g., a
+    reference to a loop variable.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, *, command: str, expressions: Dict[str, str], child: ScadWidget):
+        """
+        Object constructor.
+
+        :param command: The name of the OpenSCAD command.
+        :param expressions: The arguments of the OpenSCAD command as OpenSCAD expressions.
+        :param child: The child SuperSCAD widget of this single-child parent.
+        """
+        PrivateSingleChildOpenScadCommand.__init__(self, command=command, args=expressions, child=child)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def generate_args(self, context: Context) -> str:
+        """
+        Returns the arguments of the OpenSCAD command.
+        """
+        return '({})'.format(', '.join(f'{key} = {value}' for key, value in self._args.items()))
+
+# ----------------------------------------------------------------------------------------------------------------------
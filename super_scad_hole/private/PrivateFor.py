@@ -0,0 +1,81 @@
+from typing import Any, List, Set, Tuple
+
+from super_scad.private.PrivateSingleChildOpenScadCommand import PrivateSingleChildOpenScadCommand
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+from super_scad.util.Formatter import Formatter
+
+
+class PrivateFor(PrivateSingleChildOpenScadCommand):
+    """
+    Instantiates its child widget once for each value of a loop variable. See
+    https://en.wikibooks.org/wiki/OpenSCAD_User_Manual/Conditional_and_Iterator_Functions#For_Loop.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 *,
+                 variable: str,
+                 values: List[Any],
+                 is_angle: bool | Tuple[bool, ...] = False,
+                 is_length: bool | Tuple[bool, ...] = False,
+                 child: ScadWidget):
+        """
+        Object constructor.
+
+        :param variable: The name of the loop variable.
+        :param values: The values of the loop variable.
+        :param is_angle: Whether the values are angles. When the values are tuples, whether each element of the tuples
+                         is an angle.
+        :param is_length: Whether the values are lengths. When the values are tuples, whether each element of the
+                          tuples is a length.
+        :param child: The child widget to be instantiated.
+        """
+        PrivateSingleChildOpenScadCommand.__init__(self, command='for', args={variable: values}, child=child)
+
+        self._variable: str = variable
+        """
+        The name of the loop variable.
+        """
+
+        self._is_angle: bool | Tuple[bool, ...] = is_angle
+        """
+        Whether the values are angles.
+        """
+
+        self._is_length: bool | Tuple[bool, ...] = is_length
+        """
+        Whether the values are lengths.
+        """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _argument_angles(self) -> Set[str]:
+        """
+        Returns the set with arguments that are angles.
+        """
+        return {self._variable} if self._is_angle is True else set()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _argument_lengths(self) -> Set[str]:
+        """
+        Returns the set with arguments that are lengths.
+        """
+        return {self._variable} if self._is_length is True else set()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def generate_args(self, context: Context) -> str:
+        """
+        Returns the arguments of the OpenSCAD command.
+        """
+        if isinstance(self._is_angle, bool) and isinstance(self._is_length, bool):
+            return PrivateSingleChildOpenScadCommand.generate_args(self, context)
+
+        values = []
+        for value in self._args[self._variable]:
+            elements = [Formatter.format(context, element, is_angle=is_angle, is_length=is_length, unit=self.unit)
+                        for element, is_angle, is_length in zip(value, self._is_angle, self._is_length)]
+            values.append('[{}]'.format(', '.join(elements)))
+
+        return '({} = [{}])'.format(self._variable, ', '.join(values))
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,34 @@
+from super_scad.private.PrivateSingleChildOpenScadCommand import PrivateSingleChildOpenScadCommand
+from super_scad.scad.Context import Context
+from super_scad.scad.ScadWidget import ScadWidget
+
+
+class PrivateIf(PrivateSingleChildOpenScadCommand):
+    """
+    Instantiates its child widget only if a condition holds. See
+    https://en.wikibooks.org/wiki/OpenSCAD_User_Manual/Conditional_and_Iterator_Functions#If_Statement.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, *, condition: str, child: ScadWidget):
+        """
+        Object constructor.
+
+        :param condition: The condition as an OpenSCAD expression, e.g., $preview.
+        :param child: The child widget.
+        """
+        PrivateSingleChildOpenScadCommand.__init__(self, command='if', args={}, child=child)
+
+        self._condition: str = condition
+        """
+        The condition as an OpenSCAD expression.
+        """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def generate_args(self, context: Context) -> str:
+        """
+        Returns the arguments of the OpenSCAD command.
+        """
+        return f'({self._condition})'
+
+# ----------------------------------------------------------------------------------------------------------------------
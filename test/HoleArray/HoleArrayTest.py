@@ -0,0 +1,47 @@
+from super_scad.scad.Context import Context
+from super_scad.type import Vector2, Vector3
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleArray import HoleArray
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleSimpleSlotted import HoleSimpleSlotted
+from test.ScadTestCase import ScadTestCase
+
+
+class HoleArrayTest(ScadTestCase):
+    """
+    Test cases for HoleArray.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_positions(self):
+        """
+        Test an array of holes at multiple positions.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        hole = HoleCounterbored(height=10.0,
+                                diameter=2.0,
+                                counterbore_diameter=4.0,
+                                counterbore_height=2.0,
+                                alignment=HoleAlignment.TOP)
+        holes = HoleArray(hole=hole,
+                          positions=[Vector2(0.0, 0.0), Vector2(10.0, 0.0), Vector3(10.0, 10.0, -1.0)])
+
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_angles(self):
+        """
+        Test an array of rotated holes at multiple positions.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        hole = HoleSimpleSlotted(height=10.0, diameter=1.0, center_to_center=3.0, alignment=HoleAlignment.TOP)
+        holes = HoleArray(hole=hole,
+                          positions=[Vector2(0.0, 0.0), Vector2(10.0, 0.0), Vector2(10.0, 10.0)],
+                          angles=[0.0, 45.0, Vector3(0.0, 10.0, 90.0)])
+
+        self.assertScadCode(context, holes)
+
+# ----------------------------------------------------------------------------------------------------------------------
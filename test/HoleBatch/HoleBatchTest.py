@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+from super_scad.scad.Context import Context
+from super_scad.type import Vector2
+from super_scad_smooth_profiles.Chamfer import Chamfer
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleCountersunk import HoleCountersunk
+from super_scad_hole.HolePattern import HolePattern
+from super_scad_hole.HoleSimple import HoleSimple
+from test.ScadTestCase import ScadTestCase
+
+
+class HoleBatchTest(ScadTestCase):
+    """
+    Test cases for HoleBatch.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_columns(self):
+        """
+        Test a batch of countersunk holes given as columns.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        holes = HoleCountersunk.batch(positions=np.array([[0.0, 0.0], [10.0, 0.0], [20.0, 0.0], [30.0, 0.0]]),
+                                      height=10.0,
+                                      diameter=[2.0, 3.0, 2.0, 3.0],
+                                      countersink_diameter=np.array([4.0, 6.0, 4.0, 6.0]),
+                                      alignment=[HoleAlignment.TOP,
+                                                 HoleAlignment.TOP,
+                                                 HoleAlignment.TOP,
+                                                 HoleAlignment.BOTTOM])
+
+        self.assertEqual(4, holes.size)
+        self.assertEqual(3, len(holes.holes))
+
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_rows(self):
+        """
+        Test all invalid rows of a batch are reported at once.
+        """
+        with self.assertRaises(ValueError) as context:
+            HoleCountersunk.batch(positions=[[0.0, 0.0], [10.0, 0.0], [20.0, 0.0], [30.0, 0.0], [40.0, 0.0]],
+                                  height=[10.0, -1.0, 10.0, 10.0, 10.0],
+                                  radius=[None, None, None, None, 1.0],
+                                  diameter=[2.0, 2.0, 2.0, 5.0, 2.0],
+                                  countersink_diameter=4.0,
+                                  alignment=HoleAlignment.TOP)
+
+        message = str(context.exception)
+        self.assertNotIn('Row 0:', message)
+        self.assertIn('Row 1: height must be positive.', message)
+        self.assertNotIn('Row 2:', message)
+        self.assertIn('Row 3: countersink radius must be greater than radius.', message)
+        self.assertIn('Row 4: radius and diameter are exclusive.', message)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_other_columns(self):
+        """
+        Test columns of arguments other than dimensions keep their values.
+        """
+        chamfer = Chamfer(skew_length=0.2, side=1)
+        holes = HoleSimple.batch(positions=[(0.0, 0.0), (10.0, 0.0), (20.0, 0.0)],
+                                 height=5.0,
+                                 diameter=2.0,
+                                 alignment=HoleAlignment.TOP,
+                                 extend_by_eps_top=[True, False, True],
+                                 fn=np.array([8, 12, 8]),
+                                 profile_bottom=[chamfer, None, chamfer])
+
+        self.assertEqual(2, len(holes.holes))
+        self.assertEqual(8, holes.holes[0].fn)
+        self.assertIsInstance(holes.holes[0].fn, int)
+        self.assertTrue(holes.holes[0].extend_by_eps_top)
+        self.assertIs(chamfer, holes.holes[0].profile_bottom)
+        self.assertEqual(12, holes.holes[1].fn)
+        self.assertFalse(holes.holes[1].extend_by_eps_top)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_volumes(self):
+        """
+        Test the volumes of a batch of holes.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        holes = HoleCountersunk.batch(positions=[(0.0, 0.0), (10.0, 0.0), (20.0, 0.0)],
+                                      height=10.0,
+                                      radius=[1.0, 2.0, 1.0],
+                                      countersink_radius=[2.0, 3.0, 2.0],
+                                      countersink_angle=90.0,
+                                      alignment=HoleAlignment.TOP,
+                                      extend_by_eps_top=False,
+                                      extend_by_eps_bottom=False)
+
+        # A cylinder and a truncated cone of height 1.
+        volume1 = math.pi * 9.0 + math.pi * (4.0 + 2.0 + 1.0) / 3.0
+        volume2 = math.pi * 4.0 * 9.0 + math.pi * (9.0 + 6.0 + 4.0) / 3.0
+        np.testing.assert_allclose([volume1, volume2, volume1], holes.volumes(context))
+        self.assertAlmostEqual(2.0 * volume1 + volume2, holes.volume(context))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_empty(self):
+        """
+        Test a batch without positions, e.g., after all positions are culled.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        positions = list(HolePattern.cull(HolePattern.linear_row(count=3, pitch=5.0),
+                                          boundary=[Vector2(100.0, 100.0), Vector2(110.0, 100.0), Vector2(110.0, 110.0)]))
+        holes = HoleSimple.batch(positions=positions, height=5.0, diameter=[], alignment=HoleAlignment.TOP)
+
+        self.assertEqual(0, holes.size)
+        self.assertEqual([], holes.holes)
+        self.assertEqual((0,), holes.volumes(context).shape)
+        self.assertEqual(0.0, holes.volume(context))
+        self.assertNotIn('cylinder', self.render(context, holes))
+
+        holes = HoleSimple.batch(positions=np.empty((0, 2)), height=5.0, diameter=2.0, alignment=HoleAlignment.TOP)
+        self.assertEqual(0, holes.size)
+        self.assertEqual((0,), holes.volumes(context).shape)
+
+# ----------------------------------------------------------------------------------------------------------------------
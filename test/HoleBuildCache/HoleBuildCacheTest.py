@@ -0,0 +1,61 @@
+from super_scad.boolean.Compound import Compound
+from super_scad.scad.Context import Context
+from super_scad.transformation.Translate3D import Translate3D
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleSimple import HoleSimple
+from test.ScadTestCase import ScadTestCase
+
+
+class HoleBuildCacheTest(ScadTestCase):
+    """
+    Test cases for HoleBuildCache.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_identical_holes(self):
+        """
+        Test identical holes are built only once.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        holes = []
+        for x in range(3):
+            hole = HoleCounterbored(height=10.0,
+                                    diameter=2.0,
+                                    counterbore_diameter=4.0,
+                                    counterbore_height=2.0,
+                                    alignment=HoleAlignment.TOP)
+            holes.append(Translate3D(x=5.0 * x, child=hole))
+        holes = Compound(children=holes)
+
+        with HoleBuildCache.scope():
+            self.assertScadCode(context, holes)
+            stats = HoleBuildCache.stats()
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(1, stats['size'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_eviction(self):
+        """
+        Test the least recently used widget is evicted from a full cache.
+        """
+        context = Context(fn=60, eps=0.1)
+        hole1 = HoleSimple(height=10.0, diameter=1.0, alignment=HoleAlignment.TOP)
+        hole2 = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP)
+
+        max_size = HoleBuildCache.max_size
+        with HoleBuildCache.scope(max_size=1):
+            widget1 = hole1.build(context)
+            self.assertIs(widget1, hole1.build(context))
+            hole2.build(context)
+            self.assertIsNot(widget1, hole1.build(context))
+            stats = HoleBuildCache.stats()
+
+        self.assertEqual({'hits': 1, 'misses': 3, 'evictions': 2, 'size': 1, 'max_size': 1}, stats)
+        self.assertEqual(max_size, HoleBuildCache.max_size)
+
+# ----------------------------------------------------------------------------------------------------------------------
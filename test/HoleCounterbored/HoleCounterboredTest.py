@@ -1,6 +1,7 @@
+import re
+
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
@@ -21,7 +22,7 @@ class HoleCounterboredTest(ScadTestCase):
         """
         Test the alignment of a counterbored hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterbored(height=10.0,
                                  diameter=1.0,
@@ -45,18 +46,14 @@ class HoleCounterboredTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a counterbored hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterbored(height=10.0,
                                  diameter=2.0,
@@ -86,10 +83,49 @@ class HoleCounterboredTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_segmented(self):
+        """
+        Test a counterbored hole with a number of fragments per section.
+        """
+        context = Context(fn=360, eps=0.1)
+
+        hole1 = HoleCounterbored(height=10.0,
+                                 diameter=3.0,
+                                 counterbore_diameter=10.0,
+                                 counterbore_height=2.0,
+                                 alignment=HoleAlignment.TOP,
+                                 segmented=True)
+
+        hole2 = HoleCounterbored(height=10.0,
+                                 diameter=2.0,
+                                 counterbore_diameter=10.0,
+                                 counterbore_height=2.0,
+                                 alignment=HoleAlignment.TOP,
+                                 fn4n=True,
+                                 max_deviation=0.001,
+                                 segmented=True)
+        hole2 = Translate3D(x=15.0, child=hole2)
+
+        self.assertScadCode(context, Compound(children=[hole1, hole2]))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_fa_fs(self):
+        """
+        Test all sections of a counterbored hole have the number of fragments of the counterbore when the number of
+        fragments follows from $fa and $fs.
+        """
+        context = Context(fa=12.0, fs=0.5, eps=0.1)
+
+        hole = HoleCounterbored(height=10.0,
+                                diameter=3.0,
+                                counterbore_diameter=6.0,
+                                counterbore_height=2.0,
+                                alignment=HoleAlignment.TOP)
+
+        self.assertScadCode(context, hole)
+        self.assertEqual({'$fn = 30'}, set(re.findall(r'\$fn = \d+', self.render(context, hole))))
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,6 +1,5 @@
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
@@ -21,7 +20,7 @@ class HoleCounterboredSlottedTest(ScadTestCase):
         """
         Test the alignment of a slotted counterbored hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterboredSlotted(height=10.0,
                                         diameter=1.0,
@@ -48,18 +47,14 @@ class HoleCounterboredSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a slotted counterbored hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterboredSlotted(height=10.0,
                                         diameter=2.0,
@@ -93,10 +88,6 @@ class HoleCounterboredSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,6 +1,7 @@
+import math
+
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
@@ -21,7 +22,7 @@ class HoleCounterdrilledTest(ScadTestCase):
         """
         Test the alignment of a counterdrilled hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterdrilled(height=10.0,
                                    diameter=1.0,
@@ -45,18 +46,14 @@ class HoleCounterdrilledTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a counterdrilled hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterdrilled(height=10.0,
                                    diameter=2.0,
@@ -88,10 +85,34 @@ class HoleCounterdrilledTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_max_deviation(self):
+        """
+        Test the number of fragments of a counterdrilled hole given the maximum deviation.
+        """
+        context = Context(fn=360, eps=0.1)
+
+        hole1 = HoleCounterdrilled(height=10.0,
+                                   diameter=4.0,
+                                   counterdrill_diameter=10.0,
+                                   counterdrill_height=1.5,
+                                   alignment=HoleAlignment.TOP,
+                                   max_deviation=0.01)
+        self.assertEqual(50, hole1.real_fn(context))
+        self.assertLessEqual(5.0 * (1.0 - math.cos(math.pi / 50)), 0.01)
+        self.assertGreater(5.0 * (1.0 - math.cos(math.pi / 49)), 0.01)
+
+        hole2 = HoleCounterdrilled(height=10.0,
+                                   diameter=4.0,
+                                   counterdrill_diameter=10.0,
+                                   counterdrill_height=1.5,
+                                   alignment=HoleAlignment.TOP,
+                                   max_deviation=0.01,
+                                   fn4n=True)
+        self.assertEqual(52, hole2.real_fn(context))
+
+        self.assertScadCode(context, Compound(children=[hole1, Translate3D(x=15.0, child=hole2)]))
 
 # ----------------------------------------------------------------------------------------------------------------------
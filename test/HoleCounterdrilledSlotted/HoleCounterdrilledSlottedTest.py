@@ -1,12 +1,14 @@
+import re
+
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
 from super_scad_smooth_profiles.Fillet import Fillet
 
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
 from super_scad_hole.HoleCounterdrilledSlotted import HoleCounterdrilledSlotted
 from test.ScadTestCase import ScadTestCase
 
@@ -21,7 +23,7 @@ class HoleCounterdrilledSlottedTest(ScadTestCase):
         """
         Test the alignment of a counterdrilled hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterdrilledSlotted(height=10.0,
                                           diameter=1.0,
@@ -48,18 +50,14 @@ class HoleCounterdrilledSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a counterdrilled hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCounterdrilledSlotted(height=10.0,
                                           diameter=2.0,
@@ -94,10 +92,45 @@ class HoleCounterdrilledSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_bounding_box(self):
+        """
+        Test the bounding box of slotted counterdrilled holes.
+        """
+        context = Context(fn=16, eps=0.1, length_digits=8)
+
+        hole = HoleCounterdrilledSlotted(height=10.0,
+                                         diameter=2.0,
+                                         counterdrill_diameter=4.0,
+                                         counterdrill_height=1.0,
+                                         center_to_center=3.0,
+                                         alignment=HoleAlignment.TOP)
+        box = hole.bounding_box(context)
+        self.assertEqual(Vector3(-2.0, -3.5, -10.1), box.minimum)
+        self.assertEqual(Vector3(2.0, 3.5, 0.1), box.maximum)
+
+        # With 16 fragments, the vertices of the polyhedron include the extremes of the hole.
+        hole = HoleCounterdrilledSlotted(height=10.0,
+                                         diameter=2.0,
+                                         counterdrill_diameter=4.0,
+                                         counterdrill_height=1.0,
+                                         center_to_center=3.0,
+                                         alignment=HoleAlignment.CENTER,
+                                         profile_top=Fillet(radius=0.5, side=2),
+                                         extend_by_eps_boundary=True,
+                                         polyhedron=True)
+        with HoleBuildCache.scope():
+            code = self.render(context, hole)
+        points = re.search(r'points = (.*?), faces', code).group(1)
+        points = [[float(value) for value in point.split(', ')] for point in re.findall(r'\[([^\[\]]+)]', points)]
+        box = hole.bounding_box(context)
+        for axis, (minimum, maximum) in enumerate(((box.minimum.x, box.maximum.x),
+                                                   (box.minimum.y, box.maximum.y),
+                                                   (box.minimum.z, box.maximum.z))):
+            self.assertAlmostEqual(minimum, min(point[axis] for point in points), places=6)
+            self.assertAlmostEqual(maximum, max(point[axis] for point in points), places=6)
+        self.assertGreater(box.maximum.x, 2.0)
 
 # ----------------------------------------------------------------------------------------------------------------------
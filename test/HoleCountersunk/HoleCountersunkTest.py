@@ -1,6 +1,5 @@
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
@@ -21,7 +20,7 @@ class HoleCountersunkTest(ScadTestCase):
         """
         Test the alignment of a countersunk hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCountersunk(height=10.0, diameter=1.0, countersink_diameter=3.0, alignment=HoleAlignment.TOP)
 
@@ -33,18 +32,14 @@ class HoleCountersunkTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a countersunk hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCountersunk(height=10.0,
                                 diameter=2.0,
@@ -73,10 +68,23 @@ class HoleCountersunkTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_polyhedron(self):
+        """
+        Test a countersunk hole created as a polyhedron.
+        """
+        context = Context(fn=12, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
+
+        hole = HoleCountersunk(height=10.0,
+                               diameter=2.0,
+                               countersink_diameter=4.0,
+                               alignment=HoleAlignment.TOP,
+                               profile_top=Fillet(radius=1.0, side=2),
+                               profile_bottom=Chamfer(skew_length=0.2, side=1),
+                               polyhedron=True)
+
+        self.assertScadCode(context, hole)
 
 # ----------------------------------------------------------------------------------------------------------------------
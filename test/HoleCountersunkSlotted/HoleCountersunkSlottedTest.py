@@ -1,12 +1,14 @@
+import re
+
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
 from super_scad_smooth_profiles.Fillet import Fillet
 
 from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
 from super_scad_hole.HoleCountersunkSlotted import HoleCountersunkSlotted
 from test.ScadTestCase import ScadTestCase
 
@@ -21,7 +23,7 @@ class HoleCountersunkSlottedTest(ScadTestCase):
         """
         Test the alignment of a countersunk hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCountersunkSlotted(height=10.0,
                                        diameter=1.0,
@@ -45,18 +47,14 @@ class HoleCountersunkSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a countersunk hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.1, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleCountersunkSlotted(height=10.0,
                                        diameter=2.0,
@@ -88,10 +86,78 @@ class HoleCountersunkSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_polyhedron(self):
+        """
+        Test a slotted countersunk hole created as a polyhedron.
+        """
+        context = Context(fn=12, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
+
+        hole = HoleCountersunkSlotted(height=10.0,
+                                      diameter=1.0,
+                                      center_to_center=6.0,
+                                      countersink_diameter=3.0,
+                                      alignment=HoleAlignment.TOP,
+                                      polyhedron=True)
+
+        self.assertScadCode(context, hole)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_estimate_cost(self):
+        """
+        Test the estimated cost of slotted countersunk holes against the generated OpenSCAD code.
+        """
+        context = Context(fn=12, eps=0.35)
+
+        rough = HoleCountersunkSlotted(height=10.0,
+                                       diameter=1.0,
+                                       center_to_center=6.0,
+                                       countersink_diameter=3.0,
+                                       alignment=HoleAlignment.TOP)
+        profiled = HoleCountersunkSlotted(height=10.0,
+                                          diameter=1.0,
+                                          center_to_center=6.0,
+                                          countersink_diameter=3.0,
+                                          alignment=HoleAlignment.TOP,
+                                          profile_bottom=Chamfer(skew_length=0.2, side=1))
+        polyhedron = HoleCountersunkSlotted(height=10.0,
+                                            diameter=1.0,
+                                            center_to_center=6.0,
+                                            countersink_diameter=3.0,
+                                            alignment=HoleAlignment.TOP,
+                                            polyhedron=True)
+
+        for hole in (rough, profiled, polyhedron):
+            cost = hole.estimate_cost(context)
+            with HoleBuildCache.scope():
+                code = self.render(context, hole)
+            self.assertEqual(12, cost.fragments)
+            self.assertEqual(len(re.findall(r'^\s*\w+\(', code, re.MULTILINE)), cost.nodes)
+
+        # The top extended by eps, the countersink, and the hole, each with 2 times 14 triangles on its side and 2 caps
+        # of 12 triangles.
+        self.assertEqual(3 * (4 * 12 + 4), rough.estimate_cost(context).facets)
+
+        faces = re.findall(r'\[([\d, ]+)]', re.search(r'faces = (.*)\)', self.render(context, polyhedron)).group(1))
+        self.assertEqual(sum(len(face.split(',')) - 2 for face in faces), polyhedron.estimate_cost(context).facets)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_fa_fs(self):
+        """
+        Test all sections of a slotted countersunk hole have the number of fragments of the countersink when the number
+        of fragments follows from $fa and $fs.
+        """
+        context = Context(fa=12.0, fs=0.5, eps=0.1)
+
+        hole = HoleCountersunkSlotted(height=10.0,
+                                      diameter=1.0,
+                                      center_to_center=6.0,
+                                      countersink_diameter=3.0,
+                                      alignment=HoleAlignment.TOP)
+
+        self.assertScadCode(context, hole)
+        self.assertEqual({'$fn = 19'}, set(re.findall(r'\$fn = \d+', self.render(context, hole))))
 
 # ----------------------------------------------------------------------------------------------------------------------
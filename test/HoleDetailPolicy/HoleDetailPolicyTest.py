@@ -0,0 +1,147 @@
+import math
+import re
+
+from super_scad.boolean.Compound import Compound
+from super_scad.scad.Context import Context
+from super_scad.transformation.Translate3D import Translate3D
+from super_scad_smooth_profiles.Chamfer import Chamfer
+from super_scad_smooth_profiles.Fillet import Fillet
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleDetailPolicy import HoleDetailPolicy
+from super_scad_hole.HoleSimple import HoleSimple
+from super_scad_hole.HoleSimpleSlotted import HoleSimpleSlotted
+from test.ScadTestCase import ScadTestCase
+
+
+class HoleDetailPolicyTest(ScadTestCase):
+    """
+    Test cases for HoleDetailPolicy.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_preview(self):
+        """
+        Test a hole in coarse detail in preview and in full detail in render.
+        """
+        context = Context(fn=360, eps=0.1)
+
+        hole = HoleCounterbored(height=10.0,
+                                diameter=2.0,
+                                counterbore_diameter=4.0,
+                                counterbore_height=2.0,
+                                alignment=HoleAlignment.TOP,
+                                profile_top=Fillet(radius=1.0, side=2),
+                                profile_bottom=Chamfer(skew_length=0.2, side=1),
+                                detail=HoleDetail.PREVIEW)
+
+        self.assertScadCode(context, hole)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_scope(self):
+        """
+        Test the policy applies to holes without a level of detail of their own.
+        """
+        context = Context(fn=360, eps=0.1)
+
+        hole1 = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP)
+        hole2 = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP, fn=8)
+        hole3 = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP, detail=HoleDetail.FULL)
+        holes = Compound(children=[hole1, Translate3D(x=5.0, child=hole2), Translate3D(x=10.0, child=hole3)])
+
+        with HoleDetailPolicy.scope(detail=HoleDetail.COARSE, coarse_fn=12):
+            self.assertScadCode(context, holes)
+        self.assertEqual(HoleDetail.FULL, HoleDetailPolicy.detail)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_coarse_fa_fs(self):
+        """
+        Test a hole in coarse detail is not finer than in full detail when the number of fragments follows from $fa and
+        $fs.
+        """
+        context = Context(fa=12.0, fs=2.0, eps=0.1)
+
+        hole1 = HoleSimple(height=10.0, diameter=3.0, alignment=HoleAlignment.TOP, detail=HoleDetail.COARSE)
+        hole2 = HoleSimple(height=10.0, diameter=30.0, alignment=HoleAlignment.TOP, detail=HoleDetail.COARSE)
+        holes = Compound(children=[hole1, Translate3D(x=20.0, child=hole2)])
+
+        self.assertScadCode(context, holes)
+
+        with self.assertRaises(ValueError):
+            with HoleDetailPolicy.scope(coarse_fn=2):
+                pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_coarse_slotted_fa_fs(self):
+        """
+        Test a slotted hole in coarse detail is not finer than in full detail when the number of fragments follows from
+        $fa and $fs, i.e., the slot does not count towards the radius of the hole.
+        """
+        context = Context(fa=12.0, fs=2.0, eps=0.1)
+
+        hole = HoleSimpleSlotted(height=10.0, diameter=1.0, center_to_center=30.0, alignment=HoleAlignment.TOP)
+
+        fragments = {}
+        for detail in (HoleDetail.FULL, HoleDetail.COARSE):
+            with HoleDetailPolicy.scope(detail=detail), HoleBuildCache.scope():
+                code = self.render(context, hole)
+                fragments[detail] = set(re.findall(r'\$fn = (\d+)', code)), hole.estimate_cost(context).fragments
+
+        self.assertEqual(({'5'}, 5), fragments[HoleDetail.FULL])
+        self.assertEqual(fragments[HoleDetail.FULL], fragments[HoleDetail.COARSE])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_estimate_cost(self):
+        """
+        Test the estimated cost of holes in coarse and preview detail against the generated OpenSCAD code.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        simple = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP)
+        profiled = HoleCounterbored(height=10.0,
+                                    diameter=2.0,
+                                    counterbore_diameter=4.0,
+                                    counterbore_height=2.0,
+                                    alignment=HoleAlignment.TOP,
+                                    profile_top=Fillet(radius=1.0, side=2),
+                                    profile_bottom=Chamfer(skew_length=0.2, side=1))
+        slotted = HoleSimpleSlotted(height=10.0,
+                                    diameter=2.0,
+                                    center_to_center=3.0,
+                                    alignment=HoleAlignment.TOP,
+                                    profile_bottom=Chamfer(skew_length=0.2, side=1))
+
+        for detail in (HoleDetail.COARSE, HoleDetail.PREVIEW):
+            for hole in (simple, profiled, slotted):
+                with HoleDetailPolicy.scope(detail=detail, coarse_fn=12), HoleBuildCache.scope():
+                    cost = hole.estimate_cost(context)
+                    code = self.render(context, hole)
+                self.assertEqual(len(re.findall(r'^\s*\w+\s*\(', code, re.MULTILINE)), cost.nodes)
+                self.assertEqual(12 if detail == HoleDetail.COARSE else 60, cost.fragments)
+
+        self.assertEqual(60, simple.estimate_cost(context).fragments)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_volume(self):
+        """
+        Test the faceted volume of a hole is the volume of the hole as rendered, i.e., in coarse detail the volume of the
+        coarse hole and in preview detail the volume of the full hole.
+        """
+        context = Context(fn=64, eps=0.1)
+
+        hole = HoleSimple(height=10.0,
+                          radius=1.0,
+                          alignment=HoleAlignment.TOP,
+                          extend_by_eps_top=False,
+                          extend_by_eps_bottom=False)
+
+        with HoleDetailPolicy.scope(detail=HoleDetail.COARSE, coarse_fn=16):
+            self.assertAlmostEqual(8.0 * math.sin(math.pi / 8.0) * 10.0, hole.volume(context, faceted=True))
+            self.assertAlmostEqual(math.pi * 10.0, hole.volume(context))
+        with HoleDetailPolicy.scope(detail=HoleDetail.PREVIEW, coarse_fn=16):
+            self.assertAlmostEqual(32.0 * math.sin(math.pi / 32.0) * 10.0, hole.volume(context, faceted=True))
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,71 @@
+from super_scad.boolean.Compound import Compound
+from super_scad.scad.Context import Context
+from super_scad.transformation.Translate3D import Translate3D
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleArray import HoleArray
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleFacetBudget import HoleFacetBudget
+from super_scad_hole.HolePattern import HolePattern
+from super_scad_hole.HoleSimple import HoleSimple
+from test.ScadTestCase import ScadTestCase
+
+
+class HoleFacetBudgetTest(ScadTestCase):
+    """
+    Test cases for HoleFacetBudget.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_budget(self):
+        """
+        Test the fragments of a large hole and many small holes are planned within the budget.
+        """
+        context = Context(fn=360, eps=0.1)
+
+        large = HoleCounterbored(height=10.0,
+                                 diameter=20.0,
+                                 counterbore_diameter=40.0,
+                                 counterbore_height=2.0,
+                                 alignment=HoleAlignment.TOP)
+        small = HoleSimple(height=10.0, diameter=3.0, alignment=HoleAlignment.TOP)
+        fixed = HoleSimple(height=10.0, diameter=3.0, alignment=HoleAlignment.TOP, fn=6)
+        root = Compound(children=[large,
+                                  HoleArray(hole=small,
+                                            positions=list(HolePattern.linear_row(count=20, pitch=5.0))),
+                                  Translate3D(y=30.0, child=fixed)])
+
+        with HoleFacetBudget.scope(root=root, context=context, budget=5000) as plan:
+            self.assertEqual(3, len(plan))
+            self.assertEqual(6, plan[fixed.spec])
+            self.assertLess(plan[small.spec], plan[large.spec])
+            cost = 2 * 7 * plan[large.spec] + 20 * 2 * 5 * plan[small.spec] + 2 * 5 * 6
+            self.assertLessEqual(cost, 5000)
+            self.assertEqual(plan[large.spec], large.estimate_cost(context).fragments)
+            self.assertEqual(plan[small.spec], small.estimate_cost(context).fragments)
+            planned = HoleSimple(height=10.0, diameter=3.0, alignment=HoleAlignment.TOP, fn=plan[small.spec])
+            self.assertAlmostEqual(planned.volume(context, faceted=True), small.volume(context, faceted=True))
+            self.assertScadCode(context, root)
+        self.assertIsNone(HoleFacetBudget.fn(small))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_fn4n(self):
+        """
+        Test holes with fn4n get a multiple of 4 fragments.
+        """
+        context = Context(eps=0.1)
+
+        holes = [HoleSimple(height=10.0, diameter=diameter, alignment=HoleAlignment.TOP, fn4n=True)
+                 for diameter in (1.0, 2.5, 7.0, 13.0)]
+        plan = HoleFacetBudget.plan(root=Compound(children=holes), context=context, budget=1000)
+
+        self.assertEqual(4, len(plan))
+        for fn in plan.values():
+            self.assertEqual(0, fn % 4)
+            self.assertGreaterEqual(fn, 8)
+
+        # Rounding up to a multiple of 4 does not exceed the maximum number of fragments.
+        plan = HoleFacetBudget.plan(root=Compound(children=holes), context=context, budget=100000, min_fn=5, max_fn=10)
+        self.assertEqual({8}, set(plan.values()))
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,102 @@
+import json
+
+from super_scad.scad.Context import Context
+from super_scad_smooth_profiles.Chamfer import Chamfer
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleDetail import HoleDetail
+from super_scad_hole.HoleDetailPolicy import HoleDetailPolicy
+from super_scad_hole.HoleInstrumentation import HoleInstrumentation
+from super_scad_hole.HoleSimple import HoleSimple
+from test.ScadTestCase import ScadTestCase
+
+
+class HoleInstrumentationTest(ScadTestCase):
+    """
+    Test cases for HoleInstrumentation.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_stats(self):
+        """
+        Test the stages and lazy derived properties of holes are recorded per hole and per class.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        with HoleInstrumentation.scope(), HoleBuildCache.scope():
+            hole1 = HoleCounterbored(height=10.0,
+                                     diameter=2.0,
+                                     counterbore_diameter=4.0,
+                                     counterbore_height=2.0,
+                                     alignment=HoleAlignment.TOP,
+                                     profile_bottom=Chamfer(skew_length=0.5, side=1))
+            hole2 = HoleCounterbored(height=10.0,
+                                     radius=1.0,
+                                     counterbore_radius=2.0,
+                                     counterbore_height=2.0,
+                                     alignment=HoleAlignment.TOP)
+            hole1.build(context)
+            hole2.build(context)
+            hole2.build(context)
+            stats = json.loads(HoleInstrumentation.to_json())
+
+        self.assertFalse(HoleInstrumentation.enabled)
+        self.assertEqual(2, len(stats['holes']))
+
+        stages = stats['holes'][0]['stages']
+        self.assertEqual({'validate', 'build', 'create_polygon', 'create_profiles', 'extend_sides'}, set(stages))
+        self.assertEqual(2, stages['validate']['calls'])
+        self.assertEqual(1, stages['build']['calls'])
+        self.assertEqual(2, stages['create_profiles']['calls'])
+        self.assertEqual(1, stats['holes'][0]['properties']['radius'])
+        self.assertEqual(1, stats['holes'][0]['properties']['profile_top'])
+        self.assertNotIn('profile_bottom', stats['holes'][0]['properties'])
+        self.assertEqual(1, stats['holes'][1]['properties']['diameter'])
+
+        aggregate = stats['classes']['HoleCounterbored']
+        self.assertEqual(2, aggregate['holes'])
+        self.assertEqual(3, aggregate['stages']['build']['calls'])
+        self.assertEqual(2, aggregate['stages']['create_polygon']['calls'])
+        self.assertGreaterEqual(aggregate['stages']['build']['time'], aggregate['stages']['create_polygon']['time'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_derived_copies(self):
+        """
+        Test the stages of the copies of a hole derived while building the hole are attributed to the hole.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        with HoleInstrumentation.scope(), HoleBuildCache.scope(), HoleDetailPolicy.scope(detail=HoleDetail.PREVIEW):
+            hole = HoleCounterbored(height=10.0,
+                                    diameter=2.0,
+                                    counterbore_diameter=4.0,
+                                    counterbore_height=2.0,
+                                    alignment=HoleAlignment.TOP,
+                                    profile_bottom=Chamfer(skew_length=0.5, side=1))
+            hole.build(context)
+            stats = HoleInstrumentation.stats()
+
+        self.assertEqual(1, len(stats['holes']))
+        self.assertEqual(id(hole), stats['holes'][0]['id'])
+        stages = stats['holes'][0]['stages']
+        self.assertEqual(1, stages['build']['calls'])
+        self.assertEqual(3, stages['create_polygon']['calls'])
+        self.assertEqual(1, stats['classes']['HoleCounterbored']['holes'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_disabled(self):
+        """
+        Test nothing is recorded when instrumentation is disabled.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        HoleInstrumentation.clear()
+        hole = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP)
+        with HoleBuildCache.scope():
+            hole.build(context)
+
+        self.assertEqual({'holes': [], 'classes': {}}, HoleInstrumentation.stats())
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from super_scad.scad.Context import Context
+from super_scad.type import Vector2
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleLayout import HoleLayout
+from super_scad_hole.HoleSimple import HoleSimple
+from super_scad_hole.HoleSimpleSlotted import HoleSimpleSlotted
+
+
+class HoleLayoutTest(unittest.TestCase):
+    """
+    Test cases for HoleLayout.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_thin_walls(self):
+        """
+        Test overlaps, thin walls, and nearest holes against checking all pairs of holes.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        holes = [HoleSimple(height=5.0, diameter=2.0, alignment=HoleAlignment.TOP),
+                 HoleSimple(height=5.0, diameter=5.0, alignment=HoleAlignment.TOP),
+                 HoleSimpleSlotted(height=5.0, diameter=2.0, center_to_center=4.0, alignment=HoleAlignment.TOP)]
+        generator = random.Random(42)
+        layout = HoleLayout(context=context)
+        for _ in range(100):
+            layout.add(generator.choice(holes),
+                       Vector2(generator.uniform(0.0, 80.0), generator.uniform(0.0, 80.0)),
+                       generator.uniform(0.0, 360.0))
+
+        walls = [(index1, index2, layout.wall(index1, index2))
+                 for index1 in range(len(layout)) for index2 in range(index1 + 1, len(layout))]
+
+        self.assertEqual([(index1, index2) for index1, index2, wall in walls if wall < 0.0], layout.overlaps())
+        self.assertEqual([(index1, index2) for index1, index2, wall in walls if wall < 1.5],
+                         [(index1, index2) for index1, index2, _ in layout.thin_walls(1.5)])
+        for index in range(len(layout)):
+            expected = min(wall for index1, index2, wall in walls if index in (index1, index2))
+            self.assertAlmostEqual(expected, layout.nearest(index)[1])
+
+        # Two slotted holes side by side: the wall is between the flat sides of the slots.
+        layout = HoleLayout(context=context)
+        layout.add(holes[2], Vector2(0.0, 0.0))
+        layout.add(holes[2], Vector2(3.0, -1.0))
+        layout.add(holes[2], Vector2(0.0, 3.0), 90.0)
+        self.assertAlmostEqual(1.0, layout.wall(0, 1))
+        self.assertAlmostEqual(-1.0, layout.wall(0, 2))
+        self.assertEqual([(0, 2)], layout.overlaps())
+        self.assertEqual(0, layout.nearest(2)[0])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_edge_violations(self):
+        """
+        Test holes outside a boundary polygon or too close to its sides.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        hole = HoleSimple(height=5.0, diameter=2.0, alignment=HoleAlignment.TOP)
+        slot = HoleSimpleSlotted(height=5.0, diameter=2.0, center_to_center=4.0, alignment=HoleAlignment.TOP)
+        boundary = [Vector2(0.0, 0.0), Vector2(30.0, 0.0), Vector2(30.0, 20.0), Vector2(0.0, 20.0)]
+
+        layout = HoleLayout(context=context)
+        layout.add(hole, Vector2(10.0, 10.0))
+        layout.add(hole, Vector2(2.5, 10.0))
+        layout.add(hole, Vector2(40.0, 10.0))
+        layout.add(slot, Vector2(20.0, 4.0))
+        layout.add(slot, Vector2(20.0, 4.0), 90.0)
+
+        self.assertEqual([2], layout.edge_violations(boundary=boundary))
+        self.assertEqual([2, 3], layout.edge_violations(boundary=boundary, edge_distance=1.2))
+        self.assertEqual([1, 2, 3], layout.edge_violations(boundary=boundary, edge_distance=2.0))
+
+# ----------------------------------------------------------------------------------------------------------------------
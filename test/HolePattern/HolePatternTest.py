@@ -0,0 +1,48 @@
+from super_scad.scad.Context import Context
+from super_scad.type import Vector2
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleArray import HoleArray
+from super_scad_hole.HoleCountersunk import HoleCountersunk
+from super_scad_hole.HolePattern import HolePattern
+from super_scad_hole.HoleSimple import HoleSimple
+from test.ScadTestCase import ScadTestCase
+
+
+class HolePatternTest(ScadTestCase):
+    """
+    Test cases for HolePattern.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_bolt_circle(self):
+        """
+        Test holes on a bolt circle.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        hole = HoleSimple(height=5.0, diameter=2.0, alignment=HoleAlignment.TOP)
+        positions = HolePattern.bolt_circle(radius=10.0, count=6, start_angle=15.0, center=Vector2(5.0, 5.0))
+        holes = HoleArray(hole=hole, positions=list(positions))
+
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_cull(self):
+        """
+        Test holes on a hexagonal grid culled against a boundary polygon.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        hole = HoleCountersunk(height=5.0, diameter=2.0, countersink_diameter=4.0, alignment=HoleAlignment.TOP)
+        boundary = [Vector2(0.0, 0.0), Vector2(30.0, 0.0), Vector2(30.0, 20.0), Vector2(15.0, 28.0), Vector2(0.0, 20.0)]
+        positions = HolePattern.cull(HolePattern.hex_grid(columns=12, rows=12, pitch=5.0),
+                                     boundary=boundary,
+                                     hole=hole,
+                                     edge_distance=1.0,
+                                     chunk_size=16)
+        holes = HoleArray(hole=hole, positions=list(positions))
+
+        self.assertScadCode(context, holes)
+
+# ----------------------------------------------------------------------------------------------------------------------
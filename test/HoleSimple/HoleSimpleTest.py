@@ -1,6 +1,7 @@
+import math
+
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad.type import Vector3
 from super_scad_smooth_profiles.Chamfer import Chamfer
@@ -21,7 +22,7 @@ class HoleSimpleTest(ScadTestCase):
         """
         Test the alignment of a simple hole.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleSimple(height=10.0, diameter=1.0, alignment=HoleAlignment.TOP)
 
@@ -33,18 +34,14 @@ class HoleSimpleTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a simple hole with profiles.
         """
-        scad = Scad(context=Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0)))
+        context = Context(fn=360, eps=0.35, vpr=Vector3(90.0, 0.0, 0.0))
 
         hole1 = HoleSimple(height=10.0,
                            diameter=2.0,
@@ -68,10 +65,27 @@ class HoleSimpleTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_polyhedron_odd_fn(self):
+        """
+        Test the vertices of a simple hole created as a polyhedron with an odd number of fragments are at the same
+        angles as the vertices of the rotational extrusion by OpenSCAD, which starts at 180 degrees.
+        """
+        context = Context(fn=7, eps=0.1)
+
+        hole = HoleSimple(height=10.0,
+                          diameter=2.0,
+                          alignment=HoleAlignment.TOP,
+                          profile_bottom=Chamfer(skew_length=0.5, side=1),
+                          polyhedron=True)
+        polyhedron = hole.build(context)
+
+        expected = [(180.0 + index * 360.0 / 7) % 360.0 for index in range(7)]
+        for node in polyhedron.nodes(context):
+            if node.x != 0.0 or node.y != 0.0:
+                angle = math.degrees(math.atan2(node.y, node.x)) % 360.0
+                self.assertLess(min(abs(angle - other) for other in expected), 0.01)
 
 # ----------------------------------------------------------------------------------------------------------------------
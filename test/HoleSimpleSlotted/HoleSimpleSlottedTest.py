@@ -1,6 +1,7 @@
+import math
+
 from super_scad.boolean.Compound import Compound
 from super_scad.scad.Context import Context
-from super_scad.scad.Scad import Scad
 from super_scad.transformation.Translate3D import Translate3D
 from super_scad_smooth_profiles.Chamfer import Chamfer
 from super_scad_smooth_profiles.Fillet import Fillet
@@ -20,7 +21,7 @@ class HoleSimpleSlottedTest(ScadTestCase):
         """
         Test the alignment of a slotted hole.
         """
-        scad = Scad(context=Context(fn=60, eps=0.314))
+        context = Context(fn=60, eps=0.314)
 
         hole1 = HoleSimpleSlotted(height=10.0, diameter=1.0, center_to_center=3.0, alignment=HoleAlignment.TOP)
 
@@ -32,18 +33,14 @@ class HoleSimpleSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
 
     # ------------------------------------------------------------------------------------------------------------------
     def test_alignment_with_profiles(self):
         """
         Test the alignment of a slotted hole with profiles.
         """
-        scad = Scad(context=Context(fn=60, eps=0.314))
+        context = Context(fn=60, eps=0.314)
 
         hole1 = HoleSimpleSlotted(height=10.0,
                                   diameter=1.0,
@@ -73,10 +70,64 @@ class HoleSimpleSlottedTest(ScadTestCase):
 
         holes = Compound(children=[hole1, hole2, hole3])
 
-        path_actual, path_expected = self.paths()
-        scad.run_super_scad(holes, path_actual)
-        actual = path_actual.read_text()
-        expected = path_expected.read_text()
-        self.assertEqual(expected, actual)
+        self.assertScadCode(context, holes)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_convexity(self):
+        """
+        Test the convexity of a slotted hole is computed from its cross-section unless given.
+        """
+        context = Context(fn=60, eps=0.1)
+
+        hole1 = HoleSimpleSlotted(height=10.0,
+                                  diameter=2.0,
+                                  center_to_center=3.0,
+                                  alignment=HoleAlignment.TOP,
+                                  profile_top=Chamfer(skew_length=0.5, side=2))
+
+        hole2 = HoleSimpleSlotted(height=10.0,
+                                  diameter=2.0,
+                                  center_to_center=3.0,
+                                  alignment=HoleAlignment.TOP,
+                                  profile_top=Chamfer(skew_length=0.5, side=2),
+                                  convexity=4)
+        hole2 = Translate3D(x=5.0, child=hole2)
+
+        self.assertScadCode(context, Compound(children=[hole1, hole2]))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_volume(self):
+        """
+        Test the exact and faceted volume of a slotted simple hole.
+        """
+        context = Context(fn=8, eps=0.1)
+
+        rough = HoleSimpleSlotted(height=10.0,
+                                  radius=1.0,
+                                  center_to_center=3.0,
+                                  alignment=HoleAlignment.TOP,
+                                  extend_by_eps_top=False,
+                                  extend_by_eps_bottom=False)
+        polyhedron = HoleSimpleSlotted(height=10.0,
+                                       radius=1.0,
+                                       center_to_center=3.0,
+                                       alignment=HoleAlignment.TOP,
+                                       extend_by_eps_top=False,
+                                       extend_by_eps_bottom=False,
+                                       polyhedron=True)
+
+        # A cylinder (or an octagonal prism) and a prism of 2 by 3 by 10.
+        for hole in (rough, polyhedron):
+            self.assertAlmostEqual(math.pi * 10.0 + 60.0, hole.volume(context))
+            self.assertAlmostEqual(2.0 * math.sqrt(2.0) * 10.0 + 60.0, hole.volume(context, faceted=True))
+
+        # With 7 fragments, the polyhedron sweeps both halves through 0 and 180 degrees, and the stadium is the hull of
+        # two heptagons with a vertex at 0 degrees only.
+        context = Context(fn=7, eps=0.1)
+        angle = 2.0 * math.pi / 7.0
+        self.assertAlmostEqual((3.0 * math.sin(angle) + math.sin(0.5 * angle)) * 10.0 + 60.0,
+                               polyhedron.volume(context, faceted=True))
+        self.assertAlmostEqual(3.5 * math.sin(angle) * 10.0 + 30.0 * (1.0 + math.cos(0.5 * angle)),
+                               rough.volume(context, faceted=True))
 
 # ----------------------------------------------------------------------------------------------------------------------
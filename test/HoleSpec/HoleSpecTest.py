@@ -0,0 +1,124 @@
+import dataclasses
+
+import numpy as np
+from super_scad.scad.Context import Context
+from super_scad_smooth_profiles.Fillet import Fillet
+
+from super_scad_hole.HoleAlignment import HoleAlignment
+from super_scad_hole.HoleBuildCache import HoleBuildCache
+from super_scad_hole.HoleCounterbored import HoleCounterbored
+from super_scad_hole.HoleCountersunkSlotted import HoleCountersunkSlotted
+from super_scad_hole.HoleSimple import HoleSimple
+from test.ScadTestCase import ScadTestCase
+
+
+class SlottedFillet(Fillet):
+    """
+    A fillet with an attribute in a slot.
+    """
+    __slots__ = ('tag',)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, *, tag: object, **kwargs):
+        Fillet.__init__(self, **kwargs)
+        self.tag = tag
+
+
+class HoleSpecTest(ScadTestCase):
+    """
+    Test cases for HoleSpec.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_equality(self):
+        """
+        Test holes with the same dimensions and profiles have equal specifications.
+        """
+        hole1 = HoleCountersunkSlotted(height=10,
+                                       diameter=2,
+                                       countersink_diameter=4,
+                                       center_to_center=1,
+                                       alignment=HoleAlignment.TOP,
+                                       profile_top=Fillet(radius=1))
+        hole2 = HoleCountersunkSlotted(height=10.0,
+                                       radius=1.0,
+                                       countersink_radius=2.0,
+                                       center_to_center=1.0,
+                                       alignment=HoleAlignment.TOP,
+                                       profile_top=Fillet(radius=1.0))
+        hole3 = HoleCountersunkSlotted(height=10.0,
+                                       radius=1.0,
+                                       countersink_radius=2.0,
+                                       center_to_center=1.0,
+                                       alignment=HoleAlignment.TOP,
+                                       profile_top=Fillet(radius=1.0, side=2))
+
+        self.assertEqual(hole1.spec, hole2.spec)
+        self.assertEqual(hash(hole1.spec), hash(hole2.spec))
+        self.assertNotEqual(hole1.spec, hole3.spec)
+        self.assertEqual(2, len({hole1.spec, hole2.spec, hole3.spec}))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_immutable(self):
+        """
+        Test the specification of a hole is immutable and has all derived dimensions resolved.
+        """
+        hole = HoleCounterbored(height=10.0,
+                                diameter=2.0,
+                                counterbore_radius=2.0,
+                                counterbore_height=1.0,
+                                alignment=HoleAlignment.TOP)
+        spec = hole.spec
+
+        self.assertEqual(1.0, spec.radius)
+        self.assertEqual(4.0, spec.counterbore_diameter)
+        self.assertFalse(hasattr(spec, '__dict__'))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            spec.height = 5.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_slots_and_numpy_scalars(self):
+        """
+        Test the specification of a hole with attributes in slots and NumPy scalars.
+        """
+        context = Context(fn=12, eps=0.1)
+
+        hole1 = HoleSimple(height=np.float32(10.0),
+                           diameter=2.0,
+                           fn=np.int64(12),
+                           alignment=HoleAlignment.TOP,
+                           profile_top=SlottedFillet(radius=0.5, tag=np.float32(1.0)))
+        hole2 = HoleSimple(height=np.float32(10.0),
+                           diameter=2.0,
+                           fn=np.int64(12),
+                           alignment=HoleAlignment.TOP,
+                           profile_top=SlottedFillet(radius=0.5, tag=np.float32(2.0)))
+        hole3 = HoleSimple(height=np.float32(10.0),
+                           diameter=2.0,
+                           fn=np.int64(12),
+                           alignment=HoleAlignment.TOP,
+                           profile_top=SlottedFillet(radius=0.5, tag=np.float32(1.0)))
+
+        self.assertNotEqual(hole1.spec, hole2.spec)
+        self.assertEqual(hole1.spec, hole3.spec)
+        with HoleBuildCache.scope():
+            hole1.build(context)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_resolved_once(self):
+        """
+        Test the specification of a hole is resolved once and a copy of a hole with other fragments has a specification
+        of its own.
+        """
+        hole = HoleSimple(height=10.0, diameter=2.0, alignment=HoleAlignment.TOP, profile_top=Fillet(radius=0.5))
+
+        spec = hole.spec
+        self.assertIs(spec, hole.spec)
+        self.assertEqual(hash(spec), hash(hole.spec))
+
+        copy = hole._copy_with_fn(12)
+        self.assertIsNot(spec, copy.spec)
+        self.assertEqual(12, copy.spec.fn)
+        self.assertIsNone(hole.spec.fn)
+
+# ----------------------------------------------------------------------------------------------------------------------
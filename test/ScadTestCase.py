@@ -1,24 +1,83 @@
 import inspect
+import os
 import unittest
 from pathlib import Path
+from typing import Dict
+
+from super_scad.scad.Context import Context
+from super_scad.scad.Scad import Scad
+from super_scad.scad.ScadWidget import ScadWidget
 
 
 class ScadTestCase(unittest.TestCase):
     """
-    Parent test case for SuperSCAD test cases.
+    Parent test case for SuperSCAD test cases. The OpenSCAD code is generated in memory and compared against the
+    expected OpenSCAD code. The actual OpenSCAD code is written to disk only when it differs from the expected OpenSCAD
+    code.
+    """
+
+    __expected: Dict[Path, str | None] = {}
+    """
+    The expected OpenSCAD code given its path, read at most once per process. None if the file does not exist.
     """
 
     # ------------------------------------------------------------------------------------------------------------------
-    @staticmethod
-    def paths():
+    def paths(self):
         """
-        Returns a path to the actual generated OpenSCAD code and the expected OpenSCAD code.
+        Returns a path to the actual generated OpenSCAD code and the expected OpenSCAD code of the current test.
         """
-        directory = Path(inspect.stack()[1][1]).parent
-        method = inspect.stack()[1][3]
+        directory = Path(inspect.getfile(type(self))).parent
+        method = self._testMethodName
         path_actual = Path.joinpath(directory, method + '.actual.scad')
         path_expected = Path.joinpath(directory, method + '.expected.scad')
 
         return path_actual, path_expected
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def render(context: Context, widget: ScadWidget) -> str:
+        """
+        Returns the OpenSCAD code generated by SuperSCAD for a widget without writing the code to a file.
+
+        :param context: The build context.
+        :param widget: The root widget.
+        """
+        Scad(context=context).run_super_scad(widget, os.devnull)
+
+        return context.code_store.get_code()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def read_expected(path: Path) -> str | None:
+        """
+        Returns the expected OpenSCAD code. The file is read only on first request.
+
+        :param path: The path to the expected OpenSCAD code.
+        """
+        if path not in ScadTestCase.__expected:
+            ScadTestCase.__expected[path] = path.read_text() if path.exists() else None
+
+        return ScadTestCase.__expected[path]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def assertScadCode(self, context: Context, widget: ScadWidget) -> None:
+        """
+        Asserts the OpenSCAD code generated by SuperSCAD for a widget equals the expected OpenSCAD code of the current
+        test. On a mismatch, the actual OpenSCAD code is written to disk, see actual2expected.py.
+
+        :param context: The build context.
+        :param widget: The root widget.
+        """
+        path_actual, path_expected = self.paths()
+        actual = self.render(context, widget)
+        expected = self.read_expected(path_expected)
+
+        if actual == expected:
+            path_actual.unlink(missing_ok=True)
+        else:
+            path_actual.write_text(actual)
+            if expected is None:
+                self.fail(f'Expected OpenSCAD code {path_expected} does not exist.')
+            self.assertEqual(expected, actual)
+
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,21 +1,155 @@
+"""
+Copies the actual generated OpenSCAD code of failed test cases to the expected OpenSCAD code.
+
+The size, modification time, and content hash of each file are stored in a manifest, such that unchanged files are
+not read again. The files are processed in a pool of workers. Expected files without a test case are reported as
+orphaned.
+
+Usage: python test/actual2expected.py [--jobs N] [--json]
+"""
+import argparse
+import hashlib
+import json
 import os
+import re
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+directory = Path(__file__).parent
+
+manifest_path = directory / '.actual2expected.json'
+
+test_pattern = re.compile(r'^\s*def\s+(test\w*)\s*\(', re.MULTILINE)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def fingerprint(path: Path, entry: List | None) -> Tuple[List | None, bool]:
+    """
+    Returns the size, modification time, and content hash of a file and whether the file was read. The file is read
+    only if its size or modification time differs from the entry in the manifest. Returns None if the file does not
+    exist.
+
+    :param path: The path to the file.
+    :param entry: The entry of the file in the manifest.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None, False
+
+    if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+        return entry, False
+
+    return [stat.st_size, stat.st_mtime_ns, hashlib.sha256(path.read_bytes()).hexdigest()], True
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def process(path_actual: Path, entries: Dict[str, List]) -> Tuple[str, str, Dict[str, List], int]:
+    """
+    Copies the actual OpenSCAD code of a single test case to the expected OpenSCAD code if they differ. Returns the
+    outcome, the name of the expected file, the new entries in the manifest, and the number of files read.
+
+    :param path_actual: The path to the actual OpenSCAD code.
+    :param entries: The entries of the actual and expected files in the manifest.
+    """
+    path_expected = path_actual.with_name(path_actual.name.replace('.actual.scad', '.expected.scad'))
+    name = path_expected.relative_to(directory).as_posix()
+
+    actual, read_actual = fingerprint(path_actual, entries.get('actual'))
+    expected, read_expected = fingerprint(path_expected, entries.get('expected'))
+    reads = int(read_actual) + int(read_expected)
+
+    if expected is not None and expected[2] == actual[2]:
+        return 'unchanged' if reads else 'skipped', name, {'actual': actual, 'expected': expected}, reads
+
+    shutil.copyfile(path_actual, path_expected)
+    stat = path_expected.stat()
+
+    return ('new' if expected is None else 'changed',
+            name,
+            {'actual': actual, 'expected': [stat.st_size, stat.st_mtime_ns, actual[2]]},
+            reads)
 
+
+# ----------------------------------------------------------------------------------------------------------------------
+def find_orphans() -> List[str]:
+    """
+    Returns the names of all expected files without a test case in the test modules in the same directory.
+    """
+    orphans = []
+    for dirpath, _, filenames in os.walk(directory):
+        expected = [filename for filename in filenames if filename.endswith('.expected.scad')]
+        if not expected:
+            continue
+
+        tests = set()
+        for filename in filenames:
+            if filename.endswith('Test.py'):
+                tests.update(test_pattern.findall(Path(dirpath, filename).read_text()))
+
+        for filename in expected:
+            if filename.removesuffix('.expected.scad') not in tests:
+                orphans.append(Path(dirpath, filename).relative_to(directory).as_posix())
+
+    return sorted(orphans)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    """
+    Copies all actual OpenSCAD code to the expected OpenSCAD code and prints a summary.
+    """
+    parser = argparse.ArgumentParser(description='Copies actual generated OpenSCAD code to expected OpenSCAD code.')
+    parser.add_argument('--jobs', type=int, default=min(32, (os.cpu_count() or 1) + 4), help='the number of workers')
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON')
+    args = parser.parse_args()
+
+    manifest: Dict[str, Dict[str, List]] = {}
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except ValueError:
+            manifest = {}
+
+    paths = []
+    for dirpath, _, filenames in os.walk(directory):
+        paths.extend(Path(dirpath, filename) for filename in filenames if filename.endswith('.actual.scad'))
+
+    def work(path_actual: Path) -> Tuple[str, str, Dict[str, List], int]:
+        key = path_actual.relative_to(directory).as_posix().replace('.actual.scad', '.expected.scad')
+        return process(path_actual, manifest.get(key, {}))
+
+    summary: Dict[str, Any] = {'changed': [], 'new': [], 'unchanged': 0, 'skipped': 0, 'orphaned': [], 'reads': 0}
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        for outcome, name, entries, reads in executor.map(work, sorted(paths)):
+            manifest[name] = entries
+            summary['reads'] += reads
+            if outcome in ('changed', 'new'):
+                summary[outcome].append(name)
+            else:
+                summary[outcome] += 1
+    summary['orphaned'] = find_orphans()
+
+    manifest = {name: entries for name, entries in manifest.items() if (directory / name).exists()}
+    manifest_path.write_text(json.dumps(manifest, sort_keys=True))
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for kind in ('changed', 'new', 'orphaned'):
+            for name in summary[kind]:
+                print(f'{kind:<9} {name}')
+        print(f'{len(summary["changed"])} changed, {len(summary["new"])} new, {summary["unchanged"]} unchanged, '
+              f'{summary["skipped"]} skipped, {len(summary["orphaned"])} orphaned, {summary["reads"]} files read')
+
+    return 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
-    for path in Path('test').rglob('*.actual.scad'):
-        basename = Path(Path(os.path.basename(path)).stem).stem
-        dirname = os.path.dirname(path)
-
-        path_actual = Path(dirname, basename + '.actual.scad')
-        path_expected = Path(dirname, basename + '.expected.scad')
-        actual = path_actual.read_text()
-
-        copy = True
-        if os.path.exists(path_expected):
-            expected = path_expected.read_text()
-            copy = actual != expected
-
-        if copy:
-            print('Copying {}'.format(path, path_actual))
-            shutil.copy(path_actual, path_expected)
+    sys.exit(main())
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,108 @@
+"""
+Runs all test cases in parallel over a pool of processes, one test case class per task.
+
+Usage: python test/parallel.py [--jobs N] [pattern]
+"""
+import argparse
+import os
+import sys
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+root = Path(__file__).parent.parent
+sys.path.insert(0, str(root))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def flatten(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    """
+    Yields all test cases in a test suite.
+
+    :param suite: The test suite.
+    """
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from flatten(test)
+        else:
+            yield test
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def discover(pattern: str) -> List[List[str]]:
+    """
+    Returns the IDs of all test cases grouped by their class.
+
+    :param pattern: The pattern of the names of the test modules.
+    """
+    suite = unittest.TestLoader().discover(str(root / 'test'), pattern=pattern, top_level_dir=str(root))
+    groups: Dict[str, List[str]] = {}
+    for test in flatten(suite):
+        groups.setdefault(test.id().rpartition('.')[0], []).append(test.id())
+
+    return list(groups.values())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def run(ids: List[str]) -> Dict[str, Any]:
+    """
+    Runs test cases in the current process and returns the outcome.
+
+    :param ids: The IDs of the test cases.
+    """
+    os.chdir(root)
+    result = unittest.TestResult()
+    unittest.TestLoader().loadTestsFromNames(ids).run(result)
+
+    return {'run':      result.testsRun,
+            'failures': [(test.id(), trace) for test, trace in result.failures + result.unexpectedSuccesses],
+            'errors':   [(test.id(), trace) for test, trace in result.errors],
+            'skipped':  len(result.skipped)}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    """
+    Runs all test cases and returns the exit status.
+    """
+    parser = argparse.ArgumentParser(description='Runs all test cases in parallel.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='the number of processes')
+    parser.add_argument('pattern', nargs='?', default='*Test.py', help='the pattern of the names of the test modules')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    groups = discover(args.pattern)
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        outcomes = list(executor.map(run, groups))
+
+    count = sum(outcome['run'] for outcome in outcomes)
+    skipped = sum(outcome['skipped'] for outcome in outcomes)
+    problems = 0
+    for outcome in outcomes:
+        for kind in ('failures', 'errors'):
+            for test_id, trace in outcome[kind]:
+                problems += 1
+                print('=' * 70)
+                print(f'{"FAIL" if kind == "failures" else "ERROR"}: {test_id}')
+                print('-' * 70)
+                print(trace)
+
+    print('-' * 70)
+    print(f'Ran {count} tests in {time.perf_counter() - start:.3f}s using {args.jobs} processes')
+    print()
+    if problems:
+        print(f'FAILED (problems={problems}, skipped={skipped})')
+        return 1
+
+    print(f'OK (skipped={skipped})' if skipped else 'OK')
+
+    return 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    sys.exit(main())
+
+# ----------------------------------------------------------------------------------------------------------------------